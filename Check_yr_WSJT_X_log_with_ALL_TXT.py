@@ -1,3 +1,4 @@
+# -*- coding: latin-1 -*-
 """
 LICENSE
 ==========
@@ -20,14 +21,58 @@ Hauptskript
 
 
 # IMPORTS
-from sub_compress_data import filter_lines_with_callsign
-from sub_lines_viewer import LinesViewer
+# Die Startzeit wird gemessen, weil das Skript im Batch-Betrieb (cron)
+# fuer hunderte Dateien einzeln aufgerufen wird. tkinter und der Viewer
+# werden erst geladen, wenn das Fenster wirklich gebraucht wird.
+import time
+_T_START = time.perf_counter()
+
+import argparse
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+from sub_adif_log import QSO_SOURCES, AdifIndex, compare_with_log
+from sub_archive_input import is_archive_input
+from sub_compress_data import ENGINES, LineNavigator, filter_lines_with_callsign
+from sub_export import FORMATS, export_lines
+from sub_incremental_filter import filter_lines_incremental
+from sub_multi_callsign import filter_lines_with_callsigns, output_names
+from sub_result_cache import cache_key, filter_lines_cached, load_cached_result, store_result
+from sub_stats import STATS, RunCapture
+from sub_time_range import parse_time_bound
+
+STATS.add_time("startup.imports", time.perf_counter() - _T_START)
 
 
 # Variablen fuer Rufzeichen und Dateipfade
+# (Standardwerte, auf der Kommandozeile ueberschreibbar, siehe --help)
 own_callsign = "HB9EVT"
 input_file = "Excerpt_from_ALL-TXT.txt"
 output_file = "filtered_lines.txt"
+adif_file = "wsjtx_log.adi"     # WSJT-X-Log fuer den Abgleich (optional)
+
+# Lese-Variante: "mmap" springt direkt zu den Treffern (schnell bei grossen
+# Dateien), "lines" liest die Datei klassisch zeilenweise.
+engine = "mmap"
+
+
+# Anzahl Prozesse fuer das Filtern (1 = seriell, 0 = alle CPU-Kerne)
+workers = 1
+
+# Inkrementell: nur die seit dem letzten Lauf an die Input-Datei angehaengten
+# Zeilen durchsuchen (Checkpoint neben der Output-Datei; liest immer per
+# mmap, engine, workers und use_cache werden dann nicht verwendet)
+incremental = False
+
+# Im Hintergrund filtern: das Fenster erscheint sofort und fuellt sich,
+# waehrend die Datei noch gelesen wird (liest per mmap in einem Thread;
+# mit --engine, --workers oder --incremental wird vorher gefiltert)
+background = True
+
+# Ergebnis-Cache (Verzeichnis .filter_cache): wird dieselbe Input-Datei
+# erneut geoeffnet, entfaellt das Filtern. False = Cache umgehen.
+use_cache = True
 
 
 # Durch Aufruf der Funktion werden
@@ -35,24 +80,329 @@ output_file = "filtered_lines.txt"
 # -- das Ergebnis in die Output-Datei geschrieben
 # -- und zustzlich in einem Navigator-Objekt gespeichert,
 #    das ein kuenftiges zeilenweises Auslesen ermoeglicht.
+#
+# Der Schutz durch __main__ ist noetig, weil die Worker-Prozesse
+# dieses Skript unter Windows erneut importieren.
+
+def print_log_comparison(navigator, callsign: str, adif_path: str, source: str = "rr73") -> None:
+    """Abgleich mit dem WSJT-X-Log, falls vorhanden."""
+    if Path(adif_path).exists():
+        report = compare_with_log(navigator, callsign, AdifIndex.from_file(adif_path), source=source)
+        print(report.summary())
+
+
+def single_plain_file(inputs: List[str]) -> bool:
+    """True bei genau einer unkomprimierten Input-Datei (mmap, Checkpoint und Hintergrund moeglich)."""
+    return len(inputs) == 1 and not is_archive_input(inputs[0])
+
+
+def output_for(callsign: str, args: argparse.Namespace) -> Path:
+    """Output-Datei; bei mehreren Rufzeichen mit dem Rufzeichen im Namen."""
+    output = Path(args.output)
+    if len(args.callsigns) == 1:
+        return output
+    names = output_names(args.callsigns, output.stem + "_{callsign}" + output.suffix)
+    return output.with_name(names[callsign])
+
+
+def time_bound_arg(value: str) -> str:
+    """Typ fuer --from/--to: Zeitangabe pruefen, als Text weitergeben."""
+    try:
+        parse_time_bound(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc))
+    return value
+
+
+def time_range_of(args: argparse.Namespace):
+    """(start, end) aus --from/--to oder None ohne Zeitraum."""
+    if args.start is None and args.end is None:
+        return None
+    return args.start, args.end
+
+
+def filter_all(args: argparse.Namespace) -> Dict[str, LineNavigator]:
+    """Filtert fuer alle Rufzeichen; Rueckgabe: Rufzeichen -> LineNavigator."""
+    inputs = args.inputs
+    input_path = inputs[0] if len(inputs) == 1 else inputs
+    time_range = time_range_of(args)
+
+    if time_range is not None or args.merge:
+        # Zeitraum (Binaersuche) oder Zusammenfuehren mehrerer Stationen:
+        # kein Checkpoint und kein gemeinsamer Durchlauf
+        return {
+            callsign: filter_lines_with_callsign(
+                callsign,
+                input_path,
+                output_for(callsign, args),
+                time_range=time_range,
+                merge=args.merge,
+            )
+            for callsign in args.callsigns
+        }
+
+    if len(args.callsigns) > 1 and single_plain_file(inputs) and not args.incremental:
+        # Ein einziger Durchlauf fuer alle Rufzeichen
+        output = Path(args.output)
+        return filter_lines_with_callsigns(
+            args.callsigns,
+            input_path,
+            output.parent,
+            output.stem + "_{callsign}" + output.suffix,
+        )
+
+    navigators = {}
+    for callsign in args.callsigns:
+        if args.incremental:
+            navigators[callsign] = filter_lines_incremental(
+                callsign,
+                input_path,
+                output_for(callsign, args),
+            )
+        else:
+            navigators[callsign] = filter_lines_cached(
+                callsign,
+                input_path,
+                output_for(callsign, args),
+                use_cache=args.cache,
+                engine=args.engine,
+                workers=args.workers,
+            )
+    return navigators
+
+
+def finish(navigator, callsign: str, args: argparse.Namespace) -> None:
+    """Export im gewaehlten Format und Abgleich mit dem WSJT-X-Log."""
+    output = output_for(callsign, args)
+    if args.format != "txt":
+        output = output.with_suffix("." + args.format)
+        with STATS.timer("export"):
+            export_lines(navigator, output, callsign, args.format)
+    print(f"{callsign}: {len(navigator)} Zeilen -> {output}")
+    print_log_comparison(navigator, callsign, args.adif, args.qso_source)
+
+
+def run_batch(args: argparse.Namespace) -> None:
+    """Ohne Fenster filtern und exportieren (--no-gui), z.B. aus cron."""
+    for callsign, navigator in filter_all(args).items():
+        # Lazy-Navigatoren (--engine bytes) halten die Output-Datei offen
+        with navigator:
+            finish(navigator, callsign, args)
+
+
+def run_background(args: argparse.Namespace) -> None:
+    """Viewer sofort anzeigen, gefiltert wird im Hintergrund (oder aus dem Cache)."""
+    from sub_background_filter import BackgroundFilter, follow_in_viewer
+    from sub_lines_viewer import LinesViewer
+
+    callsign = args.callsigns[0]
+    input_file = args.inputs[0]
+    output_file = output_for(callsign, args)
+
+    key = cache_key(callsign, input_file) if args.cache else None
+    cached = load_cached_result(callsign, input_file, output_file, key=key) if key else None
+
+    if cached is not None:
+        finish(cached, callsign, args)
+        viewer = LinesViewer(cached, callsign)
+        viewer.set_status("Aus dem Cache geladen")
+        viewer.run()
+        print(f"Filtering completed. Check '{output_file}' for results.")
+        return
+
+    finishers: List[threading.Thread] = []
+
+    def on_done(navigator) -> None:
+        # Cache, Export und Log-Abgleich in einem eigenen Thread, damit das
+        # Fenster bedienbar bleibt; der Navigator waechst danach nicht mehr
+        def work() -> None:
+            if key:
+                store_result(navigator, callsign, input_file, key)
+            finish(navigator, callsign, args)
+
+        finisher = threading.Thread(target=work)
+        finisher.start()
+        finishers.append(finisher)
+
+    navigator = LineNavigator([], own_callsign=callsign)
+    viewer = LinesViewer(navigator, callsign)
+    background_filter = BackgroundFilter(callsign, input_file, output_file)
+    follow_in_viewer(viewer, background_filter, on_done=on_done)
+    viewer.run()
+    # Fenster geschlossen: Thread anhalten und abwarten, damit er nicht
+    # mitten im Schreiben der Output-Datei beendet wird
+    background_filter.stop()
+    background_filter.join()
+    for finisher in finishers:
+        finisher.join()
+
+    # Bestaetigungsnachricht
+    if background_filter.completed:
+        print(f"Filtering completed. Check '{output_file}' for results.")
+    elif background_filter.error is not None:
+        print(f"Filtering failed: {background_filter.error}. '{output_file}' is incomplete.")
+    else:
+        print(f"Filtering cancelled. '{output_file}' is incomplete.")
+
+
+def run_follow(args: argparse.Namespace) -> None:
+    """Viewer bleibt offen und zeigt neue Zeilen, sobald WSJT-X sie schreibt (--follow)."""
+    from sub_lines_viewer import LinesViewer
+    from sub_live_tail import LiveTail, follow_live
+
+    callsign = args.callsigns[0]
+    output_file = output_for(callsign, args)
+
+    navigator = LineNavigator([], own_callsign=callsign)
+    viewer = LinesViewer(navigator, callsign)
+    live_tail = LiveTail(callsign, args.inputs[0], output_file)
+    follow_live(viewer, live_tail)
+    viewer.run()
+    live_tail.stop()
+    live_tail.join()
+    print(f"Following stopped. Check '{output_file}' for results.")
+
+
+def run_foreground(args: argparse.Namespace) -> None:
+    """Erst filtern, dann den Viewer anzeigen (bei mehreren Rufzeichen fuer das erste)."""
+    navigators = filter_all(args)
+    for callsign, navigator in navigators.items():
+        finish(navigator, callsign, args)
+
+    from sub_lines_viewer import LinesViewer
+
+    callsign = args.callsigns[0]
+    viewer = LinesViewer(navigators[callsign], callsign)
+    viewer.run()
+    for navigator in navigators.values():
+        navigator.close()
+
+
+    # Beispielnutzung:
+    # print("Erste Zeile:", navigator.first())
+    # print("Naechste Zeile:", navigator.next_forward())
+    # print("Letzte Zeile:", navigator.last())
+    # print("Vorherige Zeile:", navigator.next_backward())
+    # print("3. Zeile:", navigator.at(2))
+
+    # Bestaetigungsnachricht
+    print(f"Filtering completed. Check '{output_for(callsign, args)}' for results.")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="WSJT-X ALL.TXT filtern und anzeigen.")
+    parser.add_argument("-c", "--callsign", dest="callsigns", nargs="+", default=[own_callsign],
+                        metavar="RUFZEICHEN",
+                        help="eigene(s) Rufzeichen; bei mehreren eine Output-Datei pro Rufzeichen")
+    parser.add_argument("-i", "--input", dest="inputs", nargs="+", default=[input_file],
+                        metavar="DATEI",
+                        help="ALL.TXT-Dateien, Globs oder Archive (.gz, .xz, .bz2, .zst)")
+    parser.add_argument("-o", "--output", default=output_file, metavar="DATEI",
+                        help="Output-Datei mit den gefilterten Zeilen")
+    parser.add_argument("-f", "--format", choices=FORMATS, default="txt",
+                        help="zusaetzliches Export-Format (Datei mit passender Endung)")
+    parser.add_argument("--adif", default=adif_file, metavar="DATEI",
+                        help="WSJT-X-Log fuer den Abgleich (wird ignoriert, falls nicht vorhanden)")
+    parser.add_argument("--qso-source", choices=QSO_SOURCES, default="rr73",
+                        help="QSOs fuer den Abgleich: RR73-Zeilen oder abgeschlossene Sitzungen"
+                             " (sub_qso_sessions)")
+    parser.add_argument("--from", dest="start", type=time_bound_arg, metavar="YYMMDD[_HHMMSS]",
+                        help="nur Zeilen ab diesem Zeitpunkt (UTC); sucht den Abschnitt per Binaersuche")
+    parser.add_argument("--to", dest="end", type=time_bound_arg, metavar="YYMMDD[_HHMMSS]",
+                        help="nur Zeilen vor diesem Zeitpunkt (exklusive)")
+    parser.add_argument("--merge", action="store_true",
+                        help="Eingaben mehrerer gleichzeitig laufender Stationen zusammenfuehren,"
+                             " doppelte Dekodierungen nur einmal")
+    parser.add_argument("--engine", choices=ENGINES,
+                        help=f"Lese-Variante (Standard: {engine})")
+    parser.add_argument("--workers", type=int,
+                        help=f"Anzahl Prozesse (0 = alle CPU-Kerne, Standard: {workers})")
+    parser.add_argument("--incremental", action=argparse.BooleanOptionalAction, default=incremental,
+                        help="nur die seit dem letzten Lauf angehaengten Zeilen durchsuchen"
+                             " (nur mit einer unkomprimierten Input-Datei)")
+    parser.add_argument("--cache", action=argparse.BooleanOptionalAction,
+                        help="Ergebnis-Cache in .filter_cache verwenden")
+    parser.add_argument("--background", action=argparse.BooleanOptionalAction,
+                        help="im Hintergrund filtern, das Fenster erscheint sofort"
+                             " (Standard, ausser mit --engine, --workers oder --incremental)")
+    parser.add_argument("--follow", action="store_true",
+                        help="ALL.TXT waehrend des Betriebs verfolgen (ein Rufzeichen, eine Datei)")
+    parser.add_argument("--gui", action=argparse.BooleanOptionalAction, default=True,
+                        help="Viewer anzeigen; --no-gui filtert nur (Batch-Betrieb, ohne tkinter)")
+    parser.add_argument("--stats", action="store_true",
+                        help="Zaehler und Zeiten (inkl. Startzeit) am Ende ausgeben")
+    parser.add_argument("--stats-json", metavar="DATEI",
+                        help="Zaehler und Zeiten als JSON speichern ('-' = Ausgabe)")
+    parser.add_argument("--profile", metavar="DATEI",
+                        help="cProfile-Mitschnitt des ganzen Laufs speichern")
+    parser.add_argument("--tracemalloc", action="store_true",
+                        help="Speicher-Allokationen mit tracemalloc verfolgen")
+    args = parser.parse_args()
+    check_flags(parser, args)
+    return args
+
+
+def check_flags(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """
+    Weist Optionen zurueck, die der gewaehlte Lesepfad nicht verwenden
+    wuerde, und setzt danach die Standardwerte der nicht angegebenen.
+    """
+    read_options = [
+        option
+        for option, value in (("--engine", args.engine), ("--workers", args.workers), ("--cache", args.cache))
+        if value is not None
+    ]
+    if args.incremental:
+        # Der Checkpoint gilt fuer genau eine Datei (keine Globs, Listen, Archive)
+        if not (single_plain_file(args.inputs) and Path(args.inputs[0]).is_file()):
+            parser.error("--incremental braucht genau eine vorhandene, unkomprimierte Input-Datei")
+        if read_options:
+            parser.error(f"--incremental liest per Checkpoint und verwendet {', '.join(read_options)} nicht")
+        if time_range_of(args) is not None or args.merge:
+            parser.error("--incremental laesst sich nicht mit --from/--to oder --merge kombinieren")
+
+    # Der Hintergrund-Thread liest immer per mmap und ohne Checkpoint
+    background_conflicts = [
+        option
+        for option, given in (
+            ("--engine", args.engine is not None),
+            ("--workers", args.workers is not None),
+            ("--incremental", args.incremental),
+        )
+        if given
+    ]
+    if args.background and background_conflicts:
+        parser.error(f"--background verwendet {', '.join(background_conflicts)} nicht")
+    if args.background is None:
+        args.background = background and not background_conflicts
 
-navigator = filter_lines_with_callsign(
-    own_callsign,
-    input_file,
-    output_file,
-)
+    args.engine = engine if args.engine is None else args.engine
+    args.workers = workers if args.workers is None else args.workers
+    args.cache = use_cache if args.cache is None else args.cache
 
 
-viewer = LinesViewer(navigator, own_callsign)
-viewer.run()
+if __name__ == "__main__":
 
+    args = parse_args()
+    STATS.enabled = args.stats or args.stats_json is not None
 
-# Beispielnutzung:
-# print("Erste Zeile:", navigator.first())
-# print("Naechste Zeile:", navigator.next_forward())
-# print("Letzte Zeile:", navigator.last())
-# print("Vorherige Zeile:", navigator.next_backward())
-# print("3. Zeile:", navigator.at(2))
+    with RunCapture(args.profile, args.tracemalloc) as capture:
+        if not args.gui:
+            run_batch(args)
+        elif args.follow and single_plain_file(args.inputs):
+            run_follow(args)
+        elif (args.background and len(args.callsigns) == 1 and single_plain_file(args.inputs)
+              and time_range_of(args) is None and not args.merge):
+            run_background(args)
+        else:
+            run_foreground(args)
+    STATS.add_time("run.total", time.perf_counter() - _T_START)
 
-# Bestaetigungsnachricht
-print("Filtering completed. Check 'filtered_lines.txt' for results.")
\ No newline at end of file
+    if args.stats:
+        print(STATS.summary())
+    if args.profile or args.tracemalloc:
+        print(capture.summary())
+    if args.stats_json == "-":
+        print(STATS.to_json())
+    elif args.stats_json:
+        Path(args.stats_json).write_text(STATS.to_json(), encoding="utf-8")
@@ -0,0 +1,316 @@
+"""
+LICENSE
+==========
+This file is part of the project <Check_yr_WSJT_X_log_with_ALL_TXT>
+Licensed under the MIT License - see the LICENSE file for details.
+
+Developed by Pepe HB9EVT
+with support from my lovely auntie A.I. Perplexity, 2025
+
+I would appreciate a short email if you use this software:
+github2025  -at-  pepemail.ch
+"""
+
+"""
+adif_log.py
+===========
+Import des WSJT-X-Logs (wsjtx_log.adi) und Abgleich mit den QSOs aus ALL.TXT.
+
+-- Das ADIF-Log wird blockweise gelesen (Streaming), daraus entsteht ein
+   Hash-Index (Rufzeichen, Band) -> sortierte QSO-Zeiten.
+-- Jede RR73-Zeile eines eigenen QSOs (siehe LineNavigator.iter_qsos)
+   wird in einem Durchlauf gegen diesen Index geprueft; mit
+   source="sessions" stattdessen jedes abgeschlossene QSO aus der
+   Sitzungs-Rekonstruktion (sub_qso_sessions, Zeitpunkt = QSO-Ende).
+-- Ergebnis: fehlende, doppelt geloggte und zeitlich abweichende QSOs.
+"""
+
+
+# IMPORTS
+import calendar
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from sub_compress_data import LineNavigator
+from sub_line_records import band_from_frequency, parse_line
+from sub_qso_sessions import STATE_COMPLETE, reconstruct_qsos
+
+
+# KONSTANTEN
+READ_CHUNK = 1 << 16            # Zeichen pro Leseblock im ADIF-Log
+MATCH_WINDOW = 15 * 60          # Sekunden: Log-Eintrag passt zum QSO in ALL.TXT
+MISMATCH_WINDOW = 24 * 3600     # Sekunden: ausserhalb davon gilt das QSO als fehlend
+QSO_MERGE_WINDOW = 5 * 60       # Sekunden: wiederholte RR73-Zeilen desselben QSOs
+QSO_SOURCES = ("rr73", "sessions")
+
+
+class LogEntry(NamedTuple):
+    record_no: int
+    callsign: str
+    band: str
+    timestamp: int      # Sekunden seit 1970 (UTC), TIME_OFF falls vorhanden
+
+
+class AllTxtQso(NamedTuple):
+    line_index: int     # 0-basierte Zeile im Navigator
+    callsign: str
+    band: str
+    timestamp: int
+
+
+class QsoMatch(NamedTuple):
+    qso: AllTxtQso
+    log_entries: List[LogEntry]
+
+
+class ComparisonReport(NamedTuple):
+    matched: List[QsoMatch]         # genau ein passender Log-Eintrag
+    duplicates: List[QsoMatch]      # mehrere passende Log-Eintraege
+    time_mismatches: List[QsoMatch] # nur Log-Eintraege ausserhalb MATCH_WINDOW
+    missing: List[AllTxtQso]        # kein Log-Eintrag fuer Rufzeichen und Band
+
+    def summary(self) -> str:
+        lines = [
+            f"QSOs in ALL.TXT:   {len(self.matched) + len(self.duplicates) + len(self.time_mismatches) + len(self.missing)}",
+            f"  im Log gefunden: {len(self.matched)}",
+            f"  doppelt geloggt: {len(self.duplicates)}",
+            f"  Zeit weicht ab:  {len(self.time_mismatches)}",
+            f"  fehlen im Log:   {len(self.missing)}",
+        ]
+        for qso in self.missing:
+            lines.append(f"FEHLT  {qso.callsign:<12} {qso.band:<6} Zeile {qso.line_index + 1}")
+        for match in self.time_mismatches:
+            qso = match.qso
+            lines.append(f"ZEIT   {qso.callsign:<12} {qso.band:<6} Zeile {qso.line_index + 1}")
+        for match in self.duplicates:
+            qso = match.qso
+            lines.append(
+                f"DOPPELT {qso.callsign:<11} {qso.band:<6} Zeile {qso.line_index + 1} "
+                f"({len(match.log_entries)} Log-Eintraege)"
+            )
+        return "\n".join(lines)
+
+
+# ------------------------------------------------------------------
+# ADIF lesen
+# ------------------------------------------------------------------
+
+def iter_adif_records(path: str | Path) -> Iterator[Dict[str, str]]:
+    """
+    Liest ein ADIF-Log blockweise und liefert jeden Datensatz als
+    Dictionary (Feldnamen in Grossbuchstaben). Der Header bis <EOH>
+    wird uebersprungen.
+    """
+    with Path(path).open("r", encoding="utf-8", errors="replace") as f:
+        buf = ""
+        pos = 0
+        eof = False
+        record: Dict[str, str] = {}
+
+        while True:
+            lt = buf.find("<", pos)
+            gt = buf.find(">", lt) if lt >= 0 else -1
+            if gt < 0:
+                # Tag unvollstaendig oder Block zu Ende: nachladen
+                if eof:
+                    break
+                keep = buf[lt:] if lt >= 0 else ""
+                chunk = f.read(READ_CHUNK)
+                eof = not chunk
+                buf = keep + chunk
+                pos = 0
+                continue
+
+            parts = buf[lt + 1:gt].split(":")
+            name = parts[0].strip().upper()
+
+            if name == "EOH":
+                record = {}
+                pos = gt + 1
+                continue
+            if name == "EOR":
+                if record:
+                    yield record
+                record = {}
+                pos = gt + 1
+                continue
+
+            length_text = parts[1].strip() if len(parts) > 1 else "0"
+            length = int(length_text) if length_text.isdigit() else 0
+            value_end = gt + 1 + length
+            if value_end > len(buf) and not eof:
+                # Wert reicht ueber das Blockende hinaus
+                chunk = f.read(READ_CHUNK)
+                eof = not chunk
+                buf = buf[lt:] + chunk
+                pos = 0
+                continue
+
+            record[name] = buf[gt + 1:value_end]
+            pos = value_end
+
+        if record:
+            yield record
+
+
+def _adif_timestamp(date: str, time: str) -> Optional[int]:
+    """QSO_DATE (YYYYMMDD) und TIME_ON/TIME_OFF (HHMM[SS]) -> Sekunden seit 1970."""
+    date = date.strip()
+    time = time.strip()
+    if len(date) != 8 or len(time) not in (4, 6) or not (date + time).isdigit():
+        return None
+    seconds = int(time[4:6]) if len(time) == 6 else 0
+    try:
+        return calendar.timegm(
+            (int(date[0:4]), int(date[4:6]), int(date[6:8]),
+             int(time[0:2]), int(time[2:4]), seconds)
+        )
+    except ValueError:
+        return None
+
+
+def log_entry_from_record(record_no: int, record: Dict[str, str]) -> Optional[LogEntry]:
+    callsign = record.get("CALL", "").strip().upper()
+    if not callsign:
+        return None
+
+    band = record.get("BAND", "").strip().lower()
+    if not band:
+        try:
+            band = band_from_frequency(float(record.get("FREQ", ""))) or ""
+        except ValueError:
+            band = ""
+
+    timestamp = None
+    if "TIME_OFF" in record:
+        timestamp = _adif_timestamp(record.get("QSO_DATE_OFF", record.get("QSO_DATE", "")), record["TIME_OFF"])
+    if timestamp is None:
+        timestamp = _adif_timestamp(record.get("QSO_DATE", ""), record.get("TIME_ON", ""))
+    if timestamp is None:
+        return None
+
+    return LogEntry(record_no, callsign, band, timestamp)
+
+
+# KLASSE AdifIndex
+class AdifIndex:
+    """Hash-Index (Rufzeichen, Band) -> nach Zeit sortierte Log-Eintraege."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[Tuple[str, str], List[LogEntry]] = {}
+        self._times: Dict[Tuple[str, str], List[int]] = {}
+        self.record_count = 0
+        self.skipped = 0
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "AdifIndex":
+        index = cls()
+        for record_no, record in enumerate(iter_adif_records(path)):
+            index.record_count += 1
+            entry = log_entry_from_record(record_no, record)
+            if entry is None:
+                index.skipped += 1
+                continue
+            index._entries.setdefault((entry.callsign, entry.band), []).append(entry)
+
+        # WSJT-X schreibt chronologisch; sortiert wird nur, wo noetig
+        for key, entries in index._entries.items():
+            times = [e.timestamp for e in entries]
+            if any(a > b for a, b in zip(times, times[1:])):
+                entries.sort(key=lambda e: e.timestamp)
+                times.sort()
+            index._times[key] = times
+        return index
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self._entries.values())
+
+    def entries_near(
+        self, callsign: str, band: str, timestamp: int, window: int
+    ) -> List[LogEntry]:
+        """Log-Eintraege fuer Rufzeichen und Band innerhalb +-window Sekunden."""
+        key = (callsign.upper(), band)
+        times = self._times.get(key)
+        if not times:
+            return []
+        lo = bisect_left(times, timestamp - window)
+        hi = bisect_right(times, timestamp + window)
+        return self._entries[key][lo:hi]
+# Ende der Klasse AdifIndex -----------------------------
+
+
+# ------------------------------------------------------------------
+# Abgleich mit ALL.TXT
+# ------------------------------------------------------------------
+
+def iter_rr73_qsos(navigator: LineNavigator, own_callsign: str) -> Iterator[AllTxtQso]:
+    """
+    QSOs aus den RR73-Zeilen des Navigators. Wiederholte RR73-Zeilen mit
+    gleichem Rufzeichen und Band innerhalb QSO_MERGE_WINDOW zaehlen als
+    ein QSO (erste Zeile).
+    """
+    last_seen: Dict[Tuple[str, str], int] = {}
+    for line_index, other in navigator.iter_qsos(own_callsign):
+        parsed = parse_line(navigator.window(line_index, 1)[0])
+        if parsed is None:
+            continue
+        timestamp, frequency = parsed[0], parsed[1]
+        band = band_from_frequency(frequency) or ""
+        key = (other.upper(), band)
+
+        previous = last_seen.get(key)
+        last_seen[key] = timestamp
+        if previous is not None and timestamp - previous <= QSO_MERGE_WINDOW:
+            continue
+        yield AllTxtQso(line_index, other.upper(), band, timestamp)
+
+
+def iter_session_qsos(navigator: LineNavigator, own_callsign: str) -> Iterator[AllTxtQso]:
+    """
+    Abgeschlossene QSOs aus reconstruct_qsos (Rapporte ausgetauscht und
+    bestaetigt); Zeile und Zeitpunkt der letzten Nachricht, wie TIME_OFF.
+    """
+    for record in reconstruct_qsos(navigator, own_callsign):
+        if record.state == STATE_COMPLETE:
+            yield AllTxtQso(record.last_line, record.partner, record.band, record.end)
+
+
+def compare_with_log(
+    navigator: LineNavigator,
+    own_callsign: str,
+    adif_index: AdifIndex,
+    match_window: int = MATCH_WINDOW,
+    mismatch_window: int = MISMATCH_WINDOW,
+    source: str = "rr73",
+) -> ComparisonReport:
+    """
+    Vergleicht die QSOs aus ALL.TXT in einem Durchlauf mit dem Log;
+    source waehlt die QSOs (siehe QSO_SOURCES).
+    """
+    if source not in QSO_SOURCES:
+        raise ValueError(f"Unbekannte QSO-Quelle {source!r}, erlaubt: {', '.join(QSO_SOURCES)}")
+    qsos = iter_session_qsos if source == "sessions" else iter_rr73_qsos
+    report = ComparisonReport([], [], [], [])
+    for qso in qsos(navigator, own_callsign):
+        entries = adif_index.entries_near(qso.callsign, qso.band, qso.timestamp, match_window)
+        if len(entries) == 1:
+            report.matched.append(QsoMatch(qso, entries))
+        elif entries:
+            report.duplicates.append(QsoMatch(qso, entries))
+        else:
+            near = adif_index.entries_near(qso.callsign, qso.band, qso.timestamp, mismatch_window)
+            if near:
+                report.time_mismatches.append(QsoMatch(qso, near))
+            else:
+                report.missing.append(qso)
+    return report
+
+
+# Beispiel
+if __name__ == "__main__":
+    from sub_lazy_navigator import LazyLineNavigator
+
+    adif_index = AdifIndex.from_file("wsjtx_log.adi")
+    with LazyLineNavigator.from_file("filtered_lines.txt", own_callsign="HB9EVT") as navigator:
+        print(compare_with_log(navigator, "HB9EVT", adif_index).summary())
@@ -0,0 +1,245 @@
+"""
+LICENSE
+==========
+This file is part of the project <Check_yr_WSJT_X_log_with_ALL_TXT>
+Licensed under the MIT License - see the LICENSE file for details.
+
+Developed by Pepe HB9EVT
+with support from my lovely auntie A.I. Perplexity, 2025
+
+I would appreciate a short email if you use this software:
+github2025  -at-  pepemail.ch
+"""
+
+"""
+archive_input.py
+================
+Eingabe aus mehreren und komprimierten ALL.TXT-Dateien:
+
+-- Listen von Pfaden und Globs (z.B. "archiv/ALL_*.txt.gz"),
+   chronologisch sortiert nach dem ersten Zeitstempel jeder Datei,
+-- gzip (.gz), xz (.xz), bzip2 (.bz2) und zstd (.zst, benoetigt das
+   optionale Paket zstandard), erkannt an den ersten Bytes der Datei,
+-- entpackt wird beim Lesen in einem eigenen Thread, ohne temporaere
+   Dateien; das Durchsuchen laeuft gleichzeitig im aufrufenden Thread.
+
+Die CQ-Paarung laeuft ueber die Dateigrenzen hinweg weiter, das Ergebnis
+entspricht also dem Filtern der aneinandergehaengten Dateien (jede Datei
+endet dabei mit einem Zeilenende).
+"""
+
+
+# IMPORTS
+import bz2
+import glob
+import gzip
+import lzma
+import queue
+import re
+import threading
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+from sub_compress_data import CqPairing, _scan_mapped
+from sub_stats import STATS
+
+try:
+    import zstandard
+except ImportError:     # optional, nur fuer .zst-Archive noetig
+    zstandard = None
+
+
+# KONSTANTEN
+READ_BLOCK = 4 * 1024 * 1024    # Entpackte Bytes pro Block
+QUEUE_BLOCKS = 8                # Bloecke, die der Lese-Thread vorausliest
+PEEK_BYTES = 64 * 1024          # Gelesene Bytes fuer den ersten Zeitstempel
+
+MAGIC_GZIP = b"\x1f\x8b"
+MAGIC_XZ = b"\xfd7zXZ\x00"
+MAGIC_BZIP2 = b"BZh"
+MAGIC_ZSTD = b"\x28\xb5\x2f\xfd"
+
+_TIMESTAMP = re.compile(rb"^(\d{6}_\d{6})", re.MULTILINE)
+_GLOB_CHARS = "*?["
+
+
+def detect_compression(path: str | Path) -> Optional[str]:
+    """Liefert "gzip", "xz", "bzip2", "zstd" oder None (unkomprimiert)."""
+    with Path(path).open("rb") as f:
+        head = f.read(6)
+    if head.startswith(MAGIC_GZIP):
+        return "gzip"
+    if head.startswith(MAGIC_XZ):
+        return "xz"
+    if head.startswith(MAGIC_BZIP2):
+        return "bzip2"
+    if head.startswith(MAGIC_ZSTD):
+        return "zstd"
+    return None
+
+
+def open_input(path: str | Path) -> BinaryIO:
+    """Oeffnet eine Datei binaer und entpackt sie beim Lesen, falls noetig."""
+    compression = detect_compression(path)
+    if compression == "gzip":
+        return gzip.open(path, "rb")
+    if compression == "xz":
+        return lzma.open(path, "rb")
+    if compression == "bzip2":
+        return bz2.open(path, "rb")
+    if compression == "zstd":
+        if zstandard is None:
+            raise ImportError(f"Fuer {path} wird das Paket zstandard benoetigt (pip install zstandard)")
+        return zstandard.ZstdDecompressor().stream_reader(Path(path).open("rb"), closefd=True)
+    return Path(path).open("rb")
+
+
+def is_archive_input(input_path) -> bool:
+    """
+    True, wenn input_path nicht als einzelne unkomprimierte Datei gelesen
+    werden kann (Liste, Glob oder komprimierte Datei).
+    """
+    if not isinstance(input_path, (str, Path)):
+        return True
+    path = Path(input_path)
+    if not path.exists():
+        return any(c in str(input_path) for c in _GLOB_CHARS)
+    return path.is_file() and detect_compression(path) is not None
+
+
+def _first_timestamp(path: Path) -> Optional[bytes]:
+    """Erster Zeitstempel YYMMDD_HHMMSS in der (entpackten) Datei oder None."""
+    try:
+        with open_input(path) as f:
+            match = _TIMESTAMP.search(f.read(PEEK_BYTES))
+    except (OSError, EOFError, lzma.LZMAError):
+        return None
+    return match.group(1) if match else None
+
+
+def expand_inputs(inputs) -> List[Path]:
+    """
+    Loest Pfade und Globs auf und sortiert die Dateien chronologisch nach
+    ihrem ersten Zeitstempel (Dateien ohne Zeitstempel nach Aenderungszeit
+    am Ende). Jede Datei kommt nur einmal vor.
+    """
+    if isinstance(inputs, (str, Path)):
+        inputs = [inputs]
+
+    paths: List[Path] = []
+    for entry in inputs:
+        entry_text = str(entry)
+        if not Path(entry_text).exists() and any(c in entry_text for c in _GLOB_CHARS):
+            paths.extend(Path(p) for p in sorted(glob.glob(entry_text)))
+        else:
+            paths.append(Path(entry_text))
+
+    unique = list(dict.fromkeys(p.resolve() for p in paths))
+    if not unique:
+        raise FileNotFoundError(f"Keine Eingabedatei gefunden: {inputs}")
+
+    def sort_key(path: Path) -> Tuple[bool, bytes, float]:
+        timestamp = _first_timestamp(path)
+        return (timestamp is None, timestamp or b"", path.stat().st_mtime)
+
+    return sorted(unique, key=sort_key)
+
+
+def iter_input_blocks(
+    paths: List[Path],
+    block_bytes: int = READ_BLOCK,
+) -> Iterator[Tuple[int, bytes]]:
+    """
+    Liefert (Dateinummer, Block) fuer alle Dateien nacheinander; ein leerer
+    Block markiert das Ende einer Datei. Gelesen und entpackt wird in einem
+    Thread, der bis zu QUEUE_BLOCKS Bloecke vorausliest.
+    """
+    blocks: "queue.Queue" = queue.Queue(maxsize=QUEUE_BLOCKS)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        # Nicht ewig warten, falls der Verbraucher abgebrochen hat
+        while not stop.is_set():
+            try:
+                blocks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def reader() -> None:
+        try:
+            for file_no, path in enumerate(paths):
+                with open_input(path) as f:
+                    while True:
+                        block = f.read(block_bytes)
+                        if not put((file_no, block)):
+                            return
+                        if not block:
+                            break
+            put(None)
+        except BaseException as exc:    # im Verbraucher erneut ausloesen
+            put(exc)
+
+    thread = threading.Thread(target=reader, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = blocks.get()
+            if item is None:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+
+
+def scan_inputs(
+    inputs,
+    callsign: str,
+    pairing: CqPairing,
+    result_lines: List[str],
+    block_bytes: int = READ_BLOCK,
+) -> None:
+    """
+    Durchsucht alle Eingabedateien wie engine="mmap" (bytes.find von
+    Treffer zu Treffer) und gibt die Treffer an die CQ-Paarung, die ueber
+    die Dateigrenzen hinweg bestehen bleibt.
+    """
+    paths = expand_inputs(inputs)
+    STATS.add("input_files", len(paths))
+    carry = b""
+    for file_no, block in iter_input_blocks(paths, block_bytes):
+        STATS.add("bytes_read", len(block))
+        if STATS.enabled:
+            STATS.add("lines_scanned", block.count(b"\n"))
+        if not block:
+            # Dateiende: angefangene letzte Zeile gilt als eigene Zeile und
+            # erhaelt ein Zeilenende, wenn noch eine Datei folgt
+            if carry:
+                if file_no < len(paths) - 1:
+                    carry += b"\n"
+                _scan_mapped(carry, callsign, pairing, result_lines)
+            carry = b""
+            continue
+
+        data = carry + block if carry else block
+        end = data.rfind(b"\n") + 1
+        if end == 0:
+            carry = data
+            continue
+        _scan_mapped(data, callsign, pairing, result_lines, 0, end)
+        carry = data[end:]
+
+
+# Beispielaufruf
+if __name__ == "__main__":
+    from sub_compress_data import filter_lines_with_callsign
+
+    navigator = filter_lines_with_callsign(
+        "HB9EVT",
+        ["archiv/ALL_*.txt.gz", "archiv/ALL_*.txt.xz", "ALL.TXT"],
+        "filtered_lines.txt",
+    )
+    print("Anzahl Ergebniszeilen:", len(navigator))
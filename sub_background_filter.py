@@ -0,0 +1,224 @@
+"""
+LICENSE
+==========
+This file is part of the project <Check_yr_WSJT_X_log_with_ALL_TXT>
+Licensed under the MIT License - see the LICENSE file for details.
+
+Developed by Pepe HB9EVT
+with support from my lovely auntie A.I. Perplexity, 2025
+
+I would appreciate a short email if you use this software:
+github2025  -at-  pepemail.ch
+"""
+
+"""
+background_filter.py
+====================
+Filtert ALL.TXT in einem Hintergrund-Thread, waehrend der LinesViewer
+schon angezeigt wird. Der Thread liest die Datei blockweise (mmap-Suche
+wie engine="mmap"), schreibt die Ergebniszeilen laufend in die
+Output-Datei und legt sie als Pakete in eine Queue. Die Tk-Hauptschleife
+holt die Pakete per after() ab und haengt sie an den Navigator an.
+
+
+Aufruf im Hauptprogramm:
+========================
+
+navigator = LineNavigator([], own_callsign=own_callsign)
+background = BackgroundFilter(own_callsign, input_file, output_file)
+viewer = LinesViewer(navigator, own_callsign)
+follow_in_viewer(viewer, background)
+viewer.run()
+background.stop()
+background.join()
+"""
+
+
+# IMPORTS
+import mmap
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from sub_compress_data import CqPairing, LineNavigator, _count_lines, _scan_mapped
+from sub_stats import STATS
+
+
+# KONSTANTEN
+BLOCK_BYTES = 4 * 1024 * 1024   # Pro Block gelesene Bytes (ein Paket pro Block)
+POLL_MS = 50                    # Abstand, in dem der Viewer die Queue abfragt
+
+
+# KLASSE BackgroundFilter
+class BackgroundFilter:
+    """
+    Filtert input_path im Hintergrund. Output-Datei und Zeilen sind am
+    Ende identisch zu filter_lines_with_callsign.
+    """
+
+    def __init__(
+        self,
+        callsign: str,
+        input_path: str | Path,
+        output_path: str | Path,
+        block_bytes: int = BLOCK_BYTES,
+    ) -> None:
+        self.callsign = callsign
+        self.input_path = Path(input_path)
+        self.output_path = Path(output_path)
+        self.block_bytes = block_bytes
+
+        self.total_bytes = self.input_path.stat().st_size
+        self.bytes_scanned = 0
+        self.done = False
+        # Nur wenn die ganze Datei gefiltert wurde (nicht abgebrochen, kein
+        # Fehler); nach join() auch ausserhalb des Tk-Threads gueltig
+        self.completed = False
+        self.error: Optional[BaseException] = None
+
+        # Pakete: (neue Zeilen, bisher gelesene Bytes, fertig)
+        self._queue: "queue.Queue[Tuple[List[str], int, bool]]" = queue.Queue()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._started = False
+
+    def start(self) -> "BackgroundFilter":
+        if not self._started:
+            self._started = True
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Bricht das Filtern ab; die Output-Datei bleibt dann unvollstaendig."""
+        self._stop.set()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        pairing = CqPairing(self.callsign)
+        scan_start = time.perf_counter()
+        bytes_read = 0
+        lines_scanned = 0
+        lines_output = 0
+        try:
+            with self.input_path.open("rb") as f, self.output_path.open("w", encoding="utf-8") as out:
+                # Leere Dateien lassen sich nicht abbilden
+                if self.total_bytes > 0:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                        size = len(data)
+                        start = 0
+                        while start < size and not self._stop.is_set():
+                            # Bloecke enden auf Zeilengrenzen
+                            newline = data.find(b"\n", start + self.block_bytes)
+                            end = size if newline < 0 else newline + 1
+
+                            new_lines: List[str] = []
+                            _scan_mapped(data, self.callsign, pairing, new_lines, start, end)
+                            if STATS.enabled:
+                                lines_scanned += _count_lines(data, start, end)
+                            out.writelines(new_lines)
+                            lines_output += len(new_lines)
+                            self._queue.put((new_lines, end, False))
+                            bytes_read = end
+                            start = end
+
+                tail: List[str] = []
+                if not self._stop.is_set():
+                    pairing.flush(tail)
+                    out.writelines(tail)
+                    lines_output += len(tail)
+                    self.completed = True
+        except BaseException as exc:    # Fehler an die Tk-Seite weitergeben
+            self.error = exc
+            tail = []
+
+        # Zaehler erst am Ende und in einem Schritt (der Tk-Thread misst
+        # derweil seine eigenen Zeiten)
+        STATS.add_time("filter.scan", time.perf_counter() - scan_start)
+        STATS.add("bytes_read", bytes_read)
+        STATS.add("lines_scanned", lines_scanned)
+        STATS.add("lines_matched", pairing.lines_matched)
+        STATS.add("cq_lines_held", pairing.cq_held)
+        STATS.add("cq_lines_flushed", pairing.cq_flushed)
+        STATS.add("lines_output", lines_output)
+        self._queue.put((tail, self.total_bytes, True))
+
+    def poll(self) -> List[str]:
+        """
+        Holt ohne zu warten alle bereitliegenden Pakete ab und liefert
+        deren Zeilen; aktualisiert bytes_scanned und done.
+        """
+        lines: List[str] = []
+        while True:
+            try:
+                new_lines, scanned, finished = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            lines.extend(new_lines)
+            self.bytes_scanned = scanned
+            if finished:
+                self.done = True
+        return lines
+
+    def progress_text(self) -> str:
+        mib = 1024 * 1024
+        if self.error is not None:
+            return f"Fehler beim Filtern: {self.error}"
+        if self.done:
+            return f"Gefiltert: {self.total_bytes / mib:.1f} MiB"
+        percent = 100.0 * self.bytes_scanned / self.total_bytes if self.total_bytes else 100.0
+        return (
+            f"Filtern: {self.bytes_scanned / mib:.1f} / {self.total_bytes / mib:.1f} MiB"
+            f" ({percent:.0f} %)"
+        )
+# Ende der Klasse BackgroundFilter -----------------------------
+
+
+def follow_in_viewer(
+    viewer,
+    background: BackgroundFilter,
+    on_done: Optional[Callable[[LineNavigator], None]] = None,
+    poll_ms: int = POLL_MS,
+) -> None:
+    """
+    Startet den Hintergrund-Thread (falls noch nicht geschehen) und fragt
+    die Queue per viewer.root.after() ab. Neue Zeilen werden an
+    viewer.navigator angehaengt, der Fortschritt in der Statuszeile
+    angezeigt. on_done wird nach dem letzten Paket mit dem Navigator
+    aufgerufen.
+    """
+    background.start()
+
+    def poll() -> None:
+        lines = background.poll()
+        if lines:
+            first_new_index = len(viewer.navigator)
+            viewer.navigator.extend(lines)
+            viewer.on_lines_appended(first_new_index)
+        viewer.set_status(background.progress_text())
+
+        if background.done:
+            if on_done is not None and background.error is None:
+                on_done(viewer.navigator)
+            return
+        viewer.root.after(poll_ms, poll)
+
+    viewer.root.after(poll_ms, poll)
+# ENDE Funktion follow_in_viewer ------------
+
+
+# Beispielaufruf
+if __name__ == "__main__":
+    from sub_lines_viewer import LinesViewer
+
+    navigator = LineNavigator([], own_callsign="HB9EVT")
+    background = BackgroundFilter("HB9EVT", "Excerpt_from_ALL-TXT.txt", "filtered_lines.txt")
+    viewer = LinesViewer(navigator, "HB9EVT")
+    follow_in_viewer(viewer, background)
+    viewer.run()
+    background.stop()
+    background.join()
+    print("Fertig" if background.completed else "Abgebrochen")
@@ -0,0 +1,270 @@
+"""
+LICENSE
+==========
+This file is part of the project <Check_yr_WSJT_X_log_with_ALL_TXT>
+Licensed under the MIT License - see the LICENSE file for details.
+
+Developed by Pepe HB9EVT
+with support from my lovely auntie A.I. Perplexity, 2025
+
+I would appreciate a short email if you use this software:
+github2025  -at-  pepemail.ch
+"""
+
+"""
+benchmark.py
+============
+Benchmarks auf synthetischen ALL.TXT-Dateien (siehe sub_synthetic_all_txt):
+
+-- filter_lines_with_callsign je engine: Zeilen/s, MB/s, Spitzenspeicher,
+-- Aufbau von LineNavigator, LazyLineNavigator und LineRecords,
+-- LinesViewer ohne sichtbares Fenster: RR73-Spruenge, Zaehler, Shift +-1.
+
+Die Ergebnisse werden als JSON gespeichert; mit --compare wird eine
+fruehere Ergebnisdatei gegenuebergestellt (z.B. vom letzten Commit).
+
+
+Aufruf:
+=======
+
+python sub_benchmark.py --lines 100000 1000000 --output bench.json
+python sub_benchmark.py --lines 100000 --compare bench_alt.json
+"""
+
+
+# IMPORTS
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from sub_compress_data import ENGINES, LineNavigator, filter_lines_with_callsign
+from sub_lazy_navigator import LazyLineNavigator
+from sub_line_records import LineRecords
+from sub_synthetic_all_txt import OWN_CALLSIGN, generate_all_txt
+
+
+# KONSTANTEN
+BENCH_DIR = "bench_data"            # Ablage der erzeugten Eingabedateien
+DEFAULT_LINES = [10_000, 100_000, 1_000_000]
+REPEAT = 3                          # Wiederholungen, gemeldet wird das Minimum
+VIEWER_ACTIONS = 200                # Aktionen pro Viewer-Messung
+
+
+def _best_of(action: Callable[[], object], repeat: int = REPEAT) -> float:
+    """Kleinste Laufzeit in Sekunden aus repeat Durchlaeufen."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _peak_memory(action: Callable[[], object]) -> int:
+    """Spitzenwert der Python-Allokationen in Bytes (tracemalloc)."""
+    tracemalloc.start()
+    try:
+        action()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def input_file(lines: int, bench_dir: str | Path = BENCH_DIR, seed: int = 1) -> Path:
+    """Synthetische Eingabedatei mit `lines` Zeilen (wird nur einmal erzeugt)."""
+    bench_dir = Path(bench_dir)
+    bench_dir.mkdir(parents=True, exist_ok=True)
+    path = bench_dir / f"ALL_{lines}_{seed}.TXT"
+    if not path.exists():
+        tmp_path = path.with_name(path.name + ".tmp")
+        generate_all_txt(tmp_path, lines, seed)
+        tmp_path.replace(path)
+    return path
+
+
+# ------------------------------------------------------------------
+# Einzelne Messungen
+# ------------------------------------------------------------------
+
+def bench_filter(path: Path, lines: int, output_path: Path) -> Dict[str, dict]:
+    size = path.stat().st_size
+    results = {}
+    for engine in ENGINES:
+        def run() -> None:
+            filter_lines_with_callsign(OWN_CALLSIGN, path, output_path, engine=engine)
+
+        seconds = _best_of(run)
+        results[engine] = {
+            "seconds": seconds,
+            "lines_per_s": lines / seconds,
+            "mb_per_s": size / 1e6 / seconds,
+            "peak_bytes": _peak_memory(run),
+        }
+    return results
+
+
+def bench_navigators(output_path: Path) -> Dict[str, dict]:
+    with output_path.open("r", encoding="utf-8", errors="replace") as f:
+        lines = f.readlines()
+
+    return {
+        "line_navigator": {
+            "seconds": _best_of(lambda: LineNavigator(list(lines), own_callsign=OWN_CALLSIGN)),
+        },
+        "lazy_navigator": {
+            "seconds": _best_of(lambda: LazyLineNavigator.from_file(output_path, OWN_CALLSIGN).close()),
+        },
+        "line_records": {
+            "seconds": _best_of(lambda: LineRecords.from_lines(lines)),
+            "nbytes": LineRecords.from_lines(lines).nbytes(),
+        },
+        "result_lines": len(lines),
+    }
+
+
+def _action_stats(viewer, action: Callable[[], None], count: int) -> dict:
+    samples: List[float] = []
+    for _ in range(count):
+        t0 = time.perf_counter()
+        action()
+        viewer.root.update_idletasks()
+        samples.append(time.perf_counter() - t0)
+    samples.sort()
+    return {
+        "median_ms": samples[len(samples) // 2] * 1000.0,
+        "max_ms": samples[-1] * 1000.0,
+    }
+
+
+def bench_viewer(output_path: Path) -> dict:
+    """
+    Misst den LinesViewer mit verstecktem Fenster. Ohne Display (z.B. auf
+    einem Server ohne X) wird die Messung uebersprungen.
+    """
+    try:
+        import tkinter as tk
+        from sub_lines_viewer import LinesViewer
+    except ImportError as exc:
+        return {"skipped": str(exc)}
+
+    with output_path.open("r", encoding="utf-8", errors="replace") as f:
+        navigator = LineNavigator(f.readlines(), own_callsign=OWN_CALLSIGN)
+
+    try:
+        viewer = LinesViewer(navigator, OWN_CALLSIGN)
+    except tk.TclError as exc:
+        return {"skipped": str(exc)}
+    viewer.root.withdraw()
+
+    def next_rr73() -> None:
+        # Am Ende wieder von vorne beginnen, damit jede Aktion springt
+        start = viewer.current_start_index
+        viewer.jump_next_rr73()
+        if viewer.current_start_index == start:
+            viewer.show_first_20()
+
+    def prev_rr73() -> None:
+        start = viewer.current_start_index
+        viewer.jump_prev_rr73()
+        if viewer.current_start_index == start:
+            viewer.show_last_20()
+
+    try:
+        results = {}
+        viewer.show_first_20()
+        results["next_rr73"] = _action_stats(viewer, next_rr73, VIEWER_ACTIONS)
+        results["prev_rr73"] = _action_stats(viewer, prev_rr73, VIEWER_ACTIONS)
+        results["shift_plus_one"] = _action_stats(viewer, viewer.shift_plus_one, VIEWER_ACTIONS)
+        results["shift_minus_one"] = _action_stats(viewer, viewer.shift_minus_one, VIEWER_ACTIONS)
+        results["arrow_labels"] = _action_stats(viewer, viewer.update_arrow_labels, VIEWER_ACTIONS)
+        return results
+    finally:
+        viewer.root.destroy()
+
+
+# Funktion fuer den gesamten Benchmark
+def run_benchmarks(
+    line_counts: List[int],
+    bench_dir: str | Path = BENCH_DIR,
+    with_viewer: bool = True,
+) -> dict:
+    """Fuehrt alle Messungen fuer jede Dateigroesse aus; Rueckgabe als JSON-faehiges dict."""
+    report = {
+        "commit": _git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "sizes": {},
+    }
+    for lines in line_counts:
+        path = input_file(lines, bench_dir)
+        output_path = Path(bench_dir) / f"filtered_{lines}.txt"
+        entry = {
+            "input_bytes": path.stat().st_size,
+            "filter": bench_filter(path, lines, output_path),
+            "navigators": bench_navigators(output_path),
+        }
+        if with_viewer:
+            entry["viewer"] = bench_viewer(output_path)
+        report["sizes"][str(lines)] = entry
+    return report
+
+
+def _flatten(data: dict, prefix: str = "") -> Dict[str, float]:
+    flat: Dict[str, float] = {}
+    for key, value in data.items():
+        name = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(_flatten(value, name))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = float(value)
+    return flat
+
+
+def compare_reports(old: dict, new: dict) -> List[str]:
+    """Gegenueberstellung aller gemeinsamen Messwerte mit relativer Aenderung."""
+    old_flat = _flatten(old.get("sizes", {}))
+    new_flat = _flatten(new.get("sizes", {}))
+    lines = [f"{'Messwert':<60} {'alt':>12} {'neu':>12} {'Aenderung':>10}"]
+    for name in sorted(old_flat.keys() & new_flat.keys()):
+        before, after = old_flat[name], new_flat[name]
+        change = (after - before) / before * 100.0 if before else 0.0
+        lines.append(f"{name:<60} {before:12.4g} {after:12.4g} {change:+9.1f}%")
+    return lines
+
+
+# Aufruf von der Kommandozeile
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks auf synthetischen ALL.TXT-Dateien.")
+    parser.add_argument("--lines", type=int, nargs="+", default=DEFAULT_LINES,
+                        help="Dateigroessen in Zeilen")
+    parser.add_argument("--bench-dir", default=BENCH_DIR)
+    parser.add_argument("--output", default="bench_results.json", help="JSON-Ergebnisdatei")
+    parser.add_argument("--compare", help="fruehere JSON-Ergebnisdatei zum Vergleich")
+    parser.add_argument("--no-viewer", action="store_true", help="Viewer-Messungen auslassen")
+    args = parser.parse_args()
+
+    report = run_benchmarks(args.lines, args.bench_dir, with_viewer=not args.no_viewer)
+    Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"Ergebnisse in {args.output}")
+
+    if args.compare:
+        old = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        print("\n".join(compare_reports(old, report)))
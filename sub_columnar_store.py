@@ -0,0 +1,303 @@
+"""
+LICENSE
+==========
+This file is part of the project <Check_yr_WSJT_X_log_with_ALL_TXT>
+Licensed under the MIT License - see the LICENSE file for details.
+
+Developed by Pepe HB9EVT
+with support from my lovely auntie A.I. Perplexity, 2025
+
+I would appreciate a short email if you use this software:
+github2025  -at-  pepemail.ch
+"""
+
+"""
+columnar_store.py
+=================
+Spaltenweise Binaerdatei (.col) der gefilterten Zeilen, damit andere
+Programme die Felder nicht erneut aus dem Text parsen muessen.
+
+Aufbau der Datei:
+-- MAGIC (8 Bytes), Laenge des Kopfes (uint32, little endian),
+-- Kopf als JSON: Zeilenzahl, eigenes Rufzeichen, Byte-Reihenfolge und
+   pro Spalte Typcode (wie array/struct), Offset und Anzahl Elemente,
+-- die Spalten, jeweils auf 8 Bytes ausgerichtet.
+
+Spalten (Zeile i belegt ueberall den Index i):
+timestamp (q, Sekunden seit 1970), frequency (d, MHz), direction (b),
+mode (H, Index in mode_table), snr (h), dt (f), df (i),
+partner (I, Index in callsign_table, NO_PARTNER = keine Gegenstation),
+line_offsets (Q, Zeilenzahl + 1) und message_starts (I) in den Text
+aller Zeilen (text, UTF-8), rr73 (Q, RR73-Zeilen eigener QSOs),
+mode_table und callsign_table (UTF-8, durch "\\n" getrennt).
+
+Mit NumPy laesst sich jede Spalte direkt abbilden:
+numpy.frombuffer(buffer, dtype=typecode, count=count, offset=data_start + offset)
+
+Beim Laden wird die Datei nur per mmap abgebildet; Zeilen werden erst
+beim Zugriff dekodiert, die Zahlenspalten sind memoryviews ohne Kopie.
+"""
+
+
+# IMPORTS
+import json
+import mmap
+import re
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from sub_compress_data import LineNavigator, build_rr73_index
+from sub_export import partner_callsign
+from sub_line_records import DIR_RX, DIR_UNKNOWN, LineRecords, StringTable, format_timestamp
+
+
+# KONSTANTEN
+COLUMNAR_VERSION = 1
+COLUMNAR_SUFFIX = ".col"
+MAGIC = b"WSJTCOL1"
+PREFIX = struct.Struct("<8sI")      # Magic, Laenge des JSON-Kopfes
+ALIGN = 8
+NO_PARTNER = 0xFFFFFFFF
+
+# Beginn der Nachricht: nach Zeitstempel, Frequenz, Rx/Tx, Mode, SNR, DT, DF
+_MESSAGE_START = re.compile(r"\s*(?:\S+\s+){7}")
+
+
+def _aligned(n: int) -> int:
+    return (n + ALIGN - 1) // ALIGN * ALIGN
+
+
+def _string_blob(strings: List[str]) -> array:
+    return array("B", "\n".join(strings).encode("utf-8"))
+
+
+# Funktion zum Schreiben der Spaltendatei
+def export_columnar(
+    lines: Iterable[str],
+    output_path: str | Path,
+    own_callsign: str,
+    records: Optional[LineRecords] = None,
+) -> int:
+    """
+    Schreibt die Zeilen spaltenweise nach output_path; Rueckgabe: Anzahl
+    Zeilen. Bereits vorhandene records (with_records=True) werden
+    uebernommen statt die Zeilen erneut zu parsen.
+    """
+    lines = list(lines)
+    if records is None or len(records) != len(lines):
+        records = LineRecords.from_lines(lines)
+
+    callsigns = StringTable()
+    partners = array("I")
+    line_offsets = array("Q", [0])
+    message_starts = array("I")
+    encoded: List[bytes] = []
+    pos = 0
+
+    for i, line in enumerate(lines):
+        data = line.encode("utf-8")
+        encoded.append(data)
+        pos += len(data)
+        line_offsets.append(pos)
+
+        if records.directions[i] == DIR_UNKNOWN:
+            message_starts.append(0)
+            partners.append(NO_PARTNER)
+            continue
+        match = _MESSAGE_START.match(line)
+        start = match.end() if match else len(line)
+        message_starts.append(start if line.isascii() else len(line[:start].encode("utf-8")))
+        partner = partner_callsign(records.message_tokens(i), own_callsign)
+        partners.append(NO_PARTNER if partner is None else callsigns.intern(partner))
+
+    columns: Dict[str, array] = {
+        "timestamp": records.timestamps,
+        "frequency": records.frequencies,
+        "direction": records.directions,
+        "mode": records.modes,
+        "snr": records.snrs,
+        "dt": records.dts,
+        "df": records.dfs,
+        "partner": partners,
+        "line_offsets": line_offsets,
+        "message_starts": message_starts,
+        "rr73": array("Q", build_rr73_index(lines, own_callsign)),
+        "mode_table": _string_blob(records.mode_names.strings()),
+        "callsign_table": _string_blob(callsigns.strings()),
+        "text": array("B", b"".join(encoded)),
+    }
+
+    layout = {}
+    offset = 0
+    for name, column in columns.items():
+        layout[name] = {"typecode": column.typecode, "offset": offset, "count": len(column)}
+        offset = _aligned(offset + len(column) * column.itemsize)
+    header = json.dumps({
+        "version": COLUMNAR_VERSION,
+        "rows": len(lines),
+        "own_callsign": own_callsign,
+        "byteorder": sys.byteorder,
+        "columns": layout,
+    }).encode("utf-8")
+
+    data_start = _aligned(PREFIX.size + len(header))
+    output_path = Path(output_path)
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    with tmp_path.open("wb") as f:
+        f.write(PREFIX.pack(MAGIC, len(header)))
+        f.write(header)
+        f.write(b"\0" * (data_start - PREFIX.size - len(header)))
+        for name, column in columns.items():
+            data = column.tobytes()
+            f.write(data)
+            f.write(b"\0" * (_aligned(len(data)) - len(data)))
+    tmp_path.replace(output_path)
+    return len(lines)
+# ENDE Funktion export_columnar ------------
+
+
+# KLASSE ColumnarLines
+class ColumnarLines:
+    """Unveraenderliche Liste der Zeilen; dekodiert wird erst beim Zugriff."""
+
+    def __init__(self, text: memoryview, line_offsets: memoryview) -> None:
+        self._text = text
+        self._offsets = line_offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def _line(self, i: int) -> str:
+        return str(self._text[self._offsets[i]:self._offsets[i + 1]], "utf-8")
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self._line(i) for i in range(*key.indices(len(self)))]
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("Zeilenindex ausserhalb des Bereichs")
+        return self._line(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return (self._line(i) for i in range(len(self)))
+# Ende der Klasse ColumnarLines -----------------------------
+
+
+# KLASSE ColumnarNavigator
+class ColumnarNavigator(LineNavigator):
+    """
+    LineNavigator ueber einer per mmap abgebildeten .col-Datei. Die
+    Spalten stehen als memoryviews zur Verfuegung (z.B. navigator.snrs[i]),
+    der RR73-Index des gespeicherten Rufzeichens wird nicht neu berechnet.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._views: List[memoryview] = []
+        try:
+            self._open()
+        except Exception:
+            self.close()
+            raise
+
+    def _open(self) -> None:
+        view = memoryview(self._map)
+        self._views.append(view)
+        if len(view) < PREFIX.size:
+            raise ValueError(f"{self.path}: keine Spaltendatei")
+        magic, header_len = PREFIX.unpack_from(view)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path}: keine Spaltendatei")
+        header = json.loads(bytes(view[PREFIX.size:PREFIX.size + header_len]))
+        if header["version"] != COLUMNAR_VERSION:
+            raise ValueError(f"{self.path}: Version {header['version']} wird nicht unterstuetzt")
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError(f"{self.path}: andere Byte-Reihenfolge ({header['byteorder']})")
+
+        data_start = _aligned(PREFIX.size + header_len)
+        self.columns: Dict[str, memoryview] = {}
+        for name, spec in header["columns"].items():
+            itemsize = array(spec["typecode"]).itemsize
+            start = data_start + spec["offset"]
+            column = view[start:start + spec["count"] * itemsize].cast(spec["typecode"])
+            self._views.append(column)
+            self.columns[name] = column
+
+        self.own_callsign: str = header["own_callsign"]
+        self.timestamps = self.columns["timestamp"]
+        self.frequencies = self.columns["frequency"]
+        self.directions = self.columns["direction"]
+        self.modes = self.columns["mode"]
+        self.snrs = self.columns["snr"]
+        self.dts = self.columns["dt"]
+        self.dfs = self.columns["df"]
+        self.partners = self.columns["partner"]
+        self.mode_names = str(self.columns["mode_table"], "utf-8").split("\n")
+        table = str(self.columns["callsign_table"], "utf-8")
+        self.partner_names = table.split("\n") if table else []
+
+        super().__init__(ColumnarLines(self.columns["text"], self.columns["line_offsets"]))
+        self._rr73_callsign = self.own_callsign
+        self._rr73_indices = self.columns["rr73"]
+
+    def partner(self, i: int) -> Optional[str]:
+        sid = self.partners[i]
+        return None if sid == NO_PARTNER else self.partner_names[sid]
+
+    def message(self, i: int) -> str:
+        offsets = self.columns["line_offsets"]
+        start = offsets[i] + self.columns["message_starts"][i]
+        return str(self.columns["text"][start:offsets[i + 1]], "utf-8").rstrip("\r\n")
+
+    def fields(self, i: int) -> dict:
+        """Felder von Zeile i wie sub_export.line_fields, aber ohne Parsen."""
+        if self.directions[i] == DIR_UNKNOWN:
+            return {
+                "time": None, "frequency": None, "direction": None, "mode": None,
+                "snr": None, "dt": None, "df": None,
+                "message": self.message(i), "partner": None,
+            }
+        return {
+            "time": format_timestamp(self.timestamps[i]),
+            "frequency": self.frequencies[i],
+            "direction": "Rx" if self.directions[i] == DIR_RX else "Tx",
+            "mode": self.mode_names[self.modes[i]],
+            "snr": self.snrs[i],
+            "dt": round(self.dts[i], 1),    # float32, in ALL.TXT mit einer Stelle
+            "df": self.dfs[i],
+            "message": self.message(i),
+            "partner": self.partner(i),
+        }
+
+    def close(self) -> None:
+        # Erst alle memoryviews freigeben, sonst laesst sich mmap nicht schliessen
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        self._map.close()
+# Ende der Klasse ColumnarNavigator -----------------------------
+
+
+def load_columnar(path: str | Path) -> ColumnarNavigator:
+    """Bildet eine mit export_columnar geschriebene Datei als Navigator ab."""
+    return ColumnarNavigator(path)
+
+
+# Beispielaufruf
+if __name__ == "__main__":
+    from sub_compress_data import filter_lines_with_callsign
+
+    navigator = filter_lines_with_callsign("HB9EVT", "Excerpt_from_ALL-TXT.txt", "filtered_lines.txt")
+    export_columnar(navigator, "filtered_lines.col", "HB9EVT", navigator.records)
+
+    columnar = load_columnar("filtered_lines.col")
+    print("Anzahl Zeilen:", len(columnar))
+    print("Erste Zeile:", columnar.first())
+    print("Felder der ersten Zeile:", columnar.fields(0))
+    columnar.close()
@@ -19,15 +19,83 @@ Funktion zum Filtern von Zeilen mit einem spezifischen Rufzeichen
 
 
 # IMPORTS
+import io
+import mmap
+import os
+import re
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from sub_line_records import LineRecords
+from sub_stats import STATS
+from sub_time_range import TimeRangeFilter, find_time_slice, time_bounds
+
+
+# KONSTANTEN
+ENGINES = ("lines", "mmap", "bytes")    # Lese-Varianten fuer filter_lines_with_callsign
+COUNT_BLOCK = 16 * 1024 * 1024  # Blockgroesse fuer das Zaehlen der Zeilen mit --stats
+BYTES_BLOCK = 8 * 1024 * 1024   # Blockgroesse beim Lesen mit engine="bytes"
+DENSE_BYTES = 512               # Ab einem Treffer pro DENSE_BYTES: Block ganz in Zeilen teilen
+DENSE_SAMPLE = 256 * 1024       # Bytes am Blockanfang, an denen die Trefferdichte geschaetzt wird
+CHUNKS_PER_WORKER = 4           # Mehr Abschnitte als Prozesse gleichen Lastspitzen aus
+
+
+def extract_other_callsign_from_rr73_line(line: str, own_callsign: str) -> Optional[str]:
+    """
+    Erwartete Struktur am Ende:
+    ' ... <cs1> <cs2> RR73'
+    own_callsign ist eines von cs1 oder cs2.
+    Rueckgabe: das andere Rufzeichen oder None.
+    """
+    parts = line.strip().split()
+    if len(parts) < 3:
+        return None
+    if parts[-1] != "RR73":
+        return None
+    cs1 = parts[-3]
+    cs2 = parts[-2]
+
+    if cs1.upper() == own_callsign.upper():
+        return cs2
+    if cs2.upper() == own_callsign.upper():
+        return cs1
+    return None
+
+
+def build_rr73_index(lines: Iterable[str], own_callsign: str) -> List[int]:
+    """
+    Sortierte Indizes aller RR73-Zeilen, die zu einem eigenen QSO gehoeren,
+    d.h. die extract_other_callsign_from_rr73_line akzeptiert.
+    """
+    return [
+        i
+        for i, line in enumerate(lines)
+        if "RR73" in line and extract_other_callsign_from_rr73_line(line, own_callsign)
+    ]
 
 
 # Navigator-Klasse fuer zeilenweises Auslesen
 class LineNavigator:
-    def __init__(self, lines: List[str]) -> None:
+    def __init__(
+        self,
+        lines: List[str],
+        records: Optional[LineRecords] = None,
+        own_callsign: Optional[str] = None,
+    ) -> None:
         self._lines = lines
         self._index: Optional[int] = 0 if lines else None
+        # Optional: geparste Felder aller Zeilen (siehe sub_line_records);
+        # RR73- und Rufzeichen-Abfragen verwenden sie, falls vorhanden
+        self.records = records
+        # RR73-Index fuer das eigene Rufzeichen, falls bekannt
+        self._rr73_callsign: Optional[str] = None
+        self._rr73_indices: List[int] = []
+        if own_callsign is not None:
+            self.rr73_indices(own_callsign)
 
     def first(self) -> Optional[str]:
         if not self._lines:
@@ -68,52 +136,669 @@ class LineNavigator:
 
     def __len__(self) -> int:
         return len(self._lines)
+
+    def __iter__(self) -> Iterator[str]:
+        """Alle Zeilen der Reihe nach, ohne den Zeiger zu veraendern."""
+        return iter(self._lines)
+
+    def window(self, start: int, count: int) -> List[str]:
+        """
+        Die vorhandenen Zeilen mit Index start .. start+count-1 (0-basiert),
+        ohne den Zeiger zu veraendern. Bereiche ausserhalb der Liste
+        werden weggelassen, start darf negativ sein.
+        """
+        return list(self._lines[max(0, start):max(0, start + count)])
+
+    def extend(self, lines: List[str]) -> None:
+        """
+        Haengt weitere Zeilen an (z.B. waehrend im Hintergrund noch
+        gefiltert wird). Records und RR73-Index werden nur um die neuen
+        Zeilen ergaenzt, nicht neu aufgebaut.
+        """
+        first_new = len(self._lines)
+        self._lines.extend(lines)
+        if self.records is not None:
+            self.records.extend(lines)
+        if self._rr73_callsign is not None:
+            self._rr73_indices.extend(
+                first_new + i for i in build_rr73_index(lines, self._rr73_callsign)
+            )
+        if self._index is None and self._lines:
+            self._index = 0
+
+    def close(self) -> None:
+        """Gibt Dateien oder Verbindungen frei (Navigatoren ueber Dateien, Datenbanken)."""
+
+    def __enter__(self) -> "LineNavigator":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # RR73-Index: abgeschlossene eigene QSOs
+
+    def _parsed(self) -> Optional[LineRecords]:
+        """records, falls sie alle Zeilen abdecken, sonst None."""
+        if self.records is not None and len(self.records) == len(self._lines):
+            return self.records
+        return None
+
+    def rr73_indices(self, own_callsign: str) -> List[int]:
+        """
+        Sortierte Indizes der RR73-Zeilen eigener QSOs.
+        Wird pro Rufzeichen einmal aufgebaut und danach wiederverwendet;
+        mit records ueber die Token-IDs statt durch Zerlegen der Zeilen.
+        """
+        if self._rr73_callsign != own_callsign:
+            records = self._parsed()
+            if records is not None:
+                self._rr73_indices = records.rr73_indices(own_callsign)
+            else:
+                self._rr73_indices = build_rr73_index(self._lines, own_callsign)
+            self._rr73_callsign = own_callsign
+        return self._rr73_indices
+
+    def occurrence_index(self, callsign: str) -> Optional[List[int]]:
+        """
+        Sortierte Indizes der Zeilen, die callsign enthalten (wie
+        'callsign in line'), aus records; ohne records None, dann sucht
+        der Aufrufer selbst.
+        """
+        records = self._parsed()
+        if records is None:
+            return None
+        return records.indices_containing(callsign)
+
+    def other_callsign_at(self, i: int, own_callsign: str) -> Optional[str]:
+        """Das andere Rufzeichen der RR73-Zeile i oder None."""
+        records = self._parsed()
+        if records is not None:
+            return records.other_callsign(i, own_callsign)
+        return extract_other_callsign_from_rr73_line(self._lines[i], own_callsign)
+
+    def next_rr73_index(self, start_from: int, own_callsign: str) -> Optional[int]:
+        """Naechste RR73-Zeile nach start_from (exklusive) oder None."""
+        indices = self.rr73_indices(own_callsign)
+        pos = bisect_right(indices, start_from)
+        return indices[pos] if pos < len(indices) else None
+
+    def prev_rr73_index(self, start_from: int, own_callsign: str) -> Optional[int]:
+        """Vorherige RR73-Zeile vor start_from (exklusive) oder None."""
+        indices = self.rr73_indices(own_callsign)
+        pos = bisect_left(indices, start_from)
+        return indices[pos - 1] if pos > 0 else None
+
+    def iter_qsos(self, own_callsign: str) -> Iterator[Tuple[int, str]]:
+        """Liefert (Zeilenindex, anderes Rufzeichen) fuer jede RR73-Zeile."""
+        for i in self.rr73_indices(own_callsign):
+            other = self.other_callsign_at(i, own_callsign)
+            if other is not None:
+                yield i, other
 # ENDE Navigator-Klasse ---------------------------
 
 
+# Zustandsautomat fuer die CQ-Paarung
+class CqPairing:
+    """
+    Haelt die zuletzt gelesene CQ-Zeile des eigenen Rufzeichens zurueck,
+    bis eine andere Zeile mit dem Rufzeichen folgt (dann werden beide
+    ausgegeben) oder eine neuere CQ-Zeile sie ersetzt.
+    """
+
+    def __init__(self, callsign: str) -> None:
+        self.cq_pattern = "CQ " + callsign  # Suchmuster fr CQ-Zeilen
+        self.last_cq_line: Optional[str] = None
+        self.last_was_cq = False
+        # Zaehler fuer sub_stats
+        self.lines_matched = 0
+        self.cq_held = 0
+        self.cq_flushed = 0
+
+    def feed(self, line: str, result_lines: List[str]) -> None:
+        """Verarbeitet eine Zeile, die das Rufzeichen bereits enthaelt."""
+        self.lines_matched += 1
+        if self.cq_pattern in line:
+            self.last_cq_line = line
+            self.last_was_cq = True
+            self.cq_held += 1
+        else:
+            if self.last_was_cq and self.last_cq_line is not None:
+                result_lines.append(self.last_cq_line)
+                self.last_cq_line = None
+                self.last_was_cq = False
+                self.cq_flushed += 1
+
+            result_lines.append(line)
+
+    def feed_many(self, lines: List[str], result_lines: List[str]) -> None:
+        """
+        Wie feed fuer jede Zeile nacheinander, aber ohne Python-Aufruf pro
+        Zeile: eine CQ-Zeile wird genau dann ausgegeben, wenn eine andere
+        Zeile folgt; eine CQ-Zeile am Ende bleibt zurueckgehalten.
+        """
+        if not lines:
+            return
+        pattern = self.cq_pattern
+        is_cq = [pattern in line for line in lines]
+        cq_count = sum(is_cq)
+        self.lines_matched += len(lines)
+        self.cq_held += cq_count
+
+        if not is_cq[0] and self.last_was_cq and self.last_cq_line is not None:
+            result_lines.append(self.last_cq_line)
+            self.cq_flushed += 1
+        kept = [
+            line
+            for line, cq, next_cq in zip(lines, is_cq, is_cq[1:] + [True])
+            if not cq or not next_cq
+        ]
+        self.cq_flushed += len(kept) - (len(lines) - cq_count)
+        result_lines.extend(kept)
+
+        if is_cq[-1]:
+            self.last_cq_line = lines[-1]
+            self.last_was_cq = True
+        else:
+            self.last_cq_line = None
+            self.last_was_cq = False
+
+    def flush(self, result_lines: List[str]) -> None:
+        """Gibt eine noch zurueckgehaltene CQ-Zeile am Dateiende aus."""
+        if self.last_was_cq and self.last_cq_line is not None:
+            result_lines.append(self.last_cq_line)
+            self.cq_flushed += 1
+        self.last_cq_line = None
+        self.last_was_cq = False
+
+    def merge_chunk(
+        self,
+        chunk_lines: List[str],
+        chunk_cq_line: Optional[str],
+        result_lines: List[str],
+    ) -> None:
+        """
+        Haengt das Ergebnis eines unabhaengig gefilterten Abschnitts an.
+        Der Abschnitt wurde ohne zurueckgehaltene CQ-Zeile begonnen und
+        chunk_cq_line ist seine am Ende noch offene CQ-Zeile (nicht geflusht).
+
+        -- Beginnt der Abschnitt mit einer Antwort, gehoert die hier noch
+           offene CQ-Zeile davor.
+        -- Beginnt er mit einer CQ-Zeile, ersetzt diese die offene CQ-Zeile.
+        -- Ohne Treffer bleibt der Zustand unveraendert.
+        """
+        if chunk_lines:
+            if self.cq_pattern not in chunk_lines[0]:
+                self.flush(result_lines)
+            result_lines.extend(chunk_lines)
+            self.last_cq_line = chunk_cq_line
+            self.last_was_cq = chunk_cq_line is not None
+        elif chunk_cq_line is not None:
+            self.last_cq_line = chunk_cq_line
+            self.last_was_cq = True
+# ENDE Klasse CqPairing ---------------------------
+
+
+class BytesCqPairing(CqPairing):
+    """
+    CqPairing fuer Zeilen als bytes (engine="bytes"). Das Rufzeichen ist
+    ASCII; ASCII-Bytes bleiben beim Dekodieren mit errors="replace"
+    immer erhalten, daher findet das Muster in den Rohbytes genau die
+    Zeilen, in denen es auch im dekodierten Text steht.
+    """
+
+    def __init__(self, callsign: str) -> None:
+        super().__init__(callsign)
+        self.cq_pattern = self.cq_pattern.encode("ascii")
+# ENDE Klasse BytesCqPairing ---------------------------
+
+
+def _decode_raw_line(raw: bytes) -> List[str]:
+    """
+    Dekodiert eine Rohzeile genau wie der Textmodus (UTF-8 mit
+    errors="replace", universelle Zeilenenden). Ein einzelnes "\r"
+    trennt dabei die Zeile, daher wird eine Liste geliefert.
+    """
+    line = raw.decode("utf-8", errors="replace")
+    if "\r" not in line:
+        return [line]
+
+    # Textmodus wandelt "\r\n" und einzelnes "\r" in "\n" um
+    return list(io.StringIO(line, newline=None))
+
+
+def _feed_raw_line(
+    raw: bytes,
+    callsign: str,
+    pairing: CqPairing,
+    result_lines: List[str],
+) -> None:
+    """Dekodiert eine Rohzeile und gibt die Treffer an die CQ-Paarung."""
+    for line in _decode_raw_line(raw):
+        if callsign in line:
+            pairing.feed(line, result_lines)
+
+
+def _feed_kept_bytes(
+    raw: bytes,
+    callsign: str,
+    pairing: BytesCqPairing,
+    result_lines: List[bytes],
+) -> None:
+    """
+    Wie _feed_raw_line, gibt die Zeilen aber als UTF-8-Bytes weiter, so
+    wie der Textmodus sie schreiben wuerde. Reine ASCII-Zeilen ohne "\r"
+    bleiben unveraendert, nur die uebrigen werden dekodiert.
+    """
+    if b"\r" not in raw:
+        if not raw.isascii():
+            raw = raw.decode("utf-8", errors="replace").encode("utf-8")
+        pairing.feed(raw, result_lines)
+        return
+    for line in _decode_raw_line(raw):
+        if callsign in line:
+            pairing.feed(line.encode("utf-8"), result_lines)
+
+
+def _kept_bytes(line: bytes) -> bytes:
+    """Eine mit bytes.splitlines abgetrennte Zeile, wie der Textmodus sie schreibt."""
+    if line.isascii() and b"\r" not in line:
+        return line
+    return _decode_raw_line(line)[0].encode("utf-8")
+
+
+def _scan_mapped(
+    data,
+    callsign: str,
+    pairing: CqPairing,
+    result_lines: List[str],
+    start: int = 0,
+    end: Optional[int] = None,
+    feed_raw_line=_feed_raw_line,
+) -> None:
+    """
+    Springt mit bytes.find von Treffer zu Treffer des Rufzeichens und
+    dekodiert nur die Zeilen, in denen es vorkommt.
+    start muss auf einem Zeilenanfang liegen.
+    feed_raw_line gibt die gefundenen Rohzeilen an die CQ-Paarung weiter
+    (_feed_kept_bytes fuer engine="bytes").
+    """
+    needle = callsign.encode("utf-8")
+    if end is None:
+        end = len(data)
+
+    pos = start
+    while pos < end:
+        hit = data.find(needle, pos, end)
+        if hit < 0 or hit >= end:
+            break
+
+        newline_before = data.rfind(b"\n", pos, hit)
+        line_start = pos if newline_before < 0 else newline_before + 1
+
+        newline_after = data.find(b"\n", hit, end)
+        line_end = end if newline_after < 0 else newline_after + 1
+
+        feed_raw_line(data[line_start:line_end], callsign, pairing, result_lines)
+        pos = line_end
+
+
+def _split_on_newlines(data, parts: int) -> List[tuple[int, int]]:
+    """Teilt data in etwa gleich grosse Byte-Bereiche an Zeilengrenzen."""
+    size = len(data)
+    bounds: List[tuple[int, int]] = []
+    start = 0
+    for i in range(1, parts + 1):
+        if i == parts:
+            end = size
+        else:
+            newline = data.find(b"\n", max(start, size * i // parts))
+            end = size if newline < 0 else newline + 1
+        if end > start:
+            bounds.append((start, end))
+            start = end
+        if start >= size:
+            break
+    return bounds
+
+
+def _count_lines(data, start: int = 0, end: Optional[int] = None) -> int:
+    """Anzahl Zeilenenden in data[start:end], blockweise (nur fuer --stats)."""
+    if end is None:
+        end = len(data)
+    return sum(
+        data[pos:min(pos + COUNT_BLOCK, end)].count(b"\n")
+        for pos in range(start, end, COUNT_BLOCK)
+    )
+
+
+def _filter_chunk(
+    args: tuple[str, str, int, int, bool],
+) -> tuple[List[str], Optional[str], tuple[int, int, int, int]]:
+    """
+    Prozess-Worker: filtert einen Byte-Bereich der Eingabedatei.
+    Liefert die Ergebniszeilen, die am Ende noch offene CQ-Zeile und die
+    Zaehler (Treffer, zurueckgehaltene und ausgegebene CQ-Zeilen, mit
+    count_lines auch die gelesenen Zeilen) fuer sub_stats.
+    """
+    path, callsign, start, end, count_lines = args
+    pairing = CqPairing(callsign)
+    chunk_lines: List[str] = []
+    lines_scanned = 0
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            _scan_mapped(data, callsign, pairing, chunk_lines, start, end)
+            if count_lines:
+                lines_scanned = _count_lines(data, start, end)
+    counters = (pairing.lines_matched, pairing.cq_held, pairing.cq_flushed, lines_scanned)
+    return chunk_lines, pairing.last_cq_line, counters
+
+
+def _filter_parallel(
+    callsign: str,
+    input_path: Path,
+    pairing: CqPairing,
+    result_lines: List[str],
+    workers: int,
+) -> None:
+    """
+    Verteilt die Datei auf einen Prozess-Pool und setzt die Abschnitte
+    in ihrer Reihenfolge wieder zusammen; die CQ-Paarung wird dabei
+    ueber die Abschnittsgrenzen weitergereicht.
+    """
+    if input_path.stat().st_size == 0:
+        return
+
+    with input_path.open("rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            bounds = _split_on_newlines(data, workers * CHUNKS_PER_WORKER)
+
+    jobs = [(str(input_path), callsign, start, end, STATS.enabled) for start, end in bounds]
+    # Erst hier importiert: kostet sonst bei jedem Programmstart Zeit
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk_lines, chunk_cq_line, counters in pool.map(_filter_chunk, jobs):
+            pairing.merge_chunk(chunk_lines, chunk_cq_line, result_lines)
+            # Zaehler der Prozesse; eine am Abschnittsende offene CQ-Zeile
+            # zaehlt erst beim Ausgeben (flush) in diesem Prozess
+            lines_matched, cq_held, cq_flushed, lines_scanned = counters
+            pairing.lines_matched += lines_matched
+            pairing.cq_held += cq_held
+            pairing.cq_flushed += cq_flushed
+            STATS.add("lines_scanned", lines_scanned)
+
+
+def _scan_time_range(
+    input_path: Path,
+    callsign: str,
+    feeder: TimeRangeFilter,
+    result_lines: List[str],
+) -> None:
+    """Sucht den Zeitraum per Binaersuche und liest nur diesen Abschnitt."""
+    if input_path.stat().st_size == 0:
+        return
+    with input_path.open("rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            with STATS.timer("filter.time_search"):
+                bounds = find_time_slice(data, feeder.start, feeder.end)
+            if bounds is None:
+                # Zu ungeordnet fuer die Binaersuche: ganze Datei lesen
+                STATS.add("time_range_fallbacks", 1)
+                bounds = (0, len(data))
+            start, end = bounds
+            _scan_mapped(data, callsign, feeder, result_lines, start, end)
+            STATS.add("bytes_read", end - start)
+
+
+def _filter_bytes(
+    callsign: str,
+    input_path: Path,
+    output_path: Path,
+    with_records: bool,
+) -> LineNavigator:
+    """
+    engine="bytes": liest die Datei in Bloecken von BYTES_BLOCK Bytes,
+    sucht das Rufzeichen in den Rohbytes und dekodiert hoechstens die
+    gefundenen Zeilen. Die Ergebniszeilen bleiben bytes und werden pro
+    Block mit einem einzigen write geschrieben; der Navigator liest sie
+    danach bei Bedarf aus der Output-Datei (LazyLineNavigator).
+    """
+    # Spaeter Import, da sub_lazy_navigator selbst LineNavigator importiert
+    from sub_lazy_navigator import LazyLineNavigator
+
+    needle = callsign.encode("ascii")
+    contains = re.compile(re.escape(needle)).search
+    pairing = BytesCqPairing(callsign)
+    linesep = os.linesep.encode("ascii")
+    extra = len(linesep) - 1    # Textmodus schreibt "\n" als os.linesep
+    starts = array("Q")
+    rr73_indices: List[int] = []
+    out_pos = 0
+    lines_scanned = 0
+
+    with input_path.open("rb") as f, output_path.open("wb") as out:
+        carry = b""
+        while True:
+            block = f.read(BYTES_BLOCK)
+            data = carry + block if carry else block
+            if block:
+                # Nur vollstaendige Zeilen, der Rest kommt zum naechsten Block
+                end = data.rfind(b"\n") + 1
+            else:
+                end = len(data)
+            if STATS.enabled:
+                lines_scanned += data.count(b"\n", 0, end)
+
+            kept: List[bytes] = []
+            sample = min(end, DENSE_SAMPLE)
+            if data.count(needle, 0, sample) * DENSE_BYTES > sample:
+                # Viele Treffer: Zeilen in C abtrennen und filtern statt von
+                # Treffer zu Treffer zu springen; bytes.splitlines trennt wie
+                # der Textmodus an "\n", "\r\n" und einzelnem "\r"
+                lines = list(filter(contains, data[:end].splitlines(True)))
+                joined = b"".join(lines)
+                if not joined.isascii() or b"\r" in joined:
+                    lines = [_kept_bytes(line) for line in lines]
+                pairing.feed_many(lines, kept)
+            else:
+                _scan_mapped(data, callsign, pairing, kept, 0, end, _feed_kept_bytes)
+            if not block:
+                pairing.flush(kept)
+            if extra:
+                kept = [line.replace(b"\n", linesep) for line in kept]
+
+            first = len(starts)
+            rr73_indices.extend(
+                first + i
+                for i, line in enumerate(kept)
+                if b"RR73" in line
+                and extract_other_callsign_from_rr73_line(line.decode("utf-8"), callsign)
+            )
+            starts.extend(accumulate(map(len, kept), initial=out_pos))
+            out_pos = starts.pop()
+            out.write(b"".join(kept))
+
+            carry = data[end:]
+            if not block:
+                break
+
+    STATS.add("bytes_read", input_path.stat().st_size)
+    STATS.add("lines_scanned", lines_scanned)
+    STATS.add("lines_matched", pairing.lines_matched)
+    STATS.add("cq_lines_held", pairing.cq_held)
+    STATS.add("cq_lines_flushed", pairing.cq_flushed)
+    STATS.add("lines_output", len(starts))
+
+    navigator = LazyLineNavigator(
+        output_path, starts, own_callsign=callsign, rr73_indices=rr73_indices
+    )
+    if with_records:
+        with STATS.timer("filter.records"):
+            navigator.records = LineRecords.from_lines(navigator)
+    return navigator
+
+
 # Funktion zum Filtern der Zeilen
 def filter_lines_with_callsign(
     callsign: str,
-    input_path: str | Path,
+    input_path: str | Path | Iterable[str | Path],
     output_path: str | Path,
+    engine: str = "lines",
+    workers: Optional[int] = 1,
+    with_records: bool = False,
+    lazy: bool = False,
+    time_range: Optional[Tuple[object, object]] = None,
+    merge: bool = False,
 ) -> LineNavigator:
     """
     liefert zusaetzlich einen LineNavigator mit allen Ergebniszeilen.
+
+    engine:
+    -- "lines": liest die Datei zeilenweise im Textmodus (Standard)
+    -- "mmap":  bildet die Datei in den Speicher ab und springt direkt
+                zu den Treffern; nur diese Zeilen werden dekodiert.
+                Das Ergebnis ist identisch, bei grossen Dateien aber
+                deutlich schneller.
+    -- "bytes": liest die Datei blockweise ohne mmap (z.B. auch auf
+                Netzlaufwerken), dekodiert nur die gefundenen Zeilen und
+                schreibt sie ohne Umweg ueber str in die Output-Datei.
+                Liefert wie lazy=True einen LazyLineNavigator.
+                Nur fuer ASCII-Rufzeichen, sonst wird "mmap" verwendet.
+
+    workers:
+    -- Anzahl Prozesse; bei mehr als 1 wird die Datei an Zeilengrenzen in
+       Abschnitte geteilt, die parallel mit der "mmap"-Suche gefiltert werden.
+       Das Ergebnis ist byte-identisch zum seriellen Lauf.
+       0 oder None verwendet alle CPU-Kerne.
+       Unter Windows muss das aufrufende Skript dafuer durch
+       if __name__ == "__main__": geschuetzt sein.
+
+    with_records:
+    -- legt zusaetzlich navigator.records an (LineRecords): alle Felder
+       der Ergebniszeilen in kompakten Spalten, Rufzeichen als Ganzzahlen.
+       RR73-Index, Vorkommen eines Rufzeichens und das andere Rufzeichen
+       einer RR73-Zeile kommen dann aus records, ohne die Zeilen zu
+       zerlegen. Die Zeilen selbst bleiben fuer die Anzeige erhalten,
+       records kosten also zusaetzlichen Speicher.
+
+    lazy:
+    -- schreibt die Ergebniszeilen sofort in die Output-Datei und liefert
+       einen LazyLineNavigator, der nur deren Byte-Offsets im Speicher haelt
+       und die Zeilen bei Bedarf aus der Datei liest.
+
+    input_path:
+    -- eine Datei, ein Glob oder eine Liste davon; komprimierte Archive
+       (.gz, .xz, .bz2, .zst) werden beim Lesen entpackt und die Dateien
+       chronologisch nacheinander gefiltert (siehe sub_archive_input).
+       engine und workers werden dafuer nicht verwendet.
+
+    time_range:
+    -- (start, end) als "YYMMDD[_HH[MM[SS]]]", datetime oder Sekunden seit
+       1970, None = offen; start inklusive, end exklusive. Nur Zeilen aus diesem Zeitraum
+       kommen ins Ergebnis. Bei einer einzelnen Datei wird der Abschnitt per
+       Binaersuche ueber die Zeitstempel gefunden und nur er gelesen
+       (engine und workers werden dafuer nicht verwendet, siehe
+       sub_time_range); Archive werden ganz gelesen und dabei gefiltert.
+
+    merge:
+    -- die Eingaben stammen von mehreren gleichzeitig laufenden Stationen:
+       sie werden nach Zeitstempel zusammengefuehrt (k-Wege-Merge) und
+       Zeilen mit gleichem Zeitstempel, gleicher Frequenz und gleicher
+       Nachricht nur einmal ausgegeben (siehe sub_merge_inputs).
+       engine und workers werden dafuer nicht verwendet.
     """
-    
-    cq_pattern = "CQ " + callsign  # Suchmuster fr CQ-Zeilen
+    if engine not in ENGINES:
+        raise ValueError(f"Unbekannte engine {engine!r}, erlaubt: {ENGINES}")
 
-    input_path = Path(input_path)
+    # Spaeter Import, da sub_archive_input selbst CqPairing importiert
+    from sub_archive_input import is_archive_input, scan_inputs
+    archive_input = is_archive_input(input_path)
+    if not archive_input:
+        input_path = Path(input_path)
     output_path = Path(output_path)
 
-    last_cq_line = None
-    last_was_cq = False
-    result_lines: list[str] = []
+    pairing = CqPairing(callsign)
+    feeder = pairing
+    if time_range is not None:
+        feeder = TimeRangeFilter(pairing, *time_bounds(time_range))
+    if lazy:
+        # Spaeter Import, da sub_lazy_navigator selbst LineNavigator importiert
+        from sub_lazy_navigator import LazyLineNavigator, OffsetWriter
+        result_lines = OffsetWriter(output_path, callsign)
+    else:
+        result_lines = []
 
-    with input_path.open("r", encoding="utf-8", errors="replace") as f:
-        for line in f:
-            if callsign not in line:
-                continue
+    if not workers:
+        workers = os.cpu_count() or 1
 
-            if cq_pattern in line:
-                last_cq_line = line
-                last_was_cq = True
-            else:
-                if last_was_cq and last_cq_line is not None:
-                    result_lines.append(last_cq_line)
-                    last_cq_line = None
-                    last_was_cq = False
+    if (engine == "bytes" and callsign.isascii() and not archive_input
+            and time_range is None and not merge and workers == 1):
+        with STATS.timer("filter.scan"):
+            return _filter_bytes(callsign, input_path, output_path, with_records)
+
+    scan_start = time.perf_counter()
+    if merge:
+        # Spaeter Import, da sub_merge_inputs selbst CqPairing importiert
+        from sub_merge_inputs import merge_scan
+        merge_scan(input_path, callsign, feeder, result_lines)
+    elif archive_input:
+        scan_inputs(input_path, callsign, feeder, result_lines)
+    elif time_range is not None:
+        _scan_time_range(input_path, callsign, feeder, result_lines)
+    elif workers > 1:
+        _filter_parallel(callsign, input_path, pairing, result_lines, workers)
+        STATS.add("bytes_read", input_path.stat().st_size)
+    elif engine in ("mmap", "bytes"):
+        with input_path.open("rb") as f:
+            # Leere Dateien lassen sich nicht abbilden
+            if input_path.stat().st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    _scan_mapped(data, callsign, pairing, result_lines)
+                    STATS.add("bytes_read", len(data))
+                    if STATS.enabled:
+                        # Zusaetzlicher Durchlauf, nur mit --stats
+                        STATS.add("lines_scanned", _count_lines(data))
+    else:
+        lines_scanned = 0
+        with input_path.open("r", encoding="utf-8", errors="replace") as f:
+            for lines_scanned, line in enumerate(f, 1):
+                if callsign not in line:
+                    continue
+                feeder.feed(line, result_lines)
+        STATS.add("bytes_read", input_path.stat().st_size)
+        STATS.add("lines_scanned", lines_scanned)
+
+    pairing.flush(result_lines)
+    STATS.add_time("filter.scan", time.perf_counter() - scan_start)
+    STATS.add("lines_matched", pairing.lines_matched)
+    STATS.add("cq_lines_held", pairing.cq_held)
+    STATS.add("cq_lines_flushed", pairing.cq_flushed)
+    STATS.add("lines_output", len(result_lines))
 
-                result_lines.append(line)
+    if lazy:
+        result_lines.close()
+        navigator = LazyLineNavigator(
+            output_path,
+            result_lines.starts,
+            own_callsign=callsign,
+            rr73_indices=result_lines.rr73_indices,
+        )
+        if with_records:
+            with STATS.timer("filter.records"):
+                navigator.records = LineRecords.from_lines(navigator)
+        return navigator
 
-    if last_was_cq and last_cq_line is not None:
-        result_lines.append(last_cq_line)
+    with STATS.timer("filter.write"):
+        with output_path.open("w", encoding="utf-8") as out:
+            out.writelines(result_lines)
 
-    with output_path.open("w", encoding="utf-8") as out:
-        out.writelines(result_lines)
+    records = None
+    if with_records:
+        with STATS.timer("filter.records"):
+            records = LineRecords.from_lines(result_lines)
 
     # Ergebnis zusaetzlich in einem Navigator-Objekt zurckgeben
-    return LineNavigator(result_lines)
+    return LineNavigator(result_lines, records, own_callsign=callsign)
 # ENDE Funktion filter_lines_with_callsign ------------
 
 
@@ -0,0 +1,116 @@
+"""
+LICENSE
+==========
+This file is part of the project <Check_yr_WSJT_X_log_with_ALL_TXT>
+Licensed under the MIT License - see the LICENSE file for details.
+
+Developed by Pepe HB9EVT
+with support from my lovely auntie A.I. Perplexity, 2025
+
+I would appreciate a short email if you use this software:
+github2025  -at-  pepemail.ch
+"""
+
+"""
+export.py
+=========
+Schreibt die gefilterten Zeilen in weiteren Formaten fuer andere Programme:
+
+-- "txt":   die Zeilen unveraendert (wie filtered_lines.txt),
+-- "csv":   eine Spalte pro Feld, Trennzeichen Komma, mit Kopfzeile,
+-- "jsonl": ein JSON-Objekt pro Zeile,
+-- "col":   spaltenweise Binaerdatei (siehe sub_columnar_store).
+
+Felder: time, frequency, direction, mode, snr, dt, df, message, partner.
+Zeilen, die nicht dem ALL.TXT-Format entsprechen, erscheinen mit leeren
+Feldern und der ganzen Zeile als message.
+"""
+
+
+# IMPORTS
+import csv
+import json
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from sub_line_records import DIR_RX, format_timestamp, parse_line
+
+
+# KONSTANTEN
+FORMATS = ("txt", "csv", "jsonl", "col")
+FIELDS = ("time", "frequency", "direction", "mode", "snr", "dt", "df", "message", "partner")
+
+
+def partner_callsign(words: List[str], own_callsign: str) -> Optional[str]:
+    """
+    Gegenstation: das andere der beiden ersten Woerter der Nachricht
+    ("DJ2MS HB9EVT -12"), bei CQ-Rufen und fremden QSOs None.
+    """
+    pair = words[:2]
+    if len(pair) == 2 and "CQ" not in pair and own_callsign in pair:
+        return pair[1] if pair[0] == own_callsign else pair[0]
+    return None
+
+
+def line_fields(line: str, own_callsign: str) -> dict:
+    """Zerlegt eine Ergebniszeile in die Felder von FIELDS."""
+    parsed = parse_line(line)
+    if parsed is None:
+        return dict.fromkeys(FIELDS[:-2], None) | {"message": line.rstrip("\r\n"), "partner": None}
+
+    timestamp, frequency, direction, mode, snr, dt, df, words = parsed
+    return {
+        "time": format_timestamp(timestamp),
+        "frequency": frequency,
+        "direction": "Rx" if direction == DIR_RX else "Tx",
+        "mode": mode,
+        "snr": snr,
+        "dt": dt,
+        "df": df,
+        "message": " ".join(words),
+        "partner": partner_callsign(words, own_callsign),
+    }
+
+
+# Funktion zum Exportieren der Ergebniszeilen
+def export_lines(
+    lines: Iterable[str],
+    output_path: str | Path,
+    own_callsign: str,
+    fmt: str = "txt",
+) -> int:
+    """Schreibt lines im Format fmt nach output_path; Rueckgabe: Anzahl Zeilen."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Unbekanntes Format {fmt!r}, erlaubt: {', '.join(FORMATS)}")
+
+    if fmt == "col":
+        from sub_columnar_store import export_columnar
+        return export_columnar(lines, output_path, own_callsign, getattr(lines, "records", None))
+
+    count = 0
+    with Path(output_path).open("w", encoding="utf-8", newline="") as out:
+        if fmt == "txt":
+            for line in lines:
+                out.write(line)
+                count += 1
+        elif fmt == "csv":
+            writer = csv.DictWriter(out, fieldnames=FIELDS)
+            writer.writeheader()
+            for line in lines:
+                writer.writerow(line_fields(line, own_callsign))
+                count += 1
+        else:
+            for line in lines:
+                out.write(json.dumps(line_fields(line, own_callsign), ensure_ascii=False))
+                out.write("\n")
+                count += 1
+    return count
+# ENDE Funktion export_lines ------------
+
+
+# Beispielaufruf
+if __name__ == "__main__":
+    from sub_compress_data import filter_lines_with_callsign
+
+    navigator = filter_lines_with_callsign("HB9EVT", "Excerpt_from_ALL-TXT.txt", "filtered_lines.txt")
+    print("Zeilen exportiert:", export_lines(navigator, "filtered_lines.csv", "HB9EVT", "csv"))
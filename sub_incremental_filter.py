@@ -0,0 +1,284 @@
+"""
+LICENSE
+==========
+This file is part of the project <Check_yr_WSJT_X_log_with_ALL_TXT>
+Licensed under the MIT License - see the LICENSE file for details.
+
+Developed by Pepe HB9EVT
+with support from my lovely auntie A.I. Perplexity, 2025
+
+I would appreciate a short email if you use this software:
+github2025  -at-  pepemail.ch
+"""
+
+"""
+incremental_filter.py
+=====================
+Inkrementelles Filtern: WSJT-X haengt an ALL.TXT nur an. Nach jedem Lauf
+wird neben der Output-Datei ein kleiner Checkpoint gespeichert, damit der
+naechste Lauf nur die neu angehaengten Bytes durchsuchen muss.
+Wurde die Datei gekuerzt oder ersetzt, wird automatisch neu gefiltert.
+"""
+
+
+# IMPORTS
+import hashlib
+import json
+import mmap
+from pathlib import Path
+from typing import List, Optional
+
+from sub_compress_data import CqPairing, LineNavigator, _count_lines, _scan_mapped
+from sub_stats import STATS
+
+
+# KONSTANTEN
+CHECKPOINT_VERSION = 2
+CHECKPOINT_SUFFIX = ".checkpoint.json"  # Wird an den Namen der Output-Datei angehaengt
+HEAD_BYTES = 64 * 1024                  # Umfang des Fingerabdrucks am Dateianfang
+TAIL_BYTES = 4 * 1024                   # Umfang des Fingerabdrucks vor dem Offset
+READ_BLOCK = 1024 * 1024                # Blockgroesse beim Hashen der Output-Datei
+
+
+def default_checkpoint_path(output_path: str | Path) -> Path:
+    output_path = Path(output_path)
+    return output_path.with_name(output_path.name + CHECKPOINT_SUFFIX)
+
+
+def prefix_fingerprint(data, offset: int) -> dict:
+    """
+    Fingerabdruck des bereits gelesenen Dateianfangs: Hash der ersten
+    HEAD_BYTES und Hash der TAIL_BYTES direkt vor dem Offset.
+    """
+    head = data[:min(offset, HEAD_BYTES)]
+    tail = data[max(0, offset - TAIL_BYTES):offset]
+    return {
+        "head_sha256": hashlib.sha256(head).hexdigest(),
+        "tail_sha256": hashlib.sha256(tail).hexdigest(),
+    }
+
+
+def output_fingerprint(output_path: Path, output_offset: int) -> Optional[dict]:
+    """
+    Fingerabdruck der Output-Datei: Groesse, mtime_ns und Hash der ersten
+    output_offset Bytes (der Ergebniszeilen, die der naechste Lauf
+    weiterverwendet). None, falls die Datei fehlt oder kuerzer ist.
+    """
+    try:
+        stat = output_path.stat()
+        if stat.st_size < output_offset:
+            return None
+        digest = hashlib.sha256()
+        with output_path.open("rb") as out:
+            remaining = output_offset
+            while remaining > 0:
+                block = out.read(min(READ_BLOCK, remaining))
+                if not block:
+                    return None
+                digest.update(block)
+                remaining -= len(block)
+    except OSError:
+        return None
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": digest.hexdigest(),
+    }
+
+
+def _load_checkpoint(
+    checkpoint_path: Path,
+    callsign: str,
+    input_path: Path,
+    output_path: Path,
+    data,
+) -> Optional[dict]:
+    """
+    Liefert den Checkpoint, wenn er zur aktuellen Eingabe passt, sonst None
+    (dann muss die Datei komplett neu gefiltert werden).
+    """
+    try:
+        checkpoint = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    if checkpoint.get("version") != CHECKPOINT_VERSION:
+        return None
+    if checkpoint.get("callsign") != callsign:
+        return None
+    if checkpoint.get("input_path") != str(input_path.resolve()):
+        return None
+
+    offset = checkpoint.get("offset", -1)
+    if not 0 <= offset <= len(data):
+        # Datei wurde gekuerzt oder rotiert
+        return None
+    if checkpoint.get("fingerprint") != prefix_fingerprint(data, offset):
+        # Datei wurde ersetzt oder veraendert
+        return None
+
+    # Die Output-Datei muss noch genau so sein, wie der letzte Lauf sie
+    # hinterlassen hat (z.B. nicht von einem normalen Lauf ueberschrieben)
+    output = checkpoint.get("output")
+    if output is None:
+        return None
+    if output != output_fingerprint(output_path, checkpoint.get("output_offset", -1)):
+        return None
+
+    return checkpoint
+
+
+def _save_checkpoint(
+    checkpoint_path: Path,
+    callsign: str,
+    input_path: Path,
+    output_path: Path,
+    data,
+    offset: int,
+    output_offset: int,
+    last_cq_line: Optional[str],
+) -> None:
+    checkpoint = {
+        "version": CHECKPOINT_VERSION,
+        "callsign": callsign,
+        "input_path": str(input_path.resolve()),
+        "offset": offset,
+        "fingerprint": prefix_fingerprint(data, offset),
+        "output_offset": output_offset,
+        "output": output_fingerprint(output_path, output_offset),
+        "last_cq_line": last_cq_line,
+    }
+    tmp_path = checkpoint_path.with_name(checkpoint_path.name + ".tmp")
+    tmp_path.write_text(json.dumps(checkpoint), encoding="utf-8")
+    tmp_path.replace(checkpoint_path)
+
+
+def _read_output_lines(output_path: Path, output_offset: int) -> List[str]:
+    """
+    Kuerzt die Output-Datei auf den Stand des Checkpoints und liest
+    die bereits vorhandenen Ergebniszeilen wieder ein.
+    """
+    with output_path.open("r+b") as out:
+        out.truncate(output_offset)
+    with output_path.open("r", encoding="utf-8", errors="replace") as out:
+        return out.readlines()
+
+
+# Funktion zum inkrementellen Filtern
+def filter_lines_incremental(
+    callsign: str,
+    input_path: str | Path,
+    output_path: str | Path,
+    checkpoint_path: str | Path | None = None,
+) -> LineNavigator:
+    """
+    Wie filter_lines_with_callsign, liest aber nur die seit dem letzten
+    Lauf angehaengten Bytes. Output-Datei und Navigator enthalten danach
+    genau das, was ein vollstaendiger Lauf ergeben wuerde.
+
+    Der Checkpoint haelt fest:
+    -- den Offset hinter der letzten vollstaendigen Zeile,
+    -- einen Fingerabdruck des Dateianfangs bis zu diesem Offset,
+    -- die noch offene CQ-Zeile und die Groesse der Output-Datei davor,
+    -- Groesse, mtime_ns und Hash der Output-Datei nach dem Lauf; passt sie
+       nicht mehr (z.B. von einem normalen Lauf ueberschrieben), wird neu
+       gefiltert.
+    Eine unvollstaendige letzte Zeile (WSJT-X schreibt gerade) und die am
+    Dateiende ausgegebene CQ-Zeile werden beim naechsten Lauf wieder
+    entfernt und neu bewertet.
+    """
+    input_path = Path(input_path)
+    output_path = Path(output_path)
+    if checkpoint_path is None:
+        checkpoint_path = default_checkpoint_path(output_path)
+    checkpoint_path = Path(checkpoint_path)
+
+    pairing = CqPairing(callsign)
+
+    with input_path.open("rb") as f:
+        # Leere Dateien lassen sich nicht abbilden
+        if input_path.stat().st_size > 0:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            data = b""
+
+        try:
+            checkpoint = _load_checkpoint(
+                checkpoint_path, callsign, input_path, output_path, data
+            )
+            if checkpoint is not None:
+                offset = checkpoint["offset"]
+                pairing.last_cq_line = checkpoint["last_cq_line"]
+                pairing.last_was_cq = pairing.last_cq_line is not None
+                result_lines = _read_output_lines(
+                    output_path, checkpoint["output_offset"]
+                )
+            else:
+                offset = 0
+                result_lines = []
+                output_path.write_bytes(b"")
+
+            # Nur vollstaendige Zeilen gehen in den Checkpoint ein
+            complete_end = data.rfind(b"\n", offset) + 1
+            if complete_end <= 0:
+                complete_end = offset
+
+            new_lines: List[str] = []
+            with STATS.timer("filter.scan"):
+                _scan_mapped(data, callsign, pairing, new_lines, offset, complete_end)
+            with STATS.timer("filter.write"):
+                with output_path.open("a", encoding="utf-8") as out:
+                    out.writelines(new_lines)
+            result_lines.extend(new_lines)
+            output_offset = output_path.stat().st_size
+            last_cq_line = pairing.last_cq_line
+
+            # Angefangene letzte Zeile und offene CQ-Zeile wie beim
+            # vollstaendigen Lauf ausgeben
+            tail_lines: List[str] = []
+            _scan_mapped(data, callsign, pairing, tail_lines, complete_end)
+            pairing.flush(tail_lines)
+            if tail_lines:
+                with output_path.open("a", encoding="utf-8") as out:
+                    out.writelines(tail_lines)
+                result_lines.extend(tail_lines)
+
+            # Erst jetzt, damit Groesse und mtime_ns der fertigen Output-Datei
+            # im Checkpoint stehen
+            _save_checkpoint(
+                checkpoint_path,
+                callsign,
+                input_path,
+                output_path,
+                data,
+                complete_end,
+                output_offset,
+                last_cq_line,
+            )
+
+            # Gelesen wurde nur der Teil ab dem Checkpoint
+            STATS.add("bytes_skipped", offset)
+            STATS.add("bytes_read", len(data) - offset)
+            if STATS.enabled:
+                STATS.add("lines_scanned", _count_lines(data, offset))
+            STATS.add("lines_matched", pairing.lines_matched)
+            STATS.add("cq_lines_held", pairing.cq_held)
+            STATS.add("cq_lines_flushed", pairing.cq_flushed)
+            STATS.add("lines_output", len(result_lines))
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+
+    return LineNavigator(result_lines, own_callsign=callsign)
+# ENDE Funktion filter_lines_incremental ------------
+
+
+# Beispielaufruf
+if __name__ == "__main__":
+
+    navigator = filter_lines_incremental(
+        "HB9EVT",
+        "Excerpt_from_ALL-TXT.txt",
+        "filtered_lines.txt",
+    )
+    print("Anzahl Ergebniszeilen:", len(navigator))
@@ -0,0 +1,251 @@
+"""
+LICENSE
+==========
+This file is part of the project <Check_yr_WSJT_X_log_with_ALL_TXT>
+Licensed under the MIT License - see the LICENSE file for details.
+
+Developed by Pepe HB9EVT
+with support from my lovely auntie A.I. Perplexity, 2025
+
+I would appreciate a short email if you use this software:
+github2025  -at-  pepemail.ch
+"""
+
+"""
+lazy_navigator.py
+=================
+LineNavigator, der die Zeilen nicht im Speicher haelt, sondern nur ein
+array('Q') mit den Byte-Offsets der Zeilenanfaenge in einer Datei
+(filtered_lines.txt oder direkt ALL.TXT). Zeilen werden seitenweise bei
+Bedarf gelesen (ein read pro Seite); nur wenige Seiten bleiben in einem
+kleinen Cache. Zeilenenden wie im Textmodus: "\n", "\r\n" und ein
+einzelnes "\r".
+
+Der Navigator haelt die Datei offen; mit close() oder als
+Kontextmanager (with ... as navigator) wird sie wieder geschlossen.
+"""
+
+
+# IMPORTS
+import io
+import os
+import re
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from sub_compress_data import LineNavigator, extract_other_callsign_from_rr73_line
+
+
+# KONSTANTEN
+PAGE_LINES = 256        # Zeilen pro Seite
+CACHE_PAGES = 16        # Anzahl Seiten im Cache
+READ_BLOCK = 1 << 20    # Blockgroesse beim Einlesen der Offsets
+
+_LINE_END = re.compile(rb"\r\n?|\n")     # Zeilenenden wie im Textmodus
+
+
+# KLASSE LazyLines
+class LazyLines:
+    """
+    Verhaelt sich wie eine unveraenderliche Liste von Zeilen, liest die
+    Zeilen aber erst beim Zugriff aus der Datei. end ist der Offset hinter
+    der letzten Zeile (None = Dateigroesse beim Oeffnen); spaeter
+    angehaengte Bytes gehoeren nicht dazu.
+    """
+
+    def __init__(self, path: str | Path, starts: array, end: Optional[int] = None) -> None:
+        self._path = Path(path)
+        self._starts = starts
+        self._file = self._path.open("rb")
+        self._end = os.fstat(self._file.fileno()).st_size if end is None else end
+        self._pages: "OrderedDict[int, List[str]]" = OrderedDict()
+
+    def close(self) -> None:
+        self._file.close()
+        self._pages.clear()
+
+    def reopen(self, count: Optional[int] = None) -> "LazyLines":
+        """Die ersten count Zeilen mit eigenem Dateizugriff (z.B. fuer einen anderen Thread)."""
+        if count is None or count >= len(self._starts):
+            return LazyLines(self._path, self._starts, self._end)
+        return LazyLines(self._path, self._starts[:count], self._starts[count])
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def _read_lines(self, first: int, stop: int) -> List[str]:
+        """Zeilen first .. stop-1 mit einem einzigen read, dekodiert wie im Textmodus."""
+        if first >= stop:
+            return []
+        start = self._starts[first]
+        end = self._starts[stop] if stop < len(self._starts) else self._end
+        self._file.seek(start)
+        text = self._file.read(end - start).decode("utf-8", errors="replace")
+        # newline=None: "\r\n" und einzelnes "\r" werden zu "\n"
+        return list(io.StringIO(text, newline=None))
+
+    def _page(self, page_no: int) -> List[str]:
+        page = self._pages.get(page_no)
+        if page is not None:
+            self._pages.move_to_end(page_no)
+            return page
+
+        first = page_no * PAGE_LINES
+        page = self._read_lines(first, min(first + PAGE_LINES, len(self)))
+        self._pages[page_no] = page
+        if len(self._pages) > CACHE_PAGES:
+            self._pages.popitem(last=False)
+        return page
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            result: List[str] = []
+            i = start
+            while i < stop:
+                page_no, offset = divmod(i, PAGE_LINES)
+                page = self._page(page_no)
+                take = page[offset:offset + (stop - i)]
+                result.extend(take)
+                i += len(take)
+            return result
+
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("Zeilenindex ausserhalb des Bereichs")
+        page_no, offset = divmod(key, PAGE_LINES)
+        return self._page(page_no)[offset]
+
+    def __iter__(self) -> Iterator[str]:
+        # Sequentielles Lesen am Cache vorbei, damit er nicht verdraengt wird
+        for first in range(0, len(self), PAGE_LINES):
+            yield from self._read_lines(first, min(first + PAGE_LINES, len(self)))
+# Ende der Klasse LazyLines -----------------------------
+
+
+# KLASSE LazyLineNavigator
+class LazyLineNavigator(LineNavigator):
+    """
+    LineNavigator ueber einer Datei: im Speicher liegen nur die Offsets
+    (8 Bytes pro Zeile), der RR73-Index und wenige Seiten Zeilen.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        starts: array,
+        own_callsign: Optional[str] = None,
+        rr73_indices: Optional[List[int]] = None,
+        end: Optional[int] = None,
+    ) -> None:
+        super().__init__(LazyLines(path, starts, end))
+        if own_callsign is not None:
+            if rr73_indices is not None:
+                self._rr73_callsign = own_callsign
+                self._rr73_indices = rr73_indices
+            else:
+                self.rr73_indices(own_callsign)
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str | Path,
+        own_callsign: Optional[str] = None,
+    ) -> "LazyLineNavigator":
+        """
+        Ermittelt die Zeilenanfaenge einer vorhandenen Datei (Zeilenenden
+        wie im Textmodus, auch "\r\n" ueber eine Blockgrenze hinweg).
+        """
+        starts = array("Q")
+        pos = 0
+        with Path(path).open("rb") as f:
+            at_line_start = True
+            pending_cr = False      # Block endete mit "\r", evtl. folgt "\n"
+            while True:
+                block = f.read(READ_BLOCK)
+                if not block:
+                    break
+                i = 0
+                if pending_cr:
+                    pending_cr = False
+                    if block.startswith(b"\n"):
+                        i = 1
+                # Ohne "\r" im Block genuegt die schnellere Suche nach "\n"
+                has_cr = b"\r" in block
+                while i < len(block):
+                    if at_line_start:
+                        starts.append(pos + i)
+                        at_line_start = False
+                    if has_cr:
+                        match = _LINE_END.search(block, i)
+                        if match is None:
+                            break
+                        i = match.end()
+                        pending_cr = i == len(block) and block.endswith(b"\r")
+                    else:
+                        newline = block.find(b"\n", i)
+                        if newline < 0:
+                            break
+                        i = newline + 1
+                    at_line_start = True
+                pos += len(block)
+        return cls(path, starts, own_callsign, end=pos)
+
+    def detached_lines(self, count: int) -> LazyLines:
+        """Die ersten count Zeilen mit eigenem Dateizugriff, z.B. fuer den Such-Thread."""
+        return self._lines.reopen(count)
+
+    def close(self) -> None:
+        self._lines.close()
+# Ende der Klasse LazyLineNavigator -----------------------------
+
+
+# KLASSE OffsetWriter
+class OffsetWriter:
+    """
+    Ersatz fuer die Ergebnisliste in filter_lines_with_callsign: schreibt
+    jede Zeile sofort in die Output-Datei und merkt sich nur ihren Offset
+    und ob sie eine RR73-Zeile eines eigenen QSOs ist.
+    Die Datei entspricht byte-genau der im Textmodus geschriebenen.
+    """
+
+    def __init__(self, path: str | Path, own_callsign: str) -> None:
+        self._out = Path(path).open("wb")
+        self._pos = 0
+        self._own_callsign = own_callsign
+        self.starts = array("Q")
+        self.rr73_indices: List[int] = []
+
+    def append(self, line: str) -> None:
+        if "RR73" in line and extract_other_callsign_from_rr73_line(line, self._own_callsign):
+            self.rr73_indices.append(len(self.starts))
+        if os.linesep != "\n":
+            line = line.replace("\n", os.linesep)
+        data = line.encode("utf-8")
+        self.starts.append(self._pos)
+        self._out.write(data)
+        self._pos += len(data)
+
+    def extend(self, lines) -> None:
+        for line in lines:
+            self.append(line)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def close(self) -> None:
+        self._out.close()
+# Ende der Klasse OffsetWriter -----------------------------
+
+
+# Beispiel
+if __name__ == "__main__":
+    navigator = LazyLineNavigator.from_file("filtered_lines.txt", own_callsign="HB9EVT")
+    print("Anzahl Zeilen:", len(navigator))
+    print("Erste Zeile:", navigator.first())
+    print("Zeilen 10-12:", navigator.window(10, 3))
@@ -0,0 +1,441 @@
+"""
+LICENSE
+==========
+This file is part of the project <Check_yr_WSJT_X_log_with_ALL_TXT>
+Licensed under the MIT License - see the LICENSE file for details.
+
+Developed by Pepe HB9EVT
+with support from my lovely auntie A.I. Perplexity, 2025
+
+I would appreciate a short email if you use this software:
+github2025  -at-  pepemail.ch
+"""
+
+"""
+line_records.py
+===============
+Kompakte, spaltenweise Ablage geparster ALL.TXT-Zeilen.
+
+Aufbau einer ALL.TXT-Zeile:
+251208_041407     3.573 Rx FT8    -12  0.4 1030 HB9EVT DJ2MS RR73
+Zeitstempel, Frequenz (MHz), Rx/Tx, Mode, SNR, DT, DF, Nachricht
+
+Jedes Feld liegt in einem typisierten array; die Woerter der Nachricht
+(Rufzeichen, Locator, Rapporte) werden ueber eine Stringtabelle auf
+Ganzzahlen abgebildet. Abfragen nach Rufzeichen oder RR73 vergleichen
+nur noch Ganzzahlen statt Teilstrings.
+"""
+
+
+# IMPORTS
+import calendar
+import time
+from array import array
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# KONSTANTEN
+TIMESTAMP_LEN = 13      # "YYMMDD_HHMMSS"
+HEADER_FIELDS = 7       # Zeitstempel, Frequenz, Rx/Tx, Mode, SNR, DT, DF
+DIR_UNKNOWN = -1        # Zeile liess sich nicht zerlegen
+DIR_RX = 0
+DIR_TX = 1
+
+
+# KLASSE StringTable
+class StringTable:
+    """Bildet Strings auf fortlaufende Ganzzahl-IDs ab (Interning)."""
+
+    def __init__(self, strings: Iterable[str] = ()) -> None:
+        self._strings: List[str] = []
+        self._ids: Dict[str, int] = {}
+        for s in strings:
+            self.intern(s)
+
+    def intern(self, s: str) -> int:
+        sid = self._ids.get(s)
+        if sid is None:
+            sid = len(self._strings)
+            self._strings.append(s)
+            self._ids[s] = sid
+        return sid
+
+    def get_id(self, s: str) -> Optional[int]:
+        return self._ids.get(s)
+
+    def lookup(self, sid: int) -> str:
+        return self._strings[sid]
+
+    def ids_matching(self, predicate) -> List[int]:
+        return [sid for sid, s in enumerate(self._strings) if predicate(s)]
+
+    def strings(self) -> List[str]:
+        return list(self._strings)
+
+    def __len__(self) -> int:
+        return len(self._strings)
+# Ende der Klasse StringTable -----------------------------
+
+
+_day_cache: Dict[str, int] = {}
+
+
+def parse_timestamp(text: str) -> Optional[int]:
+    """
+    "YYMMDD_HHMMSS" -> Sekunden seit 1970 (UTC) oder None.
+    Die Tagesanteile werden zwischengespeichert, weil sich das Datum
+    von Zeile zu Zeile selten aendert.
+    """
+    if len(text) != TIMESTAMP_LEN or text[6] != "_":
+        return None
+    day = text[:6]
+    base = _day_cache.get(day)
+    try:
+        if base is None:
+            base = calendar.timegm(
+                (2000 + int(day[0:2]), int(day[2:4]), int(day[4:6]), 0, 0, 0)
+            )
+            _day_cache[day] = base
+        return base + int(text[7:9]) * 3600 + int(text[9:11]) * 60 + int(text[11:13])
+    except ValueError:
+        return None
+
+
+def format_timestamp(timestamp: int) -> str:
+    """Sekunden seit 1970 (UTC) -> "YYMMDD_HHMMSS"."""
+    return time.strftime("%y%m%d_%H%M%S", time.gmtime(timestamp))
+
+
+def parse_line(line: str) -> Optional[Tuple[int, float, int, str, int, float, int, List[str]]]:
+    """
+    Zerlegt eine ALL.TXT-Zeile in
+    (Zeitstempel, Frequenz, Rx/Tx, Mode, SNR, DT, DF, Nachrichtenwoerter).
+    Liefert None, wenn die Zeile nicht dem Format entspricht (z.B. verstuemmelt).
+    """
+    parts = line.split()
+    if len(parts) < HEADER_FIELDS:
+        return None
+    timestamp = parse_timestamp(parts[0])
+    if timestamp is None:
+        return None
+    if parts[2] == "Rx":
+        direction = DIR_RX
+    elif parts[2] == "Tx":
+        direction = DIR_TX
+    else:
+        return None
+    try:
+        return (
+            timestamp,
+            float(parts[1]),
+            direction,
+            parts[3],
+            int(parts[4]),
+            float(parts[5]),
+            int(parts[6]),
+            parts[HEADER_FIELDS:],
+        )
+    except ValueError:
+        return None
+
+
+# ADIF-Baender (untere Grenze, obere Grenze in MHz, Name)
+BANDS = (
+    (0.1357, 0.1378, "2190m"),
+    (0.472, 0.479, "630m"),
+    (1.8, 2.0, "160m"),
+    (3.5, 4.0, "80m"),
+    (5.06, 5.45, "60m"),
+    (7.0, 7.3, "40m"),
+    (10.1, 10.15, "30m"),
+    (14.0, 14.35, "20m"),
+    (18.068, 18.168, "17m"),
+    (21.0, 21.45, "15m"),
+    (24.89, 24.99, "12m"),
+    (28.0, 29.7, "10m"),
+    (40.0, 45.0, "8m"),
+    (50.0, 54.0, "6m"),
+    (70.0, 71.0, "4m"),
+    (144.0, 148.0, "2m"),
+    (222.0, 225.0, "1.25m"),
+    (420.0, 450.0, "70cm"),
+    (1240.0, 1300.0, "23cm"),
+)
+
+
+def band_from_frequency(mhz: float) -> Optional[str]:
+    """Amateurfunkband (ADIF-Schreibweise) zur Frequenz in MHz."""
+    for low, high, band in BANDS:
+        if low <= mhz <= high:
+            return band
+    return None
+
+
+# KLASSE LineRecords
+class LineRecords:
+    """
+    Spaltenweise Ablage geparster ALL.TXT-Zeilen.
+    Zeile i belegt in allen Spalten den Index i; die Nachrichtenwoerter
+    von Zeile i liegen in tokens[token_offsets[i]:token_offsets[i + 1]].
+    """
+
+    def __init__(self) -> None:
+        self.timestamps = array("q")
+        self.frequencies = array("d")
+        self.directions = array("b")
+        self.modes = array("H")
+        self.snrs = array("h")
+        self.dts = array("f")
+        self.dfs = array("i")
+        self.token_offsets = array("Q", [0])
+        self.tokens = array("I")
+        self.strings = StringTable()
+        self.mode_names = StringTable()
+        self._token_bytes: Optional[bytes] = None
+        self._minute_cache: Dict[str, int] = {}
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> "LineRecords":
+        records = cls()
+        records.extend(lines)
+        return records
+
+    def append(self, line: str) -> None:
+        self.extend((line,))
+
+    def extend(self, lines: Iterable[str]) -> None:
+        """
+        Parst die Zeilen und haengt sie an. Die Spalten werden zuerst in
+        Listen gesammelt und dann in einem Schritt in die arrays uebernommen;
+        Zeitstempel werden pro Minute zwischengespeichert.
+        """
+        timestamps: List[int] = []
+        frequencies: List[float] = []
+        directions: List[int] = []
+        modes: List[int] = []
+        snrs: List[int] = []
+        dts: List[float] = []
+        dfs: List[int] = []
+        offsets: List[int] = []
+        tokens: List[int] = []
+
+        token_count = len(self.tokens)
+        intern = self.strings.intern
+        token_ids = self.strings._ids
+        intern_mode = self.mode_names.intern
+        minute_cache = self._minute_cache
+        direction_ids = {"Rx": DIR_RX, "Tx": DIR_TX}
+
+        for line in lines:
+            parts = line.split()
+            parsed = False
+            if len(parts) >= HEADER_FIELDS:
+                stamp = parts[0]
+                minute = stamp[:11]
+                base = minute_cache.get(minute) if len(stamp) == TIMESTAMP_LEN else None
+                if base is None and len(stamp) == TIMESTAMP_LEN:
+                    base = parse_timestamp(minute + "00")
+                    if base is not None:
+                        minute_cache[minute] = base
+                direction = direction_ids.get(parts[2])
+                if base is not None and direction is not None:
+                    try:
+                        second = int(stamp[11:])
+                        frequency = float(parts[1])
+                        snr = int(parts[4])
+                        dt = float(parts[5])
+                        df = int(parts[6])
+                        parsed = True
+                    except ValueError:
+                        pass
+
+            if parsed:
+                timestamps.append(base + second)
+                frequencies.append(frequency)
+                directions.append(direction)
+                modes.append(intern_mode(parts[3]))
+                snrs.append(max(-32768, min(32767, snr)))
+                dts.append(dt)
+                dfs.append(max(-2147483648, min(2147483647, df)))
+                words = parts[HEADER_FIELDS:]
+            else:
+                # Unbekanntes Format: nur die Woerter aufbewahren
+                timestamps.append(0)
+                frequencies.append(0.0)
+                directions.append(DIR_UNKNOWN)
+                modes.append(intern_mode(""))
+                snrs.append(0)
+                dts.append(0.0)
+                dfs.append(0)
+                words = parts
+
+            for word in words:
+                sid = token_ids.get(word)
+                if sid is None:
+                    sid = intern(word)
+                tokens.append(sid)
+            offsets.append(token_count + len(tokens))
+
+        self.timestamps.extend(timestamps)
+        self.frequencies.extend(frequencies)
+        self.directions.extend(directions)
+        self.modes.extend(modes)
+        self.snrs.extend(snrs)
+        self.dts.extend(dts)
+        self.dfs.extend(dfs)
+        self.tokens.extend(tokens)
+        self.token_offsets.extend(offsets)
+        self._token_bytes = None
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def message_tokens(self, i: int) -> List[str]:
+        lookup = self.strings.lookup
+        return [
+            lookup(t)
+            for t in self.tokens[self.token_offsets[i]:self.token_offsets[i + 1]]
+        ]
+
+    def line_text(self, i: int) -> str:
+        """Setzt die Zeile im ALL.TXT-Format wieder zusammen."""
+        message = " ".join(self.message_tokens(i))
+        if self.directions[i] == DIR_UNKNOWN:
+            return message + "\n"
+        stamp = format_timestamp(self.timestamps[i])
+        return "{}{:>10.3f} {} {:<3} {:>6} {:>4.1f} {:>4} {}\n".format(
+            stamp,
+            self.frequencies[i],
+            "Tx" if self.directions[i] == DIR_TX else "Rx",
+            self.mode_names.lookup(self.modes[i]),
+            self.snrs[i],
+            self.dts[i],
+            self.dfs[i],
+            message,
+        )
+
+    def nbytes(self) -> int:
+        """Speicherbedarf der Spalten in Bytes (ohne Stringtabellen)."""
+        columns = (
+            self.timestamps, self.frequencies, self.directions, self.modes,
+            self.snrs, self.dts, self.dfs, self.token_offsets, self.tokens,
+        )
+        return sum(len(c) * c.itemsize for c in columns)
+
+    # ------------------------------------------------------------------
+    # Abfragen
+    # ------------------------------------------------------------------
+
+    def _token_positions(self, token_ids: Iterable[int]) -> List[int]:
+        """
+        Sortierte Positionen der Token-IDs im tokens-Array. Gesucht wird mit
+        bytes.find im gepackten Array, also ohne Python-Schleife je Wort.
+        """
+        if self._token_bytes is None:
+            self._token_bytes = self.tokens.tobytes()
+        data = self._token_bytes
+        itemsize = self.tokens.itemsize
+        positions: List[int] = []
+        for token_id in token_ids:
+            needle = array("I", [token_id]).tobytes()
+            pos = data.find(needle)
+            while pos >= 0:
+                if pos % itemsize == 0:
+                    positions.append(pos // itemsize)
+                    pos = data.find(needle, pos + itemsize)
+                else:
+                    # Treffer ueber eine Elementgrenze hinweg
+                    pos = data.find(needle, pos + 1)
+        positions.sort()
+        return positions
+
+    def _line_of_position(self, position: int) -> int:
+        return bisect_right(self.token_offsets, position) - 1
+
+    def _callsign_ids(self, callsign: str) -> List[int]:
+        """IDs fuer das Rufzeichen, auch in der Schreibweise <CALL> (Hash)."""
+        ids = []
+        for variant in (callsign, "<" + callsign + ">"):
+            sid = self.strings.get_id(variant)
+            if sid is not None:
+                ids.append(sid)
+        return ids
+
+    def _lines_of_positions(self, positions: Iterable[int]) -> List[int]:
+        """Sortierte Zeilenindizes zu sortierten Token-Positionen (ohne Duplikate)."""
+        result: List[int] = []
+        for position in positions:
+            line = self._line_of_position(position)
+            if not result or result[-1] != line:
+                result.append(line)
+        return result
+
+    def indices_with_callsign(self, callsign: str) -> List[int]:
+        """
+        Sortierte Zeilenindizes, deren Nachricht das Rufzeichen als ganzes
+        Wort enthaelt (auch als <CALL>). Fuer 'callsign in line' wie im
+        Viewer siehe indices_containing.
+        """
+        return self._lines_of_positions(self._token_positions(self._callsign_ids(callsign)))
+
+    def indices_containing(self, text: str) -> List[int]:
+        """
+        Sortierte Zeilenindizes, in deren Nachricht text vorkommt, auch
+        innerhalb eines Worts (z.B. "DJ2MS/P"), wie 'text in line'.
+        Durchsucht wird nur die Stringtabelle; die Kopffelder (Zeit,
+        Frequenz, Mode ...) enthalten keine Rufzeichen.
+        """
+        if not text or any(c.isspace() for c in text):
+            return []
+        return self._lines_of_positions(
+            self._token_positions(self.strings.ids_matching(lambda s: text in s))
+        )
+
+    def rr73_indices(self, own_callsign: str) -> List[int]:
+        """
+        Zeilen der Form '... <cs1> <cs2> RR73', bei denen das eigene
+        Rufzeichen cs1 oder cs2 ist.
+        """
+        rr73 = self.strings.get_id("RR73")
+        if rr73 is None:
+            return []
+        own = own_callsign.upper()
+        own_ids = set(self.strings.ids_matching(lambda s: s.upper() == own))
+        tokens = self.tokens
+        offsets = self.token_offsets
+        result: List[int] = []
+        for position in self._token_positions([rr73]):
+            line = self._line_of_position(position)
+            if position + 1 != offsets[line + 1] or position - 2 < offsets[line]:
+                continue
+            if tokens[position - 1] in own_ids or tokens[position - 2] in own_ids:
+                result.append(line)
+        return result
+
+    def other_callsign(self, i: int, own_callsign: str) -> Optional[str]:
+        """Das andere Rufzeichen einer RR73-Zeile oder None."""
+        start, end = self.token_offsets[i], self.token_offsets[i + 1]
+        if end - start < 3 or self.strings.lookup(self.tokens[end - 1]) != "RR73":
+            return None
+        cs1 = self.strings.lookup(self.tokens[end - 3])
+        cs2 = self.strings.lookup(self.tokens[end - 2])
+        if cs1.upper() == own_callsign.upper():
+            return cs2
+        if cs2.upper() == own_callsign.upper():
+            return cs1
+        return None
+# Ende der Klasse LineRecords -----------------------------
+
+
+# Beispiel
+if __name__ == "__main__":
+    records = LineRecords.from_lines([
+        "251208_041407     3.573 Rx FT8    -12  0.4 1030 HB9EVT DJ2MS RR73\n",
+        "251208_041415     3.573 Tx FT8      0  0.0 1500 CQ HB9EVT JN47\n",
+        "251208_041430     3.573 Rx FT8    -10  0.2 1030 HB9EVT DJ2MS 73\n",
+    ])
+    print("Zeilen mit DJ2MS:", records.indices_with_callsign("DJ2MS"))
+    print("Zeilen mit DJ2:", records.indices_containing("DJ2"))
+    print("RR73-Zeilen:", records.rr73_indices("HB9EVT"))
+    print("Zeile 0:", records.line_text(0), end="")
@@ -0,0 +1,136 @@
+"""
+LICENSE
+==========
+This file is part of the project <Check_yr_WSJT_X_log_with_ALL_TXT>
+Licensed under the MIT License - see the LICENSE file for details.
+
+Developed by Pepe HB9EVT
+with support from my lovely auntie A.I. Perplexity, 2025
+
+I would appreciate a short email if you use this software:
+github2025  -at-  pepemail.ch
+"""
+
+"""
+line_spans.py
+=============
+LRU-Cache fuer die Zerlegung der Zeilen im LinesViewer.
+
+Pro (Zeilenindex, Rufzeichen) werden gespeichert:
+-- die Laenge der Zeile ohne Zeilenende (Position des Suffixes "***"),
+-- die Vorkommen des Rufzeichens (Anfang, Ende), wie bisher per str.find
+   gesucht (auch innerhalb eines Worts, z.B. "DJ2MS/P").
+
+Beim Blaettern und bei RR73-Spruengen kommen dieselben Zeilen immer wieder
+ins Fenster; die Markierungen werden dann aus dem Cache gesetzt, ohne die
+Zeile erneut zu durchsuchen oder Text aus dem Text-Widget zu lesen.
+Die Zeilen eines Navigators aendern sich nicht (neue Zeilen werden nur
+angehaengt), daher genuegt der Index als Schluessel.
+
+hits / misses / evictions dienen zum Bemessen von max_entries.
+"""
+
+
+# IMPORTS
+from collections import OrderedDict
+from typing import NamedTuple, Optional, Tuple
+
+from sub_stats import STATS
+
+
+# KONSTANTEN
+SPAN_CACHE_SIZE = 1024      # Anzahl (Zeile, Rufzeichen) im Cache
+
+
+# KLASSE LineSpans
+class LineSpans(NamedTuple):
+    width: int                              # Laenge ohne Zeilenende
+    spans: Tuple[Tuple[int, int], ...]      # Vorkommen des Rufzeichens
+# Ende der Klasse LineSpans -----------------------------
+
+
+def find_spans(text: str, callsign: Optional[str]) -> Tuple[Tuple[int, int], ...]:
+    """Alle nicht ueberlappenden Vorkommen von callsign in text."""
+    if not callsign or callsign not in text:
+        return ()
+    spans = []
+    cs_len = len(callsign)
+    idx = text.find(callsign)
+    while idx != -1:
+        spans.append((idx, idx + cs_len))
+        idx = text.find(callsign, idx + cs_len)
+    return tuple(spans)
+
+
+def split_line(line: str, callsign: Optional[str]) -> LineSpans:
+    """Zerlegt eine Zeile (mit oder ohne Zeilenende)."""
+    text = line.rstrip("\n")
+    return LineSpans(len(text), find_spans(text, callsign))
+
+
+# KLASSE LineSpanCache
+class LineSpanCache:
+    """
+    LRU-Cache (OrderedDict, zuletzt benutzte Eintraege am Ende) fuer
+    split_line; max_entries = 0 schaltet den Cache ab (nur Zaehler).
+    """
+
+    def __init__(self, max_entries: int = SPAN_CACHE_SIZE) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[int, Optional[str]], LineSpans]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, index: int, line: str, callsign: Optional[str]) -> LineSpans:
+        """Zerlegung der Zeile mit Index index; line wird nur bei einem Fehltreffer gelesen."""
+        key = (index, callsign)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        entry = split_line(line, callsign)
+        if self.max_entries > 0:
+            self._entries[key] = entry
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def publish(self) -> None:
+        """Uebertraegt die Zaehler in STATS (einmal am Ende, z.B. beim Schliessen des Viewers)."""
+        STATS.add("viewer.span_cache_hits", self.hits)
+        STATS.add("viewer.span_cache_misses", self.misses)
+        STATS.add("viewer.span_cache_evictions", self.evictions)
+
+    def describe(self) -> str:
+        return (
+            f"{len(self._entries)}/{self.max_entries} Eintraege, "
+            f"{self.hits} Treffer, {self.misses} Fehltreffer "
+            f"({self.hit_rate:.1%}), {self.evictions} verdraengt"
+        )
+# Ende der Klasse LineSpanCache -----------------------------
+
+
+# Beispielaufruf
+if __name__ == "__main__":
+    cache = LineSpanCache(max_entries=2)
+    line = "251208_041407     3.573 Rx FT8    -12  0.4 1030 HB9EVT DJ2MS RR73\n"
+    for index in (7, 7, 8, 7, 9, 8):
+        entry = cache.lookup(index, line, "DJ2MS")
+    print(entry.width, entry.spans)
+    print(cache.describe())
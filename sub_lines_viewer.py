@@ -23,12 +23,30 @@ Aufruf im Hauptprogramm:
 
 viewer = LinesViewer(navigator, own_callsign)
 viewer.run()
+
+Tastatur und Mausrad:
+=====================
+Pfeil auf/ab und Mausrad    -> Shift -1 / +1 Zeile
+Bild auf/ab                 -> 20 Zeilen zurueck / vor
+Pos1 / Ende                 -> erste / letzte 20 Zeilen
 """
 
 
 # IMPORTS
+import re
 import tkinter as tk
-from typing import Optional, List
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import Callable, Optional, List, Sequence
+
+from sub_compress_data import (
+    LineNavigator,
+    build_rr73_index,
+    extract_other_callsign_from_rr73_line,
+)
+from sub_line_spans import LineSpanCache
+from sub_search_index import IndexBuilder, RegexSearch, SearchIndex, next_hit, prev_hit
+from sub_stats import timed
 
 
 # KONSTANTEN
@@ -36,6 +54,8 @@ BREITE_TEXTFELD = 80                # Breite des Textfelds in Zeichen
 VISIBLE_LINES = 20                  # Anzahl der sichtbaren Zeilen im Fenster
 RR73_POS_INDEX = VISIBLE_LINES - 5  # RR73-Zeile wird auf Position 15 gesetzt
 OTHER_MARK_SUFFIX = "     ***"      # Kennzeichnung fuer Zeilen mit anderem Rufzeichen
+OCCURRENCE_CACHE_SIZE = 32          # Anzahl Rufzeichen mit gespeichertem Vorkommens-Index
+SEARCH_POLL_MS = 50                 # Abstand, in dem Such-Threads abgefragt werden
 
 
 # KLASSE LinesViewer
@@ -47,6 +67,27 @@ class LinesViewer:
         self.current_start_index: int = 0
         # Das aktuell ermittelte andere Rufzeichen
         self.other_callsign: Optional[str] = None
+        # Pro Rufzeichen die sortierten Indizes aller Zeilen, in denen es
+        # vorkommt (LRU: zuletzt benutzte Rufzeichen stehen am Ende)
+        self._occurrence_cache: "OrderedDict[str, List[int]]" = OrderedDict()
+        # RR73-Index fuer Navigatoren ohne eigenen Index
+        self._rr73_index: Optional[List[int]] = None
+        # Aktuell angezeigter Block; None, wenn ein Shift um eine Zeile
+        # nicht inkrementell ausgefuehrt werden kann
+        self._block: Optional[List[str]] = None
+        # Markierungen je (Zeilenindex, Rufzeichen)
+        self._span_cache = LineSpanCache()
+        # Suche: Index der Nachrichtenwoerter (wird beim ersten Suchen im
+        # Hintergrund aufgebaut) oder laufende Regex-Suche
+        self._search_index: Optional[SearchIndex] = None
+        self._index_builder: Optional[IndexBuilder] = None
+        self._regex_search: Optional[RegexSearch] = None
+        self._search_token: Optional[str] = None
+        self._search_hits: Sequence[int] = []
+        self._current_hit: Optional[int] = None
+        # Folge-Modus (sub_live_tail): steht das Fenster am Listenende,
+        # rueckt es mit angehaengten Zeilen mit
+        self.follow_end = False
 
         self.root = tk.Tk()
         self.root.title("Lines Viewer")
@@ -58,6 +99,7 @@ class LinesViewer:
         # Tags fuer Hervorhebung im Text-Widget
         self.text.tag_config("other_cs", foreground="red")
         self.text.tag_config("mark_suffix", foreground="red")
+        self.text.tag_config("search_hit", background="yellow")
 
         # Labels fuer Pfeile / Zaehler
         self.label_above = tk.Label(self.root, text="", fg="red")
@@ -73,6 +115,28 @@ class LinesViewer:
         self.entry_start = tk.Entry(self.root, width=10)
         self.entry_start.grid(row=1, column=1, padx=5, pady=2)
 
+        # Suche nach Rufzeichen (Index) oder regulaerem Ausdruck
+        tk.Label(self.root, text="Search:").grid(row=1, column=2, sticky="e", padx=5, pady=2)
+        self.entry_search = tk.Entry(self.root, width=14)
+        self.entry_search.grid(row=1, column=3, padx=5, pady=2)
+        self.entry_search.bind("<Return>", lambda event: self.search())
+        self.search_regex = tk.BooleanVar(self.root, value=False)
+        tk.Checkbutton(self.root, text="Regex", variable=self.search_regex).grid(
+            row=1, column=4, sticky="w", padx=5, pady=2
+        )
+        tk.Button(
+            self.root,
+            text="Prev hit",
+            command=self.search_prev,
+        ).grid(row=1, column=5, padx=5, pady=2, sticky="ew")
+        tk.Button(
+            self.root,
+            text="Next hit",
+            command=self.search_next,
+        ).grid(row=1, column=6, padx=5, pady=2, sticky="ew")
+        self.label_hits = tk.Label(self.root, text="")
+        self.label_hits.grid(row=1, column=7, padx=5, pady=2, sticky="w")
+
         # Buttons Grundfunktionen
         tk.Button(
             self.root,
@@ -126,14 +190,120 @@ class LinesViewer:
             command=self.root.destroy,
         ).grid(row=2, column=7, padx=5, pady=5, sticky="ew")
 
+        # Statuszeile, z.B. Fortschritt beim Filtern im Hintergrund
+        self.label_status = tk.Label(self.root, text="", anchor="w")
+        self.label_status.grid(row=3, column=0, columnspan=8, padx=5, pady=2, sticky="ew")
+
+        # Tastatur und Mausrad (auch ueber dem Text-Widget)
+        for widget in (self.text, self.root):
+            self._bind_scroll_keys(widget)
+
         # Initial: erste 20 Zeilen anzeigen
         self.show_first_20()
 
     def run(self) -> None:
         self.root.mainloop()
+        self._span_cache.publish()
+
+    @property
+    def span_cache(self) -> LineSpanCache:
+        """Cache der Zeilenzerlegung (Zaehler, Groesse); austauschbar, z.B. fuer Zeitmessungen."""
+        return self._span_cache
+
+    @span_cache.setter
+    def span_cache(self, cache: LineSpanCache) -> None:
+        self._span_cache = cache
+
+    def set_status(self, text: str) -> None:
+        self.label_status.config(text=text)
+
+    def on_lines_appended(self, first_new_index: int) -> None:
+        """
+        Wird aufgerufen, nachdem der Navigator ab first_new_index um neue
+        Zeilen erweitert wurde. Die gespeicherten Indizes werden nur um die
+        neuen Zeilen ergaenzt; neu gezeichnet wird nur, wenn das Fenster
+        in den neuen Bereich hineinreicht; mit follow_end rueckt ein Fenster,
+        das bisher das Listenende zeigte, ans neue Ende.
+        """
+        total = self.get_total_lines()
+        if total <= first_new_index:
+            return
+        new_lines = self.navigator.window(first_new_index, total - first_new_index)
+
+        for callsign, occurrences in self._occurrence_cache.items():
+            occurrences.extend(
+                first_new_index + i for i, line in enumerate(new_lines) if callsign in line
+            )
+        if self._rr73_index is not None:
+            self._rr73_index.extend(
+                first_new_index + i for i in build_rr73_index(new_lines, self.own_callsign)
+            )
+        if self._search_index is not None:
+            self._search_index.extend(new_lines)
+            if self._search_token is not None:
+                self._search_hits = self._search_index.hits(self._search_token)
+                self._update_hits_label()
+
+        at_end = self.current_start_index + VISIBLE_LINES >= first_new_index
+        if self.follow_end and at_end and total > VISIBLE_LINES:
+            self.show_lines(total - VISIBLE_LINES)
+        elif self.current_start_index + VISIBLE_LINES > first_new_index:
+            self.show_lines(self.current_start_index)
+        else:
+            self.update_arrow_labels()
+            self.update_shift_buttons_state()
+
+    def _bind_scroll_keys(self, widget) -> None:
+        """
+        Bindet Tasten und Mausrad. "break" verhindert, dass das Text-Widget
+        selbst scrollt oder die Bindung am Hauptfenster ein zweites Mal greift.
+        In Eingabefeldern (Show from, Suche) behalten Pfeile, Pos1 und Ende
+        ihre normale Bedeutung; die Bindung am Hauptfenster greift dort nicht.
+        """
+        def bound(action):
+            def handler(event):
+                if isinstance(event.widget, tk.Entry):
+                    return None
+                action()
+                return "break"
+            return handler
+
+        widget.bind("<Up>", bound(lambda: self.scroll_lines(-1)))
+        widget.bind("<Down>", bound(lambda: self.scroll_lines(1)))
+        widget.bind("<Prior>", bound(lambda: self.scroll_lines(-VISIBLE_LINES)))
+        widget.bind("<Next>", bound(lambda: self.scroll_lines(VISIBLE_LINES)))
+        widget.bind("<Home>", bound(self.show_first_20))
+        widget.bind("<End>", bound(self.show_last_20))
+        # Windows / macOS liefern delta, X11 die Buttons 4 und 5
+        widget.bind("<MouseWheel>", lambda event: self.on_mouse_wheel(event.delta))
+        widget.bind("<Button-4>", bound(lambda: self.scroll_lines(-1)))
+        widget.bind("<Button-5>", bound(lambda: self.scroll_lines(1)))
+
+    def on_mouse_wheel(self, delta: int) -> str:
+        if delta > 0:
+            self.scroll_lines(-1)
+        elif delta < 0:
+            self.scroll_lines(1)
+        return "break"
+
+    def scroll_lines(self, delta: int) -> None:
+        """
+        Verschiebt das Fenster um delta Zeilen, aber nur so weit, wie es
+        die Shift-Buttons erlauben wuerden (sonst bleibt die Anzeige stehen).
+        """
+        if delta < 0 and self.btn_shift_minus.cget("state") == tk.DISABLED:
+            return
+        if delta > 0 and self.btn_shift_plus.cget("state") == tk.DISABLED:
+            return
+        if delta == -1:
+            self.shift_minus_one()
+        elif delta == 1:
+            self.shift_plus_one()
+        else:
+            self.show_lines(self.current_start_index + delta)
 
     def get_total_lines(self) -> int:
-        return len(getattr(self.navigator, "_lines", []))
+        return len(self.navigator)
 
     # ------------------------------------------------------------------
     # Block-Erzeugung und Anzeige
@@ -145,24 +315,22 @@ class LinesViewer:
         Negative Bereiche vor Index 0 und Bereiche hinter dem Listenende
         werden als leere Zeilen dargestellt.
         """
-        lines = getattr(self.navigator, "_lines", [])
-        total = len(lines)
-        result: List[str] = []
+        # Nur die vorhandenen Zeilen werden beim Navigator angefragt
+        lines = self.navigator.window(start_index, count)
+        first_real = max(0, -start_index)
 
-        for offset in range(count):
-            idx = start_index + offset
-            if 0 <= idx < total:
-                result.append(lines[idx])
-            else:
-                # Zeile existiert nicht -> Leerzeile
-                result.append("\n")
-        return result
+        # Zeilen, die nicht existieren -> Leerzeilen
+        result: List[str] = ["\n"] * first_real
+        result.extend(lines)
+        result.extend(["\n"] * (count - len(result)))
+        return result[:count]
 
     def highlight_other_callsign_and_suffix(self, block: List[str]) -> None:
         """
         Markiert alle Vorkommen von self.other_callsign in den
         aktuell im Text-Widget eingefuegten Zeilen mit roter Schrift
         und haengt bei Zeilen mit other_callsign den visuellen Suffix an.
+        Die Positionen kommen aus dem Span-Cache, nicht aus dem Widget.
         """
         # Tags entfernen
         self.text.tag_remove("other_cs", "1.0", tk.END)
@@ -171,45 +339,70 @@ class LinesViewer:
         if not self.other_callsign:
             return
 
-        cs = self.other_callsign
-        cs_len = len(cs)
-
-        # Jede sichtbare Zeile durchsuchen
+        # Jede sichtbare Zeile markieren; alle Bereiche mit einem tag_add
+        ranges: List[str] = []
+        line_no = 1
+        column = 0
         for i, line in enumerate(block):
-            if not line.strip():
-                continue
-
-            # Position der Zeile im Widget
-            line_no = i + 1
-            # Wir holen uns den Text genau dieser Zeile aus dem Widget,
-            # damit auch vorherige Suffixe sicher beruecksichtigt werden.
-            current_line_text = self.text.get(f"{line_no}.0", f"{line_no}.end")
-
-            # 1) other_callsign markieren
-            start_pos = 0
-            while True:
-                idx = current_line_text.find(cs, start_pos)
-                if idx == -1:
-                    break
-                start_index = f"{line_no}.{idx}"
-                end_index = f"{line_no}.{idx + cs_len}"
-                self.text.tag_add("other_cs", start_index, end_index)
-                start_pos = idx + cs_len
-
-            # 2) Nur wenn other_callsign in dieser Zeile vorkommt,
-            #    visualen Suffix "     ***" anhaengen (reine Anzeige).
-            if cs in current_line_text:
-                # An das Ende der Zeile (nicht ganze Zeile loeschen)
-                self.text.insert(f"{line_no}.end", OTHER_MARK_SUFFIX)
-                # Neu eingefuegten Suffix als rot taggen
-                start_index = f"{line_no}.{len(current_line_text)}"
-                end_index = f"{line_no}.{len(current_line_text) + len(OTHER_MARK_SUFFIX)}"
-                self.text.tag_add("mark_suffix", start_index, end_index)
+            if line.strip():
+                ranges.extend(
+                    self._highlight_line(line_no, self.current_start_index + i, line, column)
+                )
+            if line.endswith("\n"):
+                line_no += 1
+                column = 0
+            else:
+                # Ohne Zeilenende steht die naechste Blockzeile in derselben Widget-Zeile
+                column += len(line)
+        if ranges:
+            self.text.tag_add("other_cs", *ranges)
 
+    def _highlight_line(self, line_no: int, index: int, line: str, column: int = 0) -> List[str]:
+        """
+        Haengt an die Widget-Zeile line_no den roten Suffix an, falls die
+        Zeile mit Index index other_callsign enthaelt (reine Anzeige).
+        Rueckgabe: Anfang/Ende der Vorkommen fuer tag_add("other_cs", ...);
+        column ist die Spalte, an der die Zeile im Widget beginnt.
+        """
+        entry = self._span_cache.lookup(index, line, self.other_callsign)
+        if not entry.spans:
+            return []
+        # An das Ende der Zeile (nicht ganze Zeile loeschen), gleich mit rotem Tag
+        self.text.insert(f"{line_no}.end", OTHER_MARK_SUFFIX, "mark_suffix")
+        ranges = []
+        for start, end in entry.spans:
+            ranges.append(f"{line_no}.{column + start}")
+            ranges.append(f"{line_no}.{column + end}")
+        return ranges
+
+    def get_occurrence_index(self, callsign: str) -> List[int]:
+        """
+        Liefert die sortierten Indizes aller Zeilen, die callsign enthalten.
+        Der Index wird beim ersten Zugriff einmal aufgebaut und fuer die
+        zuletzt benutzten Rufzeichen aufbewahrt.
+        """
+        occurrences = self._occurrence_cache.get(callsign)
+        if occurrences is not None:
+            self._occurrence_cache.move_to_end(callsign)
+            return occurrences
+
+        # Navigatoren aus dem Ergebnis-Cache bringen den Index schon mit
+        if hasattr(self.navigator, "occurrence_index"):
+            occurrences = self.navigator.occurrence_index(callsign)
+        if occurrences is None:
+            occurrences = [i for i, line in enumerate(self.navigator) if callsign in line]
+
+        self._occurrence_cache[callsign] = occurrences
+        if len(self._occurrence_cache) > OCCURRENCE_CACHE_SIZE:
+            self._occurrence_cache.popitem(last=False)
+        return occurrences
+
+    @timed("viewer.update_arrow_labels")
     def update_arrow_labels(self) -> None:
         """
         Zaehlt in den nicht sichtbaren Zeilen oberhalb und unterhalb des aktuellen Fensters,
         wie oft other_callsign vorkommt, und zeigt ggf. rote Pfeile mit Anzahl an.
+        Die Anzahlen kommen per bisect aus dem Vorkommens-Index.
         """
         if not self.other_callsign:
             # Keine Pfeile anzeigen
@@ -217,27 +410,17 @@ class LinesViewer:
             self.label_below.config(text="")
             return
 
-        lines = getattr(self.navigator, "_lines", [])
-        total = len(lines)
-        cs = self.other_callsign
+        occurrences = self.get_occurrence_index(self.other_callsign)
 
         # Bereich des aktuellen Fensters in der Datenliste
         start = self.current_start_index
         end = self.current_start_index + VISIBLE_LINES - 1
 
         # Oberer Bereich: 0 .. start-1
-        count_above = 0
-        if total > 0:
-            for i in range(0, max(0, start)):
-                if cs in lines[i]:
-                    count_above += 1
+        count_above = bisect_left(occurrences, start)
 
         # Unterer Bereich: end+1 .. total-1
-        count_below = 0
-        if total > 0:
-            for i in range(min(total, end + 1), total):
-                if cs in lines[i]:
-                    count_below += 1
+        count_below = len(occurrences) - bisect_right(occurrences, end)
 
         # Pfeile aktualisieren
         if count_above > 0:
@@ -270,7 +453,6 @@ class LinesViewer:
             state_next = tk.DISABLED
         else:
             start = self.current_start_index
-            lines = getattr(self.navigator, "_lines", [])
 
             # Zaehle reale Zeilen im aktuellen Fenster
             visible_real = 0
@@ -296,6 +478,7 @@ class LinesViewer:
         self.btn_shift_minus.config(state=state_prev)
         self.btn_shift_plus.config(state=state_next)
 
+    @timed("viewer.show_lines")
     def show_lines(self, start_index: int) -> None:
         """
         Zeigt genau VISIBLE_LINES Zeilen an.
@@ -307,6 +490,7 @@ class LinesViewer:
         total = self.get_total_lines()
 
         self.text.delete("1.0", tk.END)
+        self._block = None
 
         if total == 0:
             for _ in range(VISIBLE_LINES):
@@ -325,8 +509,14 @@ class LinesViewer:
         for line in block:
             self.text.insert(tk.END, line)
 
+        # Inkrementelles Verschieben nur, wenn jede Zeile mit "\n" endet
+        # (sonst stimmen Block- und Widget-Zeilen nicht ueberein)
+        if all(line.endswith("\n") for line in block):
+            self._block = block
+
         # Anderes Rufzeichen hervorheben und Suffix anhaengen
         self.highlight_other_callsign_and_suffix(block)
+        self._highlight_search_hit()
 
         # Pfeile / Anzahlen aktualisieren
         self.update_arrow_labels()
@@ -334,6 +524,51 @@ class LinesViewer:
         # Shift-Buttons aktivieren/deaktivieren
         self.update_shift_buttons_state()
 
+    @timed("viewer.shift_lines")
+    def shift_lines(self, delta: int) -> None:
+        """
+        Verschiebt das Fenster um +1 oder -1 Zeile. Statt alles neu
+        aufzubauen, wird am einen Rand eine Zeile geloescht, am anderen
+        eine eingefuegt und nur diese neu markiert; Tags und Suffixe der
+        uebrigen Zeilen wandern im Text-Widget mit.
+        """
+        block = self._block
+        new_start = self.current_start_index + delta
+        if block is None or delta not in (-1, 1) or self.get_total_lines() == 0:
+            self.show_lines(new_start)
+            return
+
+        if delta > 0:
+            new_line = self.get_block_with_padding(new_start + VISIBLE_LINES - 1, 1)[0]
+        else:
+            new_line = self.get_block_with_padding(new_start, 1)[0]
+        if not new_line.endswith("\n"):
+            self.show_lines(new_start)
+            return
+
+        if delta > 0:
+            self.text.delete("1.0", "2.0")
+            line_no = VISIBLE_LINES
+            block.pop(0)
+            block.append(new_line)
+        else:
+            self.text.delete(f"{VISIBLE_LINES}.0", f"{VISIBLE_LINES + 1}.0")
+            line_no = 1
+            block.pop()
+            block.insert(0, new_line)
+        self.text.insert(f"{line_no}.0", new_line)
+        self.current_start_index = new_start
+
+        if new_line.strip() and self.other_callsign:
+            ranges = self._highlight_line(line_no, new_start + line_no - 1, new_line)
+            if ranges:
+                self.text.tag_add("other_cs", *ranges)
+        self._highlight_search_hit()
+
+        # Pfeile / Anzahlen und Shift-Buttons wie bei show_lines
+        self.update_arrow_labels()
+        self.update_shift_buttons_state()
+
     def show_first_20(self) -> None:
         self.show_lines(0)
 
@@ -363,39 +598,46 @@ class LinesViewer:
         """
         Verschiebt den angezeigten Block um 1 Zeile nach oben (Rueckwaerts).
         """
-        new_start = self.current_start_index - 1
-        self.show_lines(new_start)
+        self.shift_lines(-1)
 
     def shift_plus_one(self) -> None:
         """
         Verschiebt den angezeigten Block um 1 Zeile nach unten (Vorwaerts).
         """
-        new_start = self.current_start_index + 1
-        self.show_lines(new_start)
+        self.shift_lines(1)
 
     # ------------------------------------------------------------------
     # RR73-Funktionen und Rufzeichen-Erkennung
     # ------------------------------------------------------------------
 
+    def get_rr73_index(self) -> List[int]:
+        """
+        Sortierte Indizes der RR73-Zeilen eigener QSOs. Stammt vom Navigator,
+        falls dieser einen RR73-Index anbietet, sonst einmalig selbst erstellt.
+        """
+        if hasattr(self.navigator, "rr73_indices"):
+            return self.navigator.rr73_indices(self.own_callsign)
+        if self._rr73_index is None:
+            self._rr73_index = build_rr73_index(self.navigator, self.own_callsign)
+        return self._rr73_index
+
     def find_next_rr73_index(self, start_from: int) -> Optional[int]:
         """
-        Sucht vorwaerts ab start_from (exklusive) die naechste Zeile mit "RR73".
+        Sucht vorwaerts ab start_from (exklusive) die naechste RR73-Zeile
+        eines eigenen QSOs (bisect im RR73-Index).
         """
-        lines = getattr(self.navigator, "_lines", [])
-        for i in range(start_from + 1, len(lines)):
-            if "RR73" in lines[i]:
-                return i
-        return None
+        indices = self.get_rr73_index()
+        pos = bisect_right(indices, start_from)
+        return indices[pos] if pos < len(indices) else None
 
     def find_prev_rr73_index(self, start_from: int) -> Optional[int]:
         """
-        Sucht rueckwaerts ab start_from (exklusive) die vorherige Zeile mit "RR73".
+        Sucht rueckwaerts ab start_from (exklusive) die vorherige RR73-Zeile
+        eines eigenen QSOs (bisect im RR73-Index).
         """
-        lines = getattr(self.navigator, "_lines", [])
-        for i in range(start_from - 1, -1, -1):
-            if "RR73" in lines[i]:
-                return i
-        return None
+        indices = self.get_rr73_index()
+        pos = bisect_left(indices, start_from)
+        return indices[pos - 1] if pos > 0 else None
 
     def get_current_rr73_ref_index(self) -> int:
         """
@@ -419,31 +661,24 @@ class LinesViewer:
         own_callsign ist eines von cs1 oder cs2.
         Rueckgabe: das andere Rufzeichen oder None.
         """
-        parts = line.strip().split()
-        if len(parts) < 3:
-            return None
-        if parts[-1] != "RR73":
-            return None
-        cs1 = parts[-3]
-        cs2 = parts[-2]
-
-        if cs1.upper() == self.own_callsign.upper():
-            return cs2
-        if cs2.upper() == self.own_callsign.upper():
-            return cs1
-        return None
+        return extract_other_callsign_from_rr73_line(line, self.own_callsign)
 
     def update_other_callsign_from_index(self, rr73_index: int) -> None:
         """
         Ermittelt aus der RR73-Zeile an rr73_index das andere Rufzeichen
         und speichert es in self.other_callsign.
         """
-        lines = getattr(self.navigator, "_lines", [])
-        if 0 <= rr73_index < len(lines):
-            line = lines[rr73_index]
-            other = self.extract_other_callsign_from_rr73_line(line)
+        if 0 <= rr73_index < self.get_total_lines():
+            if hasattr(self.navigator, "other_callsign_at"):
+                # Mit records ohne Zerlegen der Zeile
+                other = self.navigator.other_callsign_at(rr73_index, self.own_callsign)
+            else:
+                line = self.navigator.window(rr73_index, 1)[0]
+                other = self.extract_other_callsign_from_rr73_line(line)
             if other:
                 self.other_callsign = other
+                # Vorkommens-Index beim ersten Auswaehlen aufbauen
+                self.get_occurrence_index(other)
 
     def jump_next_rr73(self) -> None:
         """
@@ -488,25 +723,168 @@ class LinesViewer:
 
         start_index = target_index - RR73_POS_INDEX
         self.show_lines(start_index)
+
+    # ------------------------------------------------------------------
+    # Suche
+    # ------------------------------------------------------------------
+
+    def _search_lines(self) -> Callable[[], Sequence[str]]:
+        # Die Zeilen werden erst im Such-Thread gelesen. Navigatoren mit
+        # Datei oder Datenbank liefern dafuer einen eigenen Leser
+        # (detached_lines), sonst genuegt eine Kopie der Liste, die nur
+        # am Ende waechst.
+        navigator = self.navigator
+        total = self.get_total_lines()
+        detached_lines = getattr(navigator, "detached_lines", None)
+        if detached_lines is not None:
+            return lambda: detached_lines(total)
+        return lambda: navigator.window(0, total)
+
+    def search(self) -> None:
+        """
+        Startet eine neue Suche mit dem Text aus dem Suchfeld:
+        ohne "Regex" nach einem ganzen Wort der Nachricht (Rufzeichen,
+        Locator ...) ueber den Index, mit "Regex" als regulaerer Ausdruck
+        in einem Hintergrund-Thread. Angezeigt wird der erste Treffer ab
+        dem aktuellen Fenster.
+        """
+        if self._regex_search is not None:
+            self._regex_search.stop()
+            self._regex_search = None
+        self._search_token = None
+        self._search_hits = []
+        self._current_hit = None
+        self.text.tag_remove("search_hit", "1.0", tk.END)
+
+        query = self.entry_search.get().strip()
+        if not query:
+            self._update_hits_label()
+            return
+
+        if self.search_regex.get():
+            try:
+                search = RegexSearch(self._search_lines(), query)
+            except re.error as exc:
+                self.label_hits.config(text="")
+                self.set_status(f"Ungueltiger Ausdruck: {exc}")
+                return
+            self._regex_search = search.start()
+            self._search_hits = search.hits
+            self._update_hits_label()
+            self.root.after(SEARCH_POLL_MS, lambda: self._poll_regex_search(search))
+            return
+
+        self._search_token = query.upper()
+        if self._search_index is not None:
+            self._search_hits = self._search_index.hits(self._search_token)
+            self._show_first_hit()
+        elif self._index_builder is None:
+            self._index_builder = IndexBuilder(self._search_lines()).start()
+            self.root.after(SEARCH_POLL_MS, self._poll_index_builder)
+        self._update_hits_label()
+
+    def _poll_index_builder(self) -> None:
+        builder = self._index_builder
+        index = builder.poll()
+        if not builder.done:
+            self.root.after(SEARCH_POLL_MS, self._poll_index_builder)
+            return
+        if index is None:
+            self._index_builder = None
+            self.set_status(f"Fehler beim Aufbau des Suchindex: {builder.error}")
+            return
+
+        # Waehrend des Aufbaus angehaengte Zeilen nachtragen
+        total = self.get_total_lines()
+        if total > index.line_count:
+            index.extend(self.navigator.window(index.line_count, total - index.line_count))
+        self._search_index = index
+        if self._search_token is not None:
+            self._search_hits = index.hits(self._search_token)
+            self._show_first_hit()
+        self._update_hits_label()
+
+    def _poll_regex_search(self, search: RegexSearch) -> None:
+        if search is not self._regex_search:
+            # Inzwischen abgebrochen oder durch eine neue Suche ersetzt
+            return
+        search.poll()
+        if self._current_hit is None:
+            hit = next_hit(search.hits, self.current_start_index - 1)
+            if hit is None and search.done and search.hits:
+                hit = search.hits[0]
+            if hit is not None:
+                self._show_hit(hit)
+        if search.error is not None:
+            self.set_status(f"Fehler bei der Suche: {search.error}")
+        self._update_hits_label()
+        if not search.done:
+            self.root.after(SEARCH_POLL_MS, lambda: self._poll_regex_search(search))
+
+    def _show_first_hit(self) -> None:
+        hits = self._search_hits
+        hit = next_hit(hits, self.current_start_index - 1)
+        if hit is None and hits:
+            hit = hits[0]
+        if hit is not None:
+            self._show_hit(hit)
+
+    def _show_hit(self, hit: int) -> None:
+        """Zeigt den Treffer an derselben Position wie eine RR73-Zeile."""
+        self._current_hit = hit
+        self.show_lines(hit - RR73_POS_INDEX)
+        self._update_hits_label()
+
+    def search_next(self) -> None:
+        hit = next_hit(self._search_hits, self.current_start_index + RR73_POS_INDEX)
+        if hit is not None:
+            self._show_hit(hit)
+
+    def search_prev(self) -> None:
+        hit = prev_hit(self._search_hits, self.current_start_index + RR73_POS_INDEX)
+        if hit is not None:
+            self._show_hit(hit)
+
+    def _highlight_search_hit(self) -> None:
+        """Hinterlegt die Zeile des aktuellen Treffers gelb, falls sichtbar."""
+        hit = self._current_hit
+        if hit is None:
+            return
+        self.text.tag_remove("search_hit", "1.0", tk.END)
+        line_no = hit - self.current_start_index + 1
+        if 1 <= line_no <= VISIBLE_LINES:
+            self.text.tag_add("search_hit", f"{line_no}.0", f"{line_no}.end")
+
+    def _update_hits_label(self) -> None:
+        hits = self._search_hits
+        if self._search_token is None and self._regex_search is None:
+            text = ""
+        elif self._search_token is not None and self._search_index is None:
+            text = "Building index..."
+        elif self._current_hit is not None and hits:
+            text = f"{bisect_left(hits, self._current_hit) + 1} / {len(hits)}"
+        else:
+            text = f"{len(hits)} hits"
+        if self._regex_search is not None and not self._regex_search.done:
+            text += " ..."
+        self.label_hits.config(text=text)
 # Ende der Klasse LinesViewer -----------------------------
 
 
 # Beispiel, wie dieses Modul mit einem Navigator verwendet werden kann
 if __name__ == "__main__":
-    class DummyNavigator:
-        def __init__(self) -> None:
-            self._lines = []
-            # Kuenstliche Daten mit own_callsign = "HB9EVT"
-            for i in range(1, 60):
-                if i in (7, 15, 25, 33, 48):
-                    self._lines.append(
-                        f"251208_0414{i:02d}     3.573 Rx FT8    -12  0.4 1030 HB9EVT DJ2MS RR73\n"
-                    )
-                else:
-                    self._lines.append(
-                        f"251208_0414{i:02d}     3.573 Rx FT8    -10  0.4 1030 HB9EVT DJ2MS {i}\n"
-                    )
-
-    navigator = DummyNavigator()
+    # Kuenstliche Daten mit own_callsign = "HB9EVT"
+    dummy_lines = []
+    for i in range(1, 60):
+        if i in (7, 15, 25, 33, 48):
+            dummy_lines.append(
+                f"251208_0414{i:02d}     3.573 Rx FT8    -12  0.4 1030 HB9EVT DJ2MS RR73\n"
+            )
+        else:
+            dummy_lines.append(
+                f"251208_0414{i:02d}     3.573 Rx FT8    -10  0.4 1030 HB9EVT DJ2MS {i}\n"
+            )
+
+    navigator = LineNavigator(dummy_lines, own_callsign="HB9EVT")
     viewer = LinesViewer(navigator, own_callsign="HB9EVT")
-    viewer.run()
+    viewer.run()
\ No newline at end of file
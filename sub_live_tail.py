@@ -0,0 +1,272 @@
+"""
+LICENSE
+==========
+This file is part of the project <Check_yr_WSJT_X_log_with_ALL_TXT>
+Licensed under the MIT License - see the LICENSE file for details.
+
+Developed by Pepe HB9EVT
+with support from my lovely auntie A.I. Perplexity, 2025
+
+I would appreciate a short email if you use this software:
+github2025  -at-  pepemail.ch
+"""
+
+"""
+live_tail.py
+============
+Folge-Modus: der Viewer bleibt waehrend des Betriebs offen und zeigt neue
+Zeilen mit dem eigenen Rufzeichen, sobald WSJT-X sie an ALL.TXT anhaengt.
+
+LiveTail liest zuerst den vorhandenen Inhalt (wie BackgroundFilter) und
+wartet danach auf angehaengte Bytes:
+-- unter Linux per inotify (ueber ctypes, ohne Zusatzpaket); der Thread
+   schlaeft, bis die Datei geschrieben wird,
+-- sonst per os.stat alle STAT_INTERVAL Sekunden.
+Die neuen Bytes laufen durch dieselbe CQ-Paarung wie bei
+filter_lines_with_callsign. Nur vollstaendige Zeilen werden ausgewertet,
+eine angefangene letzte Zeile wartet auf ihr Zeilenende.
+
+Die zurueckgehaltene CQ-Zeile wird erst beim Beenden (stop) in die
+Output-Datei geschrieben; diese entspricht dann einem vollstaendigen Lauf
+ueber den bis dahin gelesenen Inhalt.
+Wird ALL.TXT gekuerzt oder ersetzt, liest LiveTail die neue Datei ab
+Beginn und haengt deren Treffer an.
+"""
+
+
+# IMPORTS
+import ctypes
+import os
+import select
+import struct
+import sys
+import threading
+from pathlib import Path
+from typing import List
+
+from sub_background_filter import BLOCK_BYTES, BackgroundFilter, follow_in_viewer
+from sub_compress_data import CqPairing, LineNavigator, _scan_mapped
+
+
+# KONSTANTEN
+STAT_INTERVAL = 1.0     # Sekunden zwischen zwei os.stat ohne inotify
+LIVE_POLL_MS = 250      # Abstand, in dem der Viewer die Queue abfragt
+
+# Aus <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_DELETE_SELF | IN_MOVE_SELF
+_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len (danach der Name)
+
+
+# KLASSE InotifyWatch
+class InotifyWatch:
+    """
+    Wartet per inotify auf Aenderungen einer Datei. Wirft OSError, wenn
+    inotify nicht verfuegbar ist (dann StatWatch verwenden).
+    """
+
+    def __init__(self, path: Path, wake_fd: int) -> None:
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify gibt es nur unter Linux")
+        self.path = path
+        self._wake_fd = wake_fd
+        self._libc = ctypes.CDLL(None, use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 fehlgeschlagen")
+        self._wd = -1
+        self.rewatch()
+
+    def rewatch(self) -> None:
+        """Beobachtet die Datei unter path (erneut, z.B. nach dem Ersetzen)."""
+        self._wd = self._libc.inotify_add_watch(self._fd, os.fsencode(self.path), WATCH_MASK)
+
+    def wait(self) -> None:
+        """Schlaeft bis zur naechsten Aenderung (oder bis stop den Thread weckt)."""
+        # Ohne gueltige Beobachtung (Datei gerade ersetzt) wie StatWatch warten
+        timeout = None if self._wd >= 0 else STAT_INTERVAL
+        readable, _, _ = select.select([self._fd, self._wake_fd], [], [], timeout)
+        if self._fd not in readable:
+            if self._wd < 0:
+                self.rewatch()
+            return
+        try:
+            events = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        pos = 0
+        while pos < len(events):
+            _, mask, _, name_len = _EVENT.unpack_from(events, pos)
+            pos += _EVENT.size + name_len
+            if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                # Die Beobachtung gilt der alten Datei; neue Datei neu beobachten
+                self.rewatch()
+
+    def close(self) -> None:
+        os.close(self._fd)
+# Ende der Klasse InotifyWatch -----------------------------
+
+
+# KLASSE StatWatch
+class StatWatch:
+    """Ersatz ohne inotify: wartet einfach STAT_INTERVAL Sekunden."""
+
+    def __init__(self, stop_event: threading.Event, interval: float = STAT_INTERVAL) -> None:
+        self._stop = stop_event
+        self.interval = interval
+
+    def wait(self) -> None:
+        self._stop.wait(self.interval)
+
+    def close(self) -> None:
+        pass
+# Ende der Klasse StatWatch -----------------------------
+
+
+# KLASSE LiveTail
+class LiveTail(BackgroundFilter):
+    """
+    Wie BackgroundFilter, endet aber nicht am Dateiende, sondern liefert
+    weiter angehaengte Treffer, bis stop() aufgerufen wird.
+    """
+
+    def __init__(
+        self,
+        callsign: str,
+        input_path: str | Path,
+        output_path: str | Path,
+        block_bytes: int = BLOCK_BYTES,
+        use_inotify: bool = True,
+    ) -> None:
+        super().__init__(callsign, input_path, output_path, block_bytes)
+        self.use_inotify = use_inotify
+        self.watch_mode = ""
+        self.restarts = 0
+        self.bytes_read = 0     # Offset hinter der letzten vollstaendigen Zeile
+        self._input = None
+        # stop() schreibt in diese Pipe und weckt so ein wartendes select;
+        # das Lese-Ende schliesst der Thread, das Schreib-Ende stop()
+        self._wake_read, self._wake_write = os.pipe()
+        self._wake_closed = False
+
+    def stop(self) -> None:
+        self._stop.set()
+        if not self._wake_closed:
+            self._wake_closed = True
+            try:
+                os.write(self._wake_write, b"x")
+            except OSError:
+                pass    # Thread ist schon beendet
+            os.close(self._wake_write)
+
+    def _make_watch(self):
+        if self.use_inotify:
+            try:
+                watch = InotifyWatch(self.input_path, self._wake_read)
+                self.watch_mode = "inotify"
+                return watch
+            except (OSError, AttributeError):
+                # AttributeError: libc ohne inotify-Funktionen
+                pass
+        self.watch_mode = "stat"
+        return StatWatch(self._stop)
+
+    def _run(self) -> None:
+        pairing = CqPairing(self.callsign)
+        watch = None
+        try:
+            watch = self._make_watch()
+            with self.output_path.open("w", encoding="utf-8") as out:
+                self._input = self.input_path.open("rb")
+                self._follow(out, pairing, watch)
+                tail: List[str] = []
+                pairing.flush(tail)
+                out.writelines(tail)
+        except BaseException as exc:    # Fehler an die Tk-Seite weitergeben
+            self.error = exc
+        finally:
+            if self._input is not None:
+                self._input.close()
+            if watch is not None:
+                watch.close()
+            os.close(self._wake_read)
+        # Die bei stop geschriebene CQ-Zeile bekommt der Viewer nicht mehr
+        self._queue.put(([], self.bytes_read, True))
+
+    def _follow(self, out, pairing: CqPairing, watch) -> None:
+        carry = b""
+        while not self._stop.is_set():
+            # Alles seit dem letzten Lesen Angehaengte, ein Paket pro Block
+            while not self._stop.is_set():
+                block = self._input.read(self.block_bytes)
+                if not block:
+                    break
+                data = carry + block
+                # Nur vollstaendige Zeilen auswerten
+                end = data.rfind(b"\n") + 1
+                carry = data[end:]
+                new_lines: List[str] = []
+                if end:
+                    _scan_mapped(data, self.callsign, pairing, new_lines, 0, end)
+                    self.bytes_read += end
+                    out.writelines(new_lines)
+                    out.flush()
+                self._queue.put((new_lines, self.bytes_read, False))
+
+            watch.wait()
+            if self._replaced():
+                # Gekuerzt oder ersetzt: neue Datei von vorne lesen
+                self._input.close()
+                self._input = self.input_path.open("rb")
+                self.restarts += 1
+                self.bytes_read = 0
+                carry = b""
+
+    def _replaced(self) -> bool:
+        try:
+            current = os.stat(self.input_path)
+        except FileNotFoundError:
+            return False    # Noch keine neue Datei, weiter warten
+        opened = os.fstat(self._input.fileno())
+        if (current.st_dev, current.st_ino) != (opened.st_dev, opened.st_ino):
+            return True
+        return opened.st_size < self._input.tell()
+
+    def progress_text(self) -> str:
+        mib = 1024 * 1024
+        if self.error is not None:
+            return f"Fehler beim Verfolgen: {self.error}"
+        if self.done:
+            return f"Verfolgen beendet: {self.bytes_scanned / mib:.1f} MiB gelesen"
+        restarted = f", {self.restarts}x neu begonnen" if self.restarts else ""
+        return f"Live ({self.watch_mode}): {self.bytes_scanned / mib:.1f} MiB gelesen{restarted}"
+# Ende der Klasse LiveTail -----------------------------
+
+
+def follow_live(viewer, live_tail: LiveTail, poll_ms: int = LIVE_POLL_MS) -> None:
+    """
+    Zeigt die Treffer von live_tail im Viewer an; steht das Fenster am
+    Listenende, rueckt es mit den neuen Zeilen mit.
+    """
+    viewer.follow_end = True
+    follow_in_viewer(viewer, live_tail, poll_ms=poll_ms)
+# ENDE Funktion follow_live ------------
+
+
+# Beispielaufruf
+if __name__ == "__main__":
+    from sub_lines_viewer import LinesViewer
+
+    navigator = LineNavigator([], own_callsign="HB9EVT")
+    live_tail = LiveTail("HB9EVT", "ALL.TXT", "filtered_lines.txt")
+    viewer = LinesViewer(navigator, "HB9EVT")
+    follow_live(viewer, live_tail)
+    viewer.run()
+    live_tail.stop()
+    live_tail.join()
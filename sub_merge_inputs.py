@@ -0,0 +1,159 @@
+"""
+LICENSE
+==========
+This file is part of the project <Check_yr_WSJT_X_log_with_ALL_TXT>
+Licensed under the MIT License - see the LICENSE file for details.
+
+Developed by Pepe HB9EVT
+with support from my lovely auntie A.I. Perplexity, 2025
+
+I would appreciate a short email if you use this software:
+github2025  -at-  pepemail.ch
+"""
+
+"""
+merge_inputs.py
+===============
+ALL.TXT mehrerer Stationen / Empfaenger zusammenfuehren, die gleichzeitig
+laufen und daher weitgehend dieselben Dekodierungen enthalten.
+
+-- Jede Eingabe (auch komprimiert, siehe sub_archive_input) wird blockweise
+   gelesen; weiter gereicht werden nur die Zeilen mit dem Rufzeichen.
+   Das genuegt, weil Duplikate dieselbe Nachricht haben und damit
+   entweder beide das Rufzeichen enthalten oder keines.
+-- heapq.merge fuehrt die nach Zeitstempel geordneten Zeilen zusammen
+   (k-Wege-Merge ueber einen Heap mit einer Zeile pro Eingabe).
+-- Zeilen mit gleichem Zeitstempel, gleicher Frequenz und gleicher
+   Nachricht gelten als Duplikate; behalten wird die erste (in der
+   Reihenfolge der Eingaben). SNR, DT und DF unterscheiden sich zwischen
+   den Empfaengern und zaehlen nicht.
+-- Der zusammengefuehrte Strom laeuft durch die CQ-Paarung.
+
+Im Speicher liegen pro Eingabe nur ein Block und dessen Treffer sowie die
+Schluessel der Zeilen mit dem aktuellen Zeitstempel, unabhaengig von der
+Groesse der Dateien.
+"""
+
+
+# IMPORTS
+import heapq
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Iterator, List, Tuple
+
+from sub_archive_input import READ_BLOCK, expand_inputs, open_input
+from sub_compress_data import CqPairing, _scan_mapped
+from sub_line_records import HEADER_FIELDS, TIMESTAMP_LEN
+from sub_stats import STATS
+
+
+# KONSTANTEN
+DEDUP_TIMESTAMPS = 64   # Zeitstempel, deren Schluessel fuer die Duplikatsuche gemerkt werden
+
+
+# KLASSE _NoPairing
+class _NoPairing:
+    """Wie CqPairing.feed, gibt aber jede Zeile sofort weiter (Paarung erst nach dem Merge)."""
+
+    def feed(self, line: str, result_lines: List[str]) -> None:
+        result_lines.append(line)
+# Ende der Klasse _NoPairing -----------------------------
+
+
+_NO_PAIRING = _NoPairing()
+
+
+def iter_matching_lines(
+    path: str | Path,
+    callsign: str,
+    block_bytes: int = READ_BLOCK,
+) -> Iterator[str]:
+    """
+    Zeilen einer Datei mit dem Rufzeichen, in Dateireihenfolge und wie im
+    Textmodus dekodiert; jede Zeile endet mit einem Zeilenende.
+    """
+    carry = b""
+    with open_input(path) as f:
+        while True:
+            block = f.read(block_bytes)
+            STATS.add("bytes_read", len(block))
+            data = carry + block if carry else block
+            if block:
+                end = data.rfind(b"\n") + 1
+            else:
+                end = len(data)
+            lines: List[str] = []
+            _scan_mapped(data, callsign, _NO_PAIRING, lines, 0, end)
+            for line in lines:
+                yield line if line.endswith("\n") else line + "\n"
+            carry = data[end:]
+            if not block:
+                return
+
+
+def duplicate_key(line: str) -> Tuple[str, ...]:
+    """(Zeitstempel, Frequenz, Nachricht); ohne Kopffelder die ganze Zeile."""
+    words = line.split()
+    if len(words) <= HEADER_FIELDS:
+        return (line.rstrip("\n"),)
+    return (words[0], words[1], " ".join(words[HEADER_FIELDS:]))
+
+
+def merge_lines(streams: Iterable[Iterable[str]]) -> Iterator[str]:
+    """
+    k-Wege-Merge der nach Zeitstempel geordneten Zeilenstroeme ohne
+    Duplikate. Duplikate haben denselben Zeitstempel; gemerkt werden die
+    Schluessel der letzten DEDUP_TIMESTAMPS Zeitstempel, damit auch kleine
+    Rueckspruenge (Uhrkorrektur) in einer Eingabe erkannt werden.
+    heapq.merge gibt solche Zeilen in Eingabereihenfolge weiter.
+    """
+    seen: "OrderedDict[str, set]" = OrderedDict()
+    duplicates = 0
+    for line in heapq.merge(*streams, key=lambda line: line[:TIMESTAMP_LEN]):
+        timestamp = line[:TIMESTAMP_LEN]
+        keys = seen.get(timestamp)
+        if keys is None:
+            keys = seen[timestamp] = set()
+            if len(seen) > DEDUP_TIMESTAMPS:
+                seen.popitem(last=False)
+        key = duplicate_key(line)
+        if key in keys:
+            duplicates += 1
+            continue
+        keys.add(key)
+        yield line
+    STATS.add("merge_duplicates", duplicates)
+
+
+# Funktion zum Filtern zusammengefuehrter Eingaben
+def merge_scan(
+    inputs,
+    callsign: str,
+    pairing: CqPairing,
+    result_lines: List[str],
+    block_bytes: int = READ_BLOCK,
+) -> None:
+    """
+    Fuehrt alle Eingaben zusammen (ohne Duplikate) und gibt die Zeilen mit
+    dem Rufzeichen an die CQ-Paarung; Ersatz fuer scan_inputs bei
+    filter_lines_with_callsign(..., merge=True).
+    """
+    paths = expand_inputs(inputs)
+    STATS.add("input_files", len(paths))
+    streams = [iter_matching_lines(path, callsign, block_bytes) for path in paths]
+    for line in merge_lines(streams):
+        pairing.feed(line, result_lines)
+# ENDE Funktion merge_scan ------------
+
+
+# Beispielaufruf
+if __name__ == "__main__":
+    from sub_compress_data import filter_lines_with_callsign
+
+    navigator = filter_lines_with_callsign(
+        "HB9EVT",
+        ["station1/ALL.TXT", "station2/ALL.TXT", "sdr/ALL.TXT.gz"],
+        "filtered_lines.txt",
+        merge=True,
+    )
+    print("Anzahl Ergebniszeilen:", len(navigator))
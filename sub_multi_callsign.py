@@ -0,0 +1,225 @@
+"""
+LICENSE
+==========
+This file is part of the project <Check_yr_WSJT_X_log_with_ALL_TXT>
+Licensed under the MIT License - see the LICENSE file for details.
+
+Developed by Pepe HB9EVT
+with support from my lovely auntie A.I. Perplexity, 2025
+
+I would appreciate a short email if you use this software:
+github2025  -at-  pepemail.ch
+"""
+
+"""
+multi_callsign.py
+=================
+Filtert ALL.TXT in einem einzigen Durchlauf fuer mehrere Rufzeichen
+(z.B. Klubstation und persoenliche Rufzeichen). Pro Rufzeichen entstehen
+eine eigene Output-Datei und ein eigener LineNavigator; die CQ-Paarung
+laeuft fuer jedes Rufzeichen getrennt im selben Durchlauf.
+"""
+
+
+# IMPORTS
+import mmap
+import re
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from sub_compress_data import CqPairing, LineNavigator, _decode_raw_line
+
+
+# KONSTANTEN
+WINDOW_BYTES = 32 * 1024 * 1024     # Groesse der Abschnitte, die im Cache bleiben
+MULTI_FIND_LIMIT = 8                # Bis zu so vielen Rufzeichen: bytes.find je Rufzeichen
+OUTPUT_PATTERN = "filtered_lines_{callsign}.txt"
+
+
+# KLASSE AhoCorasick
+class AhoCorasick:
+    """
+    Aho-Corasick-Automat: findet in einem Durchlauf ueber den Text alle
+    enthaltenen Muster, auch ueberlappende (z.B. HB9EVT in HB9EVT/P).
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Set[str]] = [set()]
+
+        for pattern in patterns:
+            state = 0
+            for char in pattern:
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(set())
+                state = nxt
+            self._out[state].add(pattern)
+
+        # Fehlerverweise in Breitensuche aufbauen
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(char, 0)
+                self._out[nxt] |= self._out[self._fail[nxt]]
+
+    def find_all(self, text: str) -> Set[str]:
+        """Liefert die Menge aller in text vorkommenden Muster."""
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        found: Set[str] = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                found |= out[state]
+        return found
+# Ende der Klasse AhoCorasick -----------------------------
+
+
+def _candidate_hits(
+    data,
+    needles: List[bytes],
+    regex: Optional["re.Pattern[bytes]"],
+    start: int,
+    end: int,
+) -> List[int]:
+    """
+    Sortierte Trefferpositionen irgendeines Rufzeichens in data[start:end].
+    Wenige Rufzeichen werden einzeln mit bytes.find gesucht (memchr-schnell,
+    der Abschnitt liegt dabei im Cache), viele mit einem einzigen
+    Regex-Durchlauf, dessen Aufwand nicht von der Anzahl abhaengt.
+    """
+    hits: List[int] = []
+    if regex is not None:
+        for match in regex.finditer(data, start, end):
+            hits.append(match.start())
+        return hits
+
+    for needle in needles:
+        pos = data.find(needle, start, end)
+        while pos >= 0:
+            hits.append(pos)
+            pos = data.find(needle, pos + 1, end)
+    hits.sort()
+    return hits
+
+
+def _output_name(callsign: str, output_pattern: str) -> str:
+    # "/" aus Portabel-Rufzeichen (HB9EVT/P) ist in Dateinamen nicht erlaubt
+    return output_pattern.format(callsign=re.sub(r"[^A-Za-z0-9_-]", "_", callsign))
+
+
+def output_names(callsigns: Iterable[str], output_pattern: str = OUTPUT_PATTERN) -> Dict[str, str]:
+    """
+    Dateiname pro Rufzeichen (output_pattern mit {callsign} ersetzt).
+    Ergeben zwei Rufzeichen denselben Namen (z.B. HB9EVT/P und HB9EVT_P,
+    Gross-/Kleinschreibung zaehlt nicht), erhaelt das spaetere den
+    Zusatz _2, _3, ... hinter dem Rufzeichen.
+    """
+    names: Dict[str, str] = {}
+    used: Set[str] = set()
+    for callsign in dict.fromkeys(callsigns):
+        name = _output_name(callsign, output_pattern)
+        number = 1
+        while name.lower() in used:
+            number += 1
+            name = _output_name(f"{callsign}_{number}", output_pattern)
+        used.add(name.lower())
+        names[callsign] = name
+    return names
+
+
+# Funktion zum Filtern mehrerer Rufzeichen
+def filter_lines_with_callsigns(
+    callsigns: Iterable[str],
+    input_path: str | Path,
+    output_dir: str | Path = ".",
+    output_pattern: str = OUTPUT_PATTERN,
+) -> Dict[str, LineNavigator]:
+    """
+    Entspricht filter_lines_with_callsign fuer jedes Rufzeichen einzeln,
+    liest ALL.TXT aber nur ein Mal. Rueckgabe: Rufzeichen -> LineNavigator.
+    Die Output-Dateien heissen output_pattern mit {callsign} ersetzt
+    (siehe output_names).
+    """
+    callsigns = list(dict.fromkeys(callsigns))
+    if not callsigns or "" in callsigns:
+        raise ValueError("Mindestens ein nicht leeres Rufzeichen erforderlich")
+
+    input_path = Path(input_path)
+    output_dir = Path(output_dir)
+
+    matcher = AhoCorasick(callsigns)
+    needles = [cs.encode("utf-8") for cs in callsigns]
+    regex = None
+    if len(needles) > MULTI_FIND_LIMIT:
+        regex = re.compile(b"|".join(re.escape(n) for n in needles))
+
+    pairings = {cs: CqPairing(cs) for cs in callsigns}
+    results: Dict[str, List[str]] = {cs: [] for cs in callsigns}
+
+    with input_path.open("rb") as f:
+        # Leere Dateien lassen sich nicht abbilden
+        if input_path.stat().st_size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                size = len(data)
+                window_start = 0
+                while window_start < size:
+                    # Abschnitte enden auf Zeilengrenzen
+                    newline = data.find(b"\n", window_start + WINDOW_BYTES)
+                    window_end = size if newline < 0 else newline + 1
+
+                    pos = window_start
+                    for hit in _candidate_hits(data, needles, regex, window_start, window_end):
+                        if hit < pos:
+                            # Zeile wurde bereits verarbeitet
+                            continue
+                        newline_before = data.rfind(b"\n", pos, hit)
+                        line_start = pos if newline_before < 0 else newline_before + 1
+                        newline_after = data.find(b"\n", hit, window_end)
+                        line_end = window_end if newline_after < 0 else newline_after + 1
+
+                        for line in _decode_raw_line(data[line_start:line_end]):
+                            for cs in matcher.find_all(line):
+                                pairings[cs].feed(line, results[cs])
+                        pos = line_end
+
+                    window_start = window_end
+
+    navigators: Dict[str, LineNavigator] = {}
+    names = output_names(callsigns, output_pattern)
+    for cs in callsigns:
+        pairings[cs].flush(results[cs])
+        output_path = output_dir / names[cs]
+        with output_path.open("w", encoding="utf-8") as out:
+            out.writelines(results[cs])
+        navigators[cs] = LineNavigator(results[cs], own_callsign=cs)
+
+    return navigators
+# ENDE Funktion filter_lines_with_callsigns ------------
+
+
+# Beispielaufruf
+if __name__ == "__main__":
+
+    navigators = filter_lines_with_callsigns(
+        ["HB9EVT", "HB9EVT/P", "HB9XYZ"],
+        "Excerpt_from_ALL-TXT.txt",
+    )
+    for callsign, navigator in navigators.items():
+        print(callsign, len(navigator), "Zeilen")
@@ -0,0 +1,277 @@
+"""
+LICENSE
+==========
+This file is part of the project <Check_yr_WSJT_X_log_with_ALL_TXT>
+Licensed under the MIT License - see the LICENSE file for details.
+
+Developed by Pepe HB9EVT
+with support from my lovely auntie A.I. Perplexity, 2025
+
+I would appreciate a short email if you use this software:
+github2025  -at-  pepemail.ch
+"""
+
+"""
+qso_sessions.py
+===============
+Rekonstruiert in einem Durchlauf ueber die Zeilen (ALL.TXT oder
+filtered_lines.txt) die QSOs des eigenen Rufzeichens:
+
+CQ -> Locator -> Rapport -> R-Rapport -> RR73/RRR -> 73
+
+Ein CQ (das eigene oder das der Gegenstation, die wir anrufen) wird bis
+zu SESSION_TIMEOUT gemerkt; beginnt danach eine Sitzung, zaehlt sie ab
+diesem CQ und haelt fest, wer CQ gerufen hat. CQ-Zeilen fremder
+Stationen gibt es nur in ALL.TXT, in filtered_lines.txt stehen nur die
+eigenen.
+
+Pro Gegenstation (und Band) ist hoechstens eine Sitzung offen. Sitzungen
+ohne Aktivitaet laenger als SESSION_TIMEOUT werden abgeschlossen und
+ausgegeben; die Anzahl offener Sitzungen ist begrenzt, damit der
+Speicherbedarf auch bei sehr vielen Gegenstationen klein bleibt.
+"""
+
+
+# IMPORTS
+import re
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from sub_line_records import band_from_frequency, parse_line
+
+
+# KONSTANTEN
+SESSION_TIMEOUT = 10 * 60   # Sekunden ohne Aktivitaet, danach gilt die Sitzung als beendet
+MAX_OPEN_SESSIONS = 1000    # Obergrenze gleichzeitig offener Sitzungen
+
+STATE_COMPLETE = "complete"       # Rapporte ausgetauscht und RR73/RRR/73
+STATE_NO_CONFIRM = "no_confirm"   # Rapporte ausgetauscht, aber keine Bestaetigung
+STATE_INCOMPLETE = "incomplete"   # Abgebrochen vor dem Rapportaustausch
+
+# RR73 hat selbst die Form eines Locators und wird vorher ausgeschlossen
+_GRID = re.compile(r"^(?!RR73$)[A-R]{2}[0-9]{2}$")
+_REPORT = re.compile(r"^[+-][0-9]{2}$")
+_R_REPORT = re.compile(r"^R[+-][0-9]{2}$")
+_HAS_DIGIT = re.compile(r"[0-9]")
+
+
+class QsoRecord(NamedTuple):
+    partner: str
+    band: str
+    mode: str
+    frequency: float            # MHz (Dial-Frequenz)
+    start: int                  # Sekunden seit 1970 (UTC)
+    end: int
+    first_line: int             # 0-basierter Zeilenindex der ersten Nachricht
+    last_line: int
+    grid: Optional[str]         # Locator der Gegenstation
+    report_sent: Optional[str]
+    report_rcvd: Optional[str]
+    state: str
+    cq_by: Optional[str] = None # Wer das QSO mit CQ eroeffnet hat (None = ohne CQ)
+
+
+# KLASSE _Session
+class _Session:
+    __slots__ = (
+        "partner", "band", "mode", "frequency", "start", "end",
+        "first_line", "last_line", "grid", "report_sent", "report_rcvd",
+        "confirmed", "final_73", "cq_by",
+    )
+
+    def __init__(
+        self, partner: str, band: str, mode: str, frequency: float,
+        timestamp: int, line_index: int,
+    ) -> None:
+        self.partner = partner
+        self.band = band
+        self.mode = mode
+        self.frequency = frequency
+        self.start = timestamp
+        self.end = timestamp
+        self.first_line = line_index
+        self.last_line = line_index
+        self.grid: Optional[str] = None
+        self.report_sent: Optional[str] = None
+        self.report_rcvd: Optional[str] = None
+        self.confirmed = False
+        self.final_73 = False
+        self.cq_by: Optional[str] = None
+
+    def to_record(self) -> QsoRecord:
+        if self.report_sent and self.report_rcvd:
+            state = STATE_COMPLETE if self.confirmed else STATE_NO_CONFIRM
+        else:
+            state = STATE_INCOMPLETE
+        return QsoRecord(
+            self.partner, self.band, self.mode, self.frequency,
+            self.start, self.end, self.first_line, self.last_line,
+            self.grid, self.report_sent, self.report_rcvd, state, self.cq_by,
+        )
+# Ende der Klasse _Session -----------------------------
+
+
+def _bare_callsign(token: str) -> str:
+    # Gehashte Rufzeichen erscheinen als <HB9EVT>
+    return token.strip("<>").upper()
+
+
+def _cq_caller(words: List[str]) -> Optional[str]:
+    """
+    Rufende Station einer CQ-Nachricht: "CQ DL1ABC JO31", auch mit
+    Zusatz wie "CQ DX DL1ABC JO31" oder "CQ POTA DL1ABC" (ohne Ziffer).
+    """
+    if len(words) < 2:
+        return None
+    if _HAS_DIGIT.search(words[1]) and not words[1].isdigit():
+        return _bare_callsign(words[1])
+    if len(words) > 2:
+        return _bare_callsign(words[2])
+    return None
+
+
+def _classify(
+    words: List[str], own: str,
+) -> Optional[Tuple[str, bool, Optional[str]]]:
+    """
+    Ordnet eine Nachricht einem QSO zu.
+    Rueckgabe: (Gegenstation, von_uns_gesendet, Nutzlast) oder None.
+    """
+    if len(words) < 2 or words[0] == "CQ":
+        return None
+    to_call = _bare_callsign(words[0])
+    from_call = _bare_callsign(words[1])
+    payload = words[2] if len(words) > 2 else None
+    if from_call == own and to_call != own:
+        return to_call, True, payload
+    if to_call == own and from_call != own:
+        return from_call, False, payload
+    return None
+
+
+# Funktion zur QSO-Rekonstruktion
+def reconstruct_qsos(
+    lines: Iterable[str],
+    own_callsign: str,
+    session_timeout: int = SESSION_TIMEOUT,
+    max_open_sessions: int = MAX_OPEN_SESSIONS,
+) -> Iterator[QsoRecord]:
+    """
+    Liefert fuer jedes erkannte QSO einen QsoRecord, sobald die Sitzung
+    abgeschlossen ist (73, Zeitueberschreitung oder Dateiende); die
+    Reihenfolge entspricht daher dem Ende der QSOs.
+    """
+    own = own_callsign.upper()
+    # Offene Sitzungen, die am laengsten inaktive zuerst
+    sessions: "OrderedDict[Tuple[str, str], _Session]" = OrderedDict()
+    # Letztes CQ pro (rufende Station, Band): (Zeitstempel, Zeilenindex)
+    cq_calls: "OrderedDict[Tuple[str, str], Tuple[int, int]]" = OrderedDict()
+
+    for line_index, line in enumerate(lines):
+        # Billiger Vortest, bevor die Zeile zerlegt wird
+        if own not in line and "CQ " not in line:
+            continue
+        parsed = parse_line(line)
+        if parsed is None:
+            continue
+        timestamp, frequency, _direction, mode, _snr, _dt, _df, words = parsed
+
+        # Abgelaufene Sitzungen abschliessen
+        while sessions:
+            key, oldest = next(iter(sessions.items()))
+            if timestamp - oldest.end <= session_timeout:
+                break
+            del sessions[key]
+            yield oldest.to_record()
+
+        if words and words[0] == "CQ":
+            caller = _cq_caller(words)
+            if caller:
+                key = (caller, band_from_frequency(frequency) or "")
+                cq_calls.pop(key, None)
+                cq_calls[key] = (timestamp, line_index)
+                if len(cq_calls) > max_open_sessions:
+                    cq_calls.popitem(last=False)
+            continue
+
+        classified = _classify(words, own)
+        if classified is None:
+            continue
+        partner, sent_by_us, payload = classified
+        band = band_from_frequency(frequency) or ""
+        key = (partner, band)
+
+        session = sessions.get(key)
+        starts_new_exchange = payload is not None and (
+            _GRID.match(payload) or _REPORT.match(payload)
+        )
+        if session is not None and session.confirmed and starts_new_exchange:
+            # Neues QSO mit derselben Station nach einem abgeschlossenen
+            del sessions[key]
+            yield session.to_record()
+            session = None
+
+        if session is None:
+            session = _Session(partner, band, mode, frequency, timestamp, line_index)
+            # Eroeffnet durch unser CQ (Antwort an uns) oder das CQ der
+            # Gegenstation (wir rufen an), falls es noch nicht zu alt ist
+            cq_by = partner if sent_by_us else own
+            cq = cq_calls.get((cq_by, band))
+            if cq is not None and 0 <= timestamp - cq[0] <= session_timeout:
+                session.cq_by = cq_by
+                session.start, session.first_line = cq
+            sessions[key] = session
+            if len(sessions) > max_open_sessions:
+                _, evicted = sessions.popitem(last=False)
+                yield evicted.to_record()
+        else:
+            sessions.move_to_end(key)
+
+        session.end = timestamp
+        session.last_line = line_index
+
+        if payload is None:
+            continue
+        if _GRID.match(payload):
+            if not sent_by_us:
+                session.grid = payload
+        elif _REPORT.match(payload) or _R_REPORT.match(payload):
+            report = payload.lstrip("R")
+            if sent_by_us:
+                session.report_sent = report
+            else:
+                session.report_rcvd = report
+        elif payload in ("RR73", "RRR"):
+            session.confirmed = True
+        elif payload == "73":
+            session.confirmed = True
+            session.final_73 = True
+
+        if session.final_73 and session.report_sent and session.report_rcvd:
+            # Mit 73 ist das QSO beendet
+            del sessions[key]
+            yield session.to_record()
+
+    # Dateiende: alle offenen Sitzungen ausgeben
+    for session in sessions.values():
+        yield session.to_record()
+
+
+def reconstruct_qsos_from_file(
+    input_path: str | Path,
+    own_callsign: str,
+) -> Iterator[QsoRecord]:
+    """
+    Wie reconstruct_qsos, liest die Zeilen aber direkt aus einer Datei
+    (ALL.TXT oder filtered_lines.txt); Zeilenindizes beziehen sich auf diese.
+    """
+    with Path(input_path).open("r", encoding="utf-8", errors="replace") as f:
+        yield from reconstruct_qsos(f, own_callsign)
+# ENDE Funktion reconstruct_qsos ------------
+
+
+# Beispiel
+if __name__ == "__main__":
+    for qso in reconstruct_qsos_from_file("filtered_lines.txt", "HB9EVT"):
+        print(qso)
@@ -0,0 +1,387 @@
+"""
+LICENSE
+==========
+This file is part of the project <Check_yr_WSJT_X_log_with_ALL_TXT>
+Licensed under the MIT License - see the LICENSE file for details.
+
+Developed by Pepe HB9EVT
+with support from my lovely auntie A.I. Perplexity, 2025
+
+I would appreciate a short email if you use this software:
+github2025  -at-  pepemail.ch
+"""
+
+"""
+result_cache.py
+===============
+Cache fuer Filterergebnisse auf der Festplatte. Wird dieselbe ALL.TXT
+mehrfach geoeffnet, werden die Ergebniszeilen samt RR73-Index und
+Vorkommens-Indizes der Gegenstationen aus einer Binaerdatei geladen,
+ohne die Eingabedatei erneut zu durchsuchen.
+
+Schluessel eines Eintrags:
+-- Pfad, Groesse und Aenderungszeit der Eingabedatei,
+-- Hash ueber SAMPLE_COUNT gleichmaessig verteilte Bloecke der Datei,
+-- Rufzeichen und FILTER_VERSION.
+
+Ueberschreitet der Cache MAX_CACHE_BYTES, werden die am laengsten nicht
+benutzten Eintraege geloescht. Reste abgebrochener Schreibvorgaenge
+(*.tmp, aelter als STALE_TMP_SECONDS) werden dabei immer entfernt.
+
+Treffer und Fehltreffer zaehlt STATS (cache.hit, cache.miss), die Zeit
+fuer das Laden der Timer cache.load.
+"""
+
+
+# IMPORTS
+import hashlib
+import json
+import os
+import re
+import struct
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from sub_compress_data import LineNavigator, filter_lines_with_callsign
+from sub_line_records import LineRecords
+from sub_stats import STATS
+
+
+# KONSTANTEN
+FILTER_VERSION = 1                  # Erhoehen, wenn sich das Filterergebnis aendert
+CACHE_DIR = ".filter_cache"         # Standard-Verzeichnis fuer die Cache-Dateien
+CACHE_SUFFIX = ".bin"
+MAX_CACHE_BYTES = 512 * 1024 * 1024 # Obergrenze fuer alle Eintraege zusammen
+SAMPLE_COUNT = 16                   # Anzahl Stichproben-Bloecke fuer den Hash
+SAMPLE_BYTES = 64 * 1024            # Groesse eines Stichproben-Blocks
+TMP_SUFFIX = ".tmp"                 # Eintrag, der gerade geschrieben wird
+STALE_TMP_SECONDS = 3600            # Aeltere .tmp-Dateien gelten als Reste
+
+MAGIC = b"WSJTFC01"
+HEADER = struct.Struct("<8sIQQQI")  # Magic, Version, Textlaenge, Zeilen, RR73, Rufzeichen
+OCCURRENCE_HEADER = struct.Struct("<HQ")  # Laenge des Rufzeichens, Anzahl Indizes
+
+
+# KLASSE CachedLineNavigator
+class CachedLineNavigator(LineNavigator):
+    """
+    LineNavigator aus dem Cache: RR73-Index und Vorkommens-Indizes
+    liegen bereits vor und werden nicht neu berechnet.
+    """
+
+    def __init__(
+        self,
+        lines: List[str],
+        own_callsign: Optional[str] = None,
+        rr73_indices: Optional[List[int]] = None,
+        occurrences: Optional[Dict[str, List[int]]] = None,
+    ) -> None:
+        super().__init__(lines)
+        if own_callsign is not None:
+            if rr73_indices is not None:
+                self._rr73_callsign = own_callsign
+                self._rr73_indices = rr73_indices
+            else:
+                self.rr73_indices(own_callsign)
+        self._occurrences = occurrences or {}
+
+    def occurrence_index(self, callsign: str) -> Optional[List[int]]:
+        """Gespeicherte Vorkommens-Indizes von callsign, sonst aus records oder None."""
+        occurrences = self._occurrences.get(callsign)
+        if occurrences is None:
+            occurrences = super().occurrence_index(callsign)
+        return occurrences
+
+    def extend(self, lines: List[str]) -> None:
+        # Vorberechnete Vorkommen gelten nur fuer den geladenen Stand
+        self._occurrences = {}
+        super().extend(lines)
+# Ende der Klasse CachedLineNavigator -----------------------------
+
+
+# ------------------------------------------------------------------
+# Schluessel
+# ------------------------------------------------------------------
+
+def _sample_hash(path: Path, size: int) -> str:
+    """Hash ueber SAMPLE_COUNT Bloecke, gleichmaessig verteilt inkl. Anfang und Ende."""
+    digest = hashlib.blake2b(digest_size=16)
+    with path.open("rb") as f:
+        if size <= SAMPLE_COUNT * SAMPLE_BYTES:
+            digest.update(f.read())
+        else:
+            step = (size - SAMPLE_BYTES) // (SAMPLE_COUNT - 1)
+            for i in range(SAMPLE_COUNT):
+                f.seek(i * step)
+                digest.update(f.read(SAMPLE_BYTES))
+    return digest.hexdigest()
+
+
+def cache_key(callsign: str, input_path: str | Path) -> dict:
+    """Schluessel fuer den aktuellen Stand der Eingabedatei."""
+    input_path = Path(input_path)
+    stat = input_path.stat()
+    return {
+        "path": str(input_path.resolve()),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sample_hash": _sample_hash(input_path, stat.st_size),
+        "callsign": callsign,
+        "filter_version": FILTER_VERSION,
+    }
+
+
+def _entry_path(key: dict, cache_dir: str | Path) -> Path:
+    name = hashlib.sha256(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()
+    return Path(cache_dir) / (name + CACHE_SUFFIX)
+
+
+# ------------------------------------------------------------------
+# Vorkommens-Indizes der Gegenstationen
+# ------------------------------------------------------------------
+
+def build_occurrences(lines: List[str], callsigns: Iterable[str]) -> Dict[str, List[int]]:
+    """
+    Fuer jedes Rufzeichen die Indizes aller Zeilen, die es enthalten
+    (wie LinesViewer.get_occurrence_index). Ein Regex-Durchlauf findet an
+    jeder Position das laengste passende Rufzeichen (Lookahead, damit sich
+    Treffer ueberlappen duerfen); kuerzere Rufzeichen am selben Anfang
+    (K1AB in K1ABC) werden ueber contained mitgezaehlt.
+    """
+    callsigns = sorted(set(callsigns), key=len, reverse=True)
+    occurrences: Dict[str, List[int]] = {cs: [] for cs in callsigns}
+    if not callsigns:
+        return occurrences
+
+    contained = {cs: [c for c in callsigns if cs.startswith(c)] for cs in callsigns}
+    regex = re.compile("(?=(" + "|".join(re.escape(cs) for cs in callsigns) + "))")
+
+    for i, line in enumerate(lines):
+        found = set()
+        for match in regex.finditer(line):
+            found.update(contained[match.group(1)])
+        for cs in found:
+            occurrences[cs].append(i)
+    return occurrences
+
+
+# ------------------------------------------------------------------
+# Lesen und Schreiben
+# ------------------------------------------------------------------
+
+def _write_entry(
+    entry_path: Path,
+    lines: List[str],
+    rr73_indices: List[int],
+    occurrences: Dict[str, List[int]],
+) -> None:
+    text = "".join(lines).encode("utf-8")
+    tmp_path = entry_path.with_name(entry_path.name + TMP_SUFFIX)
+    with tmp_path.open("wb") as f:
+        f.write(HEADER.pack(
+            MAGIC, FILTER_VERSION, len(text), len(lines), len(rr73_indices), len(occurrences)
+        ))
+        f.write(text)
+        f.write(array("Q", rr73_indices).tobytes())
+        for callsign, indices in occurrences.items():
+            name = callsign.encode("utf-8")
+            f.write(OCCURRENCE_HEADER.pack(len(name), len(indices)))
+            f.write(name)
+            f.write(array("Q", indices).tobytes())
+    tmp_path.replace(entry_path)
+
+
+def _read_entry(entry_path: Path, own_callsign: str) -> Optional[CachedLineNavigator]:
+    try:
+        data = entry_path.read_bytes()
+    except OSError:
+        return None
+    try:
+        return _parse_entry(data, own_callsign)
+    except (struct.error, UnicodeDecodeError, ValueError):
+        # Beschaedigter oder abgeschnittener Eintrag
+        return None
+
+
+def _parse_entry(data: bytes, own_callsign: str) -> Optional[CachedLineNavigator]:
+    if len(data) < HEADER.size:
+        return None
+    magic, version, text_len, line_count, rr73_count, occ_count = HEADER.unpack_from(data)
+    if magic != MAGIC or version != FILTER_VERSION:
+        return None
+
+    pos = HEADER.size
+    text = data[pos:pos + text_len].decode("utf-8")
+    pos += text_len
+
+    # Jede Zeile endet mit "\n", nur die letzte evtl. nicht
+    parts = text.split("\n")
+    lines = [part + "\n" for part in parts[:-1]]
+    if parts[-1]:
+        lines.append(parts[-1])
+    if len(lines) != line_count:
+        return None
+
+    item_size = array("Q").itemsize
+    rr73 = array("Q")
+    rr73.frombytes(data[pos:pos + rr73_count * item_size])
+    pos += rr73_count * item_size
+
+    occurrences: Dict[str, List[int]] = {}
+    for _ in range(occ_count):
+        name_len, count = OCCURRENCE_HEADER.unpack_from(data, pos)
+        pos += OCCURRENCE_HEADER.size
+        callsign = data[pos:pos + name_len].decode("utf-8")
+        pos += name_len
+        indices = array("Q")
+        indices.frombytes(data[pos:pos + count * item_size])
+        pos += count * item_size
+        occurrences[callsign] = indices.tolist()
+
+    return CachedLineNavigator(lines, own_callsign, rr73.tolist(), occurrences)
+
+
+def _evict(cache_dir: Path, max_bytes: int) -> None:
+    """
+    Loescht die am laengsten nicht benutzten Eintraege (mtime), bis
+    max_bytes eingehalten ist. Liegengebliebene .tmp-Dateien (abgebrochene
+    Laeufe) stehen vorne in der Liste und werden in jedem Fall geloescht;
+    juengere .tmp-Dateien schreibt evtl. gerade ein anderer Lauf.
+    """
+    stale_before = time.time_ns() - STALE_TMP_SECONDS * 1_000_000_000
+    entries = []
+    for path in cache_dir.glob("*" + CACHE_SUFFIX + "*"):
+        is_tmp = path.name.endswith(CACHE_SUFFIX + TMP_SUFFIX)
+        if not is_tmp and not path.name.endswith(CACHE_SUFFIX):
+            continue
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        if is_tmp and stat.st_mtime_ns >= stale_before:
+            continue
+        entries.append((not is_tmp, stat.st_mtime_ns, stat.st_size, path))
+    entries.sort()
+
+    total = sum(size for _, _, size, _ in entries)
+    for is_entry, _, size, path in entries:
+        if is_entry and total <= max_bytes:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+
+
+def load_cached_result(
+    callsign: str,
+    input_path: str | Path,
+    output_path: str | Path | None = None,
+    cache_dir: str | Path = CACHE_DIR,
+    key: Optional[dict] = None,
+) -> Optional[CachedLineNavigator]:
+    """
+    Liefert den Navigator aus dem Cache oder None. Mit output_path wird
+    auch die Output-Datei wie bei filter_lines_with_callsign geschrieben.
+    """
+    if key is None:
+        key = cache_key(callsign, input_path)
+    entry_path = _entry_path(key, cache_dir)
+    with STATS.timer("cache.load"):
+        navigator = _read_entry(entry_path, callsign)
+        if navigator is None:
+            STATS.add("cache.miss")
+            return None
+
+        # Zuletzt benutzt: fuer die Verdraengung die mtime auffrischen
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+        if output_path is not None:
+            with Path(output_path).open("w", encoding="utf-8") as out:
+                out.writelines(navigator)
+    STATS.add("cache.hit")
+    STATS.add("lines_output", len(navigator))
+    return navigator
+
+
+def store_result(
+    navigator: LineNavigator,
+    callsign: str,
+    input_path: str | Path,
+    key: dict,
+    cache_dir: str | Path = CACHE_DIR,
+    max_bytes: int = MAX_CACHE_BYTES,
+) -> bool:
+    """
+    Speichert das Ergebnis unter key, der vor dem Filtern mit cache_key
+    ermittelt wurde. Hat sich die Eingabedatei seither veraendert
+    (WSJT-X schreibt weiter), wird nichts gespeichert.
+    """
+    stat = Path(input_path).stat()
+    if stat.st_size != key["size"] or stat.st_mtime_ns != key["mtime_ns"]:
+        return False
+
+    lines = list(navigator)
+    rr73_indices = navigator.rr73_indices(callsign)
+    partners = [other for _, other in navigator.iter_qsos(callsign)]
+    occurrences = build_occurrences(lines, partners)
+
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    _write_entry(_entry_path(key, cache_dir), lines, rr73_indices, occurrences)
+    _evict(cache_dir, max_bytes)
+    return True
+
+
+# Funktion zum Filtern mit Cache
+def filter_lines_cached(
+    callsign: str,
+    input_path: str | Path,
+    output_path: str | Path,
+    use_cache: bool = True,
+    cache_dir: str | Path = CACHE_DIR,
+    max_bytes: int = MAX_CACHE_BYTES,
+    **filter_options,
+) -> LineNavigator:
+    """
+    Wie filter_lines_with_callsign (filter_options werden durchgereicht),
+    laedt das Ergebnis aber aus dem Cache, falls vorhanden.
+    use_cache=False umgeht den Cache vollstaendig (weder lesen noch schreiben),
+    ebenso lazy=True, da der Cache die Zeilen im Speicher liefert,
+    time_range und merge (der Cache-Schluessel kennt weder Zeitraum noch
+    Zusammenfuehren) und Listen oder Globs mehrerer Eingabedateien.
+    """
+    single_file = isinstance(input_path, (str, Path)) and Path(input_path).is_file()
+    if (not use_cache or filter_options.get("lazy") or filter_options.get("time_range")
+            or filter_options.get("merge") or not single_file):
+        return filter_lines_with_callsign(callsign, input_path, output_path, **filter_options)
+
+    key = cache_key(callsign, input_path)
+    navigator = load_cached_result(callsign, input_path, output_path, cache_dir, key)
+    if navigator is not None:
+        if filter_options.get("with_records"):
+            navigator.records = LineRecords.from_lines(navigator)
+        return navigator
+
+    navigator = filter_lines_with_callsign(callsign, input_path, output_path, **filter_options)
+    store_result(navigator, callsign, input_path, key, cache_dir, max_bytes)
+    return navigator
+# ENDE Funktion filter_lines_cached ------------
+
+
+# Beispielaufruf
+if __name__ == "__main__":
+
+    navigator = filter_lines_cached(
+        "HB9EVT",
+        "Excerpt_from_ALL-TXT.txt",
+        "filtered_lines.txt",
+        engine="mmap",
+    )
+    print("Anzahl Ergebniszeilen:", len(navigator))
@@ -0,0 +1,233 @@
+"""
+LICENSE
+==========
+This file is part of the project <Check_yr_WSJT_X_log_with_ALL_TXT>
+Licensed under the MIT License - see the LICENSE file for details.
+
+Developed by Pepe HB9EVT
+with support from my lovely auntie A.I. Perplexity, 2025
+
+I would appreciate a short email if you use this software:
+github2025  -at-  pepemail.ch
+"""
+
+"""
+search_index.py
+===============
+Suche fuer den LinesViewer:
+
+-- SearchIndex: invertierter Index Wort der Nachricht (Rufzeichen,
+   Locator, Rapport) -> sortierte Zeilennummern. Einmal aufgebaut,
+   liefert er alle Treffer eines Rufzeichens mit einem Zugriff; der
+   naechste / vorherige Treffer wird per bisect gefunden (O(log n)).
+-- IndexBuilder und RegexSearch laufen in einem eigenen Thread und
+   geben ihr Ergebnis ueber eine Queue weiter, die der Viewer per
+   after() abfragt; die Oberflaeche bleibt dabei bedienbar.
+   RegexSearch liefert die Treffer laufend in Paketen.
+   Statt der Zeilen kann eine Funktion uebergeben werden, die sie erst im
+   Thread bereitstellt (z.B. ein eigener Leser fuer eine Datei), damit
+   auch das Lesen nicht im Tk-Thread geschieht.
+"""
+
+
+# IMPORTS
+import queue
+import re
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from sub_line_records import HEADER_FIELDS
+
+
+# KONSTANTEN
+BATCH_LINES = 20000     # Zeilen pro Paket der Regex-Suche
+_EMPTY = array("I")
+
+# Zeilen oder Funktion, die sie im Such-Thread liefert
+LineSource = Union[Sequence[str], Callable[[], Sequence[str]]]
+
+
+def _open_lines(source: LineSource) -> Sequence[str]:
+    return source() if callable(source) else source
+
+
+def _close_lines(lines: Sequence[str]) -> None:
+    # Eigene Leser (Datei, Datenbankverbindung) wieder schliessen
+    close = getattr(lines, "close", None)
+    if close is not None:
+        close()
+
+
+def line_tokens(line: str) -> List[str]:
+    """Woerter der Nachricht (ohne Zeitstempel, Frequenz usw.), <CALL> auch als CALL."""
+    words = line.split()
+    if len(words) > HEADER_FIELDS:
+        words = words[HEADER_FIELDS:]
+    tokens = []
+    for word in words:
+        tokens.append(word)
+        if word.startswith("<") and word.endswith(">"):
+            tokens.append(word[1:-1])
+    return tokens
+
+
+# KLASSE SearchIndex
+class SearchIndex:
+    """Invertierter Index: Wort -> sortierte Zeilennummern (array 'I')."""
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, array] = {}
+        self.line_count = 0
+
+    @classmethod
+    def from_lines(cls, lines: Sequence[str]) -> "SearchIndex":
+        index = cls()
+        index.extend(lines)
+        return index
+
+    def extend(self, lines: Sequence[str]) -> None:
+        """Nimmt die Zeilen als Zeilennummern line_count, line_count + 1, ... auf."""
+        postings = self._postings
+        for i, line in enumerate(lines, self.line_count):
+            for token in line_tokens(line):
+                hits = postings.get(token)
+                if hits is None:
+                    postings[token] = array("I", [i])
+                elif hits[-1] != i:
+                    hits.append(i)
+        self.line_count += len(lines)
+
+    def hits(self, token: str) -> array:
+        """Sortierte Zeilennummern, deren Nachricht token enthaelt."""
+        return self._postings.get(token, _EMPTY)
+
+    def __len__(self) -> int:
+        return len(self._postings)
+# Ende der Klasse SearchIndex -----------------------------
+
+
+def next_hit(hits: Sequence[int], index: int) -> Optional[int]:
+    """Erster Treffer nach index (exklusive) oder None."""
+    pos = bisect_right(hits, index)
+    return hits[pos] if pos < len(hits) else None
+
+
+def prev_hit(hits: Sequence[int], index: int) -> Optional[int]:
+    """Letzter Treffer vor index (exklusive) oder None."""
+    pos = bisect_left(hits, index)
+    return hits[pos - 1] if pos > 0 else None
+
+
+# KLASSE IndexBuilder
+class IndexBuilder:
+    """Baut den SearchIndex in einem Hintergrund-Thread auf."""
+
+    def __init__(self, lines: LineSource) -> None:
+        self._lines = lines
+        self.index: Optional[SearchIndex] = None
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self._queue: "queue.Queue[Optional[SearchIndex]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> "IndexBuilder":
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        try:
+            lines = _open_lines(self._lines)
+            try:
+                index = SearchIndex.from_lines(lines)
+            finally:
+                _close_lines(lines)
+            self._queue.put(index)
+        except BaseException as exc:    # Fehler an die Tk-Seite weitergeben
+            self.error = exc
+            self._queue.put(None)
+
+    def poll(self) -> Optional[SearchIndex]:
+        """Liefert den fertigen Index (einmal) oder None, solange er noch entsteht."""
+        try:
+            self.index = self._queue.get_nowait()
+        except queue.Empty:
+            return None
+        self.done = True
+        return self.index
+# Ende der Klasse IndexBuilder -----------------------------
+
+
+# KLASSE RegexSearch
+class RegexSearch:
+    """
+    Durchsucht die Zeilen in einem Hintergrund-Thread mit einem regulaeren
+    Ausdruck; die Treffer kommen paketweise (alle BATCH_LINES Zeilen).
+    """
+
+    def __init__(self, lines: LineSource, pattern: str) -> None:
+        self._lines = lines
+        # Ungueltige Ausdruecke fallen schon hier auf (re.error)
+        self.pattern = re.compile(pattern)
+        self.hits: List[int] = []
+        self.lines_searched = 0
+        self.done = False
+        self.error: Optional[BaseException] = None
+
+        # Pakete: (neue Treffer, bisher durchsuchte Zeilen, fertig)
+        self._queue: "queue.Queue[Tuple[List[int], int, bool]]" = queue.Queue()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> "RegexSearch":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        search = self.pattern.search
+        searched = 0
+        try:
+            lines = _open_lines(self._lines)
+            try:
+                for start in range(0, len(lines), BATCH_LINES):
+                    if self._stop.is_set():
+                        break
+                    batch = lines[start:start + BATCH_LINES]
+                    found = [start + i for i, line in enumerate(batch) if search(line)]
+                    searched = start + len(batch)
+                    self._queue.put((found, searched, False))
+            finally:
+                _close_lines(lines)
+        except BaseException as exc:    # Fehler an die Tk-Seite weitergeben
+            self.error = exc
+        self._queue.put(([], searched, True))
+
+    def poll(self) -> List[int]:
+        """Holt alle bereitliegenden Treffer ab (und haengt sie an hits an)."""
+        found: List[int] = []
+        while True:
+            try:
+                new_hits, searched, finished = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            found.extend(new_hits)
+            self.lines_searched = searched
+            if finished:
+                self.done = True
+        self.hits.extend(found)
+        return found
+# Ende der Klasse RegexSearch -----------------------------
+
+
+# Beispielaufruf
+if __name__ == "__main__":
+    from sub_compress_data import filter_lines_with_callsign
+
+    navigator = filter_lines_with_callsign("HB9EVT", "Excerpt_from_ALL-TXT.txt", "filtered_lines.txt")
+    index = SearchIndex.from_lines(list(navigator))
+    hits = index.hits("DJ2MS")
+    print("DJ2MS in", len(hits), "Zeilen, erste nach Zeile 100:", next_hit(hits, 100))
@@ -0,0 +1,586 @@
+"""
+LICENSE
+==========
+This file is part of the project <Check_yr_WSJT_X_log_with_ALL_TXT>
+Licensed under the MIT License - see the LICENSE file for details.
+
+Developed by Pepe HB9EVT
+with support from my lovely auntie A.I. Perplexity, 2025
+
+I would appreciate a short email if you use this software:
+github2025  -at-  pepemail.ch
+"""
+
+"""
+sqlite_store.py
+===============
+ALL.TXT in einer lokalen SQLite-Datenbank, damit Abfragen wie "alle
+Zeilen mit DJ2MS auf 40m im Maerz" nicht jedes Mal Gigabytes Text lesen.
+
+Einlesen (ingest):
+-- gelesen wird wie in filter_lines_with_callsign (sub_archive_input:
+   Dateien, Globs, Archive, Lese-Thread), dekodiert wie im Textmodus,
+-- alle Zeilen werden geparst und blockweise mit executemany geschrieben,
+   eine Transaktion pro Block, WAL-Journal,
+-- Indizes auf Rufzeichen (Tabelle line_callsigns), Zeit und Frequenz,
+-- bereits eingelesene, unveraenderte Dateien werden uebersprungen,
+-- an eine unkomprimierte Datei angehaengte Zeilen (laufendes ALL.TXT)
+   werden nachgelesen: gespeichert sind wie in sub_incremental_filter der
+   Offset hinter der letzten vollstaendigen Zeile und ein Fingerabdruck
+   des Dateianfangs; passt dieser nicht mehr (Datei gekuerzt oder
+   ersetzt), wird die Datei neu eingelesen, ebenso jedes geaenderte Archiv.
+   Eine angefangene letzte Zeile wird eingelesen und beim naechsten Mal
+   durch die vollstaendige ersetzt.
+
+Abfragen liefern einen SqliteNavigator, den der LinesViewer wie jeden
+LineNavigator anzeigt. Geblaettert wird seitenweise ueber den
+Schluessel (id >= erster id der Seite), nicht ueber OFFSET.
+Die Datenbank enthaelt alle Zeilen ohne CQ-Paarung: eine Abfrage nach
+dem eigenen Rufzeichen liefert daher auch CQ-Zeilen, auf die keine
+Antwort folgte (filter_lines_with_callsign laesst diese weg).
+
+
+Aufruf:
+=======
+
+python sub_sqlite_store.py --ingest ALL.TXT "archiv/ALL_*.txt.gz"
+python sub_sqlite_store.py --callsign DJ2MS --band 40m --start 250301 --end 250401
+"""
+
+
+# IMPORTS
+import io
+import json
+import mmap
+import re
+import sqlite3
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sub_archive_input import READ_BLOCK, expand_inputs, is_archive_input, iter_input_blocks
+from sub_compress_data import LineNavigator, extract_other_callsign_from_rr73_line
+from sub_incremental_filter import prefix_fingerprint
+from sub_line_records import BANDS, DIR_TX, parse_line, parse_timestamp
+
+
+# KONSTANTEN
+DB_FILE = "all_txt.sqlite"
+CHUNK_LINES = 50_000        # Zeilen pro Transaktion beim Einlesen
+PAGE_LINES = 256            # Zeilen pro Seite im Navigator
+CACHE_PAGES = 16            # Anzahl Seiten im Cache des Navigators
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    first_line INTEGER,
+    last_line INTEGER,
+    byte_offset INTEGER,
+    fingerprint TEXT,
+    partial INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS lines (
+    id INTEGER PRIMARY KEY,
+    source INTEGER NOT NULL,
+    ts INTEGER,
+    frequency REAL,
+    direction TEXT,
+    mode TEXT,
+    snr INTEGER,
+    dt REAL,
+    df INTEGER,
+    message TEXT NOT NULL,
+    line TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS line_callsigns (
+    callsign TEXT NOT NULL,
+    line_id INTEGER NOT NULL,
+    PRIMARY KEY (callsign, line_id)
+) WITHOUT ROWID;
+"""
+
+# In aelteren Datenbanken fehlende Spalten von sources
+# (byte_offset: Ende der letzten vollstaendigen Zeile, partial: letzte
+# eingelesene Zeilen: Anzahl Zeilen aus einem unvollstaendigen Rest)
+SOURCE_COLUMNS = {
+    "byte_offset": "INTEGER",
+    "fingerprint": "TEXT",
+    "partial": "INTEGER NOT NULL DEFAULT 0",
+}
+
+# Nach dem ersten Einlesen angelegt, damit der Massenimport sie nicht pflegen muss
+INDEXES = """
+CREATE INDEX IF NOT EXISTS lines_ts ON lines (ts);
+CREATE INDEX IF NOT EXISTS lines_frequency ON lines (frequency);
+CREATE INDEX IF NOT EXISTS line_callsigns_line ON line_callsigns (line_id);
+"""
+
+# Rufzeichen: mindestens eine Ziffer, danach ein Buchstabe; Locator (JN47)
+# und Rapporte (RR73, R-12) fallen dadurch weg. <...> = gehashtes Rufzeichen
+_CALLSIGN = re.compile(r"<?((?:[A-Z0-9]+/)?[A-Z0-9]*[0-9][A-Z0-9]*[A-Z][A-Z0-9]*(?:/[A-Z0-9]+)?)>?")
+_GRID6 = re.compile(r"[A-R]{2}[0-9]{2}[A-X]{2}")
+
+
+def connect(db_path: str | Path = DB_FILE) -> sqlite3.Connection:
+    """Oeffnet (und erzeugt) die Datenbank im WAL-Modus."""
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.executescript(SCHEMA)
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(sources)")}
+    for column, declaration in SOURCE_COLUMNS.items():
+        if column not in existing:
+            conn.execute(f"ALTER TABLE sources ADD COLUMN {column} {declaration}")
+    return conn
+
+
+def message_callsigns(words: List[str]) -> List[str]:
+    """Rufzeichen in den Woertern einer Nachricht, jedes nur einmal."""
+    found: List[str] = []
+    for word in words:
+        match = _CALLSIGN.fullmatch(word)
+        if match and not _GRID6.fullmatch(word) and match.group(1) not in found:
+            found.append(match.group(1))
+    return found
+
+
+def _iter_text_lines(path: Path) -> Iterator[str]:
+    """Zeilen einer (evtl. komprimierten) Datei, dekodiert wie im Textmodus."""
+    carry = b""
+    for _, block in iter_input_blocks([path]):
+        data = carry + block if carry else block
+        if not block:
+            end = len(data)
+        else:
+            end = data.rfind(b"\n") + 1
+        if end:
+            # Ungueltige Bytes reichen nie ueber ein "\n" hinaus, der Block
+            # darf also am Stueck dekodiert werden
+            yield from io.StringIO(data[:end].decode("utf-8", errors="replace"), newline=None)
+        carry = data[end:]
+
+
+def _iter_mapped_lines(data, start: int, end: int) -> Iterator[str]:
+    """Zeilen in data[start:end] (endet auf einer Zeilengrenze), dekodiert wie im Textmodus."""
+    while start < end:
+        newline = data.find(b"\n", min(start + READ_BLOCK, end) - 1, end)
+        stop = end if newline < 0 else newline + 1
+        yield from io.StringIO(data[start:stop].decode("utf-8", errors="replace"), newline=None)
+        start = stop
+
+
+def _line_rows(line_id: int, source_id: int, line: str) -> Tuple[tuple, List[Tuple[str, int]]]:
+    """Zeile fuer die Tabelle lines und ihre Eintraege fuer line_callsigns."""
+    parsed = parse_line(line)
+    if parsed is None:
+        words = line.split()
+        row = (line_id, source_id, None, None, None, None, None, None, None, " ".join(words), line)
+    else:
+        timestamp, frequency, direction, mode, snr, dt, df, words = parsed
+        row = (
+            line_id, source_id, timestamp, frequency, "Tx" if direction == DIR_TX else "Rx",
+            mode, snr, dt, df, " ".join(words), line,
+        )
+    return row, [(cs, line_id) for cs in message_callsigns(words)]
+
+
+def _remove_lines(conn: sqlite3.Connection, source_id: int, first: Optional[int], last: Optional[int]) -> None:
+    """
+    Loescht die Zeilen der Quelle mit first <= id <= last; nachgelesene
+    Zeilen liegen hinter denen anderer Quellen, daher die Bedingung source.
+    """
+    if first is None:
+        return
+    with conn:
+        conn.execute(
+            "DELETE FROM line_callsigns WHERE line_id IN "
+            "(SELECT id FROM lines WHERE id BETWEEN ? AND ? AND source = ?)",
+            (first, last, source_id),
+        )
+        conn.execute("DELETE FROM lines WHERE id BETWEEN ? AND ? AND source = ?", (first, last, source_id))
+
+
+def _remove_source(conn: sqlite3.Connection, source_id: int, first: Optional[int], last: Optional[int]) -> None:
+    _remove_lines(conn, source_id, first, last)
+    with conn:
+        conn.execute("DELETE FROM sources WHERE id = ?", (source_id,))
+
+
+def _fingerprint_text(data, offset: int) -> str:
+    return json.dumps(prefix_fingerprint(data, offset), sort_keys=True)
+
+
+def _ingest_lines(
+    conn: sqlite3.Connection,
+    path: Path,
+    lines: Iterable[str],
+    chunk_lines: int,
+) -> int:
+    """
+    Haengt lines an die Zeilen der Quelle path an (wird angelegt, falls
+    noch nicht vorhanden) und fuehrt first_line/last_line nach.
+    Rueckgabe: Anzahl Zeilen.
+    """
+    row = conn.execute("SELECT id FROM sources WHERE path = ?", (str(path),)).fetchone()
+    if row is None:
+        with conn:
+            source_id = conn.execute(
+                "INSERT INTO sources (path, size, mtime) VALUES (?, 0, 0)", (str(path),)
+            ).lastrowid
+    else:
+        source_id = row[0]
+    next_id = conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM lines").fetchone()[0]
+    first_id = next_id
+
+    line_rows: List[tuple] = []
+    callsign_rows: List[Tuple[str, int]] = []
+
+    def flush() -> None:
+        with conn:
+            conn.executemany("INSERT INTO lines VALUES (?,?,?,?,?,?,?,?,?,?,?)", line_rows)
+            conn.executemany("INSERT OR IGNORE INTO line_callsigns VALUES (?, ?)", callsign_rows)
+        line_rows.clear()
+        callsign_rows.clear()
+
+    for line in lines:
+        row, callsigns = _line_rows(next_id, source_id, line)
+        line_rows.append(row)
+        callsign_rows.extend(callsigns)
+        next_id += 1
+        if len(line_rows) >= chunk_lines:
+            flush()
+    flush()
+
+    if next_id > first_id:
+        with conn:
+            conn.execute(
+                "UPDATE sources SET first_line = COALESCE(first_line, ?), last_line = ? WHERE id = ?",
+                (first_id, next_id - 1, source_id),
+            )
+    return next_id - first_id
+
+
+# Funktion zum Einlesen von ALL.TXT in die Datenbank
+def ingest(
+    inputs,
+    db_path: str | Path = DB_FILE,
+    chunk_lines: int = CHUNK_LINES,
+) -> int:
+    """
+    Liest alle Zeilen der Eingabedateien (Pfade, Globs, Archive) in die
+    Datenbank ein. Unveraenderte Dateien werden uebersprungen, an
+    unkomprimierte Dateien angehaengte Zeilen nachgelesen, sonst geaenderte
+    Dateien ersetzt. Rueckgabe: Anzahl neu eingelesener Zeilen.
+    """
+    conn = connect(db_path)
+    added = 0
+    try:
+        for path in expand_inputs(inputs):
+            stat = path.stat()
+            known = conn.execute(
+                "SELECT id, size, mtime, first_line, last_line, byte_offset, fingerprint, partial "
+                "FROM sources WHERE path = ?",
+                (str(path),),
+            ).fetchone()
+            if known is not None and known[1] == stat.st_size and known[2] == stat.st_mtime:
+                continue
+            if is_archive_input(path) or stat.st_size == 0:
+                if known is not None:
+                    _remove_source(conn, known[0], known[3], known[4])
+                added += _ingest_lines(conn, path, _iter_text_lines(path), chunk_lines)
+                with conn:
+                    conn.execute(
+                        "UPDATE sources SET size = ?, mtime = ? WHERE path = ?",
+                        (stat.st_size, stat.st_mtime, str(path)),
+                    )
+                continue
+
+            with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                offset = 0
+                if known is not None:
+                    source_id, first, last, byte_offset, fingerprint, partial = (
+                        known[0], known[3], known[4], known[5], known[6], known[7]
+                    )
+                    if (byte_offset is not None and byte_offset <= len(data)
+                            and fingerprint == _fingerprint_text(data, byte_offset)):
+                        # Nur Angehaengtes lesen; eine zuvor unvollstaendige
+                        # letzte Zeile wird durch die neue Fassung ersetzt
+                        offset = byte_offset
+                        if partial:
+                            # Die Zeilen des Rests stehen zusammen am Ende der Quelle
+                            _remove_lines(conn, source_id, last - partial + 1, last)
+                            last = conn.execute(
+                                "SELECT MAX(id) FROM lines WHERE id BETWEEN ? AND ? AND source = ?",
+                                (first, last - partial, source_id),
+                            ).fetchone()[0]
+                            with conn:
+                                conn.execute(
+                                    "UPDATE sources SET first_line = ?, last_line = ? WHERE id = ?",
+                                    (None if last is None else first, last, source_id),
+                                )
+                    else:
+                        _remove_source(conn, source_id, first, last)
+                        known = None
+
+                complete_end = data.rfind(b"\n", offset) + 1 or offset
+                lines = _iter_mapped_lines(data, offset, complete_end)
+                added += _ingest_lines(conn, path, lines, chunk_lines)
+                # Angefangene letzte Zeile (ein "\r" kann sie auch teilen)
+                partial_rows = 0
+                if complete_end < len(data):
+                    tail = data[complete_end:].decode("utf-8", errors="replace")
+                    partial_rows = _ingest_lines(conn, path, io.StringIO(tail, newline=None), chunk_lines)
+                    added += partial_rows
+                with conn:
+                    conn.execute(
+                        "UPDATE sources SET size = ?, mtime = ?, byte_offset = ?, fingerprint = ?, "
+                        "partial = ? WHERE path = ?",
+                        (stat.st_size, stat.st_mtime, complete_end,
+                         _fingerprint_text(data, complete_end), partial_rows, str(path)),
+                    )
+
+        conn.executescript(INDEXES)
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+    return added
+# ENDE Funktion ingest ------------
+
+
+def _to_timestamp(value) -> Optional[int]:
+    """int (Sekunden seit 1970), "YYMMDD" oder "YYMMDD_HHMMSS"."""
+    if value is None or isinstance(value, int):
+        return value
+    text = str(value)
+    if len(text) == 6:
+        text += "_000000"
+    timestamp = parse_timestamp(text)
+    if timestamp is None:
+        raise ValueError(f"Ungueltige Zeitangabe {value!r}, erwartet YYMMDD oder YYMMDD_HHMMSS")
+    return timestamp
+
+
+def build_query(
+    callsign: Optional[str] = None,
+    band: Optional[str] = None,
+    start=None,
+    end=None,
+) -> Tuple[str, str, str, list]:
+    """
+    (FROM-Teil, Schluesselspalte, WHERE-Bedingung, Parameter) der Abfrage.
+    start ist inklusive, end exklusive; band in ADIF-Schreibweise (z.B. "40m").
+    Mit Rufzeichen laeuft die Abfrage ueber den Primaerschluessel
+    (callsign, line_id) von line_callsigns, die Seiten sind dann Bereiche
+    in diesem Index.
+    """
+    conditions: List[str] = []
+    params: list = []
+    if callsign:
+        source = "line_callsigns AS c JOIN lines ON lines.id = c.line_id"
+        key = "c.line_id"
+        conditions.append("c.callsign = ?")
+        params.append(callsign)
+    else:
+        source = "lines"
+        key = "lines.id"
+    if band:
+        limits = [(low, high) for low, high, name in BANDS if name == band]
+        if not limits:
+            raise ValueError(f"Unbekanntes Band {band!r}")
+        conditions.append("lines.frequency BETWEEN ? AND ?")
+        params.extend(limits[0])
+    if start is not None:
+        conditions.append("lines.ts >= ?")
+        params.append(_to_timestamp(start))
+    if end is not None:
+        conditions.append("lines.ts < ?")
+        params.append(_to_timestamp(end))
+    return source, key, (" AND ".join(conditions) or "1"), params
+
+
+# KLASSE SqliteLines
+class SqliteLines:
+    """
+    Unveraenderliche Liste der Zeilen eines Abfrageergebnisses. Beim
+    Oeffnen wird nur der Schluessel der ersten Zeile jeder Seite geholt;
+    eine Seite wird dann mit "Schluessel >= Seitenschluessel ORDER BY
+    Schluessel LIMIT PAGE_LINES" gelesen.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, source: str, key: str, where: str, params: list) -> None:
+        self._conn = conn
+        self._source = source
+        self._key = key
+        self._where = where
+        self._params = params
+        self._pages: "OrderedDict[int, List[str]]" = OrderedDict()
+
+        self._page_keys = array("q")
+        self._length = 0
+        for (line_id,) in conn.execute(
+            f"SELECT id FROM ({self._numbered('')}) WHERE pos % {PAGE_LINES} = 0", params
+        ):
+            self._page_keys.append(line_id)
+        if self._page_keys:
+            last_page = len(self._page_keys) - 1
+            self._length = last_page * PAGE_LINES + len(self._page(last_page))
+
+    def _numbered(self, columns: str) -> str:
+        return (
+            f"SELECT {self._key} AS id{columns}, ROW_NUMBER() OVER (ORDER BY {self._key}) - 1 AS pos "
+            f"FROM {self._source} WHERE {self._where}"
+        )
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _page(self, page_no: int) -> List[str]:
+        page = self._pages.get(page_no)
+        if page is not None:
+            self._pages.move_to_end(page_no)
+            return page
+
+        page = [
+            line for (line,) in self._conn.execute(
+                f"SELECT lines.line FROM {self._source} WHERE {self._where} AND {self._key} >= ? "
+                f"ORDER BY {self._key} LIMIT {PAGE_LINES}",
+                self._params + [self._page_keys[page_no]],
+            )
+        ]
+        self._pages[page_no] = page
+        if len(self._pages) > CACHE_PAGES:
+            self._pages.popitem(last=False)
+        return page
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            result: List[str] = []
+            i = start
+            while i < stop:
+                page_no, offset = divmod(i, PAGE_LINES)
+                take = self._page(page_no)[offset:offset + (stop - i)]
+                result.extend(take)
+                i += len(take)
+            return result
+
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("Zeilenindex ausserhalb des Bereichs")
+        page_no, offset = divmod(key, PAGE_LINES)
+        return self._page(page_no)[offset]
+
+    def __iter__(self) -> Iterator[str]:
+        # Ein Durchlauf am Cache vorbei
+        return (line for (line,) in self._conn.execute(
+            f"SELECT lines.line FROM {self._source} WHERE {self._where} ORDER BY {self._key}",
+            self._params,
+        ))
+
+    def matching(self, condition: str, params: list) -> List[Tuple[int, str]]:
+        """(Position, Zeile) der Ergebniszeilen, die condition erfuellen (Spalten line, message)."""
+        return self._conn.execute(
+            f"SELECT pos, line FROM ({self._numbered(', lines.line AS line, lines.message AS message')}) "
+            f"WHERE {condition} ORDER BY pos",
+            self._params + params,
+        ).fetchall()
+
+    def close(self) -> None:
+        """Schliesst die Verbindung (nur fuer Listen mit eigener Verbindung, siehe detached_lines)."""
+        self._conn.close()
+# Ende der Klasse SqliteLines -----------------------------
+
+
+# KLASSE SqliteNavigator
+class SqliteNavigator(LineNavigator):
+    """
+    LineNavigator ueber einer Abfrage der Datenbank (siehe build_query).
+    Im Speicher liegen nur die Seitenschluessel und wenige Seiten Zeilen;
+    RR73-Index und Vorkommen eines Rufzeichens berechnet SQLite.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path = DB_FILE,
+        own_callsign: Optional[str] = None,
+        callsign: Optional[str] = None,
+        band: Optional[str] = None,
+        start=None,
+        end=None,
+    ) -> None:
+        self._db_path = db_path
+        self._query = build_query(callsign, band, start, end)
+        self._conn = connect(db_path)
+        self._sql_lines = SqliteLines(self._conn, *self._query)
+        self._occurrences: Dict[str, List[int]] = {}
+        super().__init__(self._sql_lines)
+        if own_callsign is not None:
+            self.rr73_indices(own_callsign)
+
+    def rr73_indices(self, own_callsign: str) -> List[int]:
+        if self._rr73_callsign != own_callsign:
+            self._rr73_indices = [
+                pos for pos, line in self._sql_lines.matching("message LIKE '%RR73'", [])
+                if extract_other_callsign_from_rr73_line(line, own_callsign)
+            ]
+            self._rr73_callsign = own_callsign
+        return self._rr73_indices
+
+    def occurrence_index(self, callsign: str) -> List[int]:
+        """Positionen aller Zeilen, die callsign enthalten (wie 'callsign in line')."""
+        occurrences = self._occurrences.get(callsign)
+        if occurrences is None:
+            occurrences = [pos for pos, _ in self._sql_lines.matching("instr(line, ?) > 0", [callsign])]
+            self._occurrences[callsign] = occurrences
+        return occurrences
+
+    def detached_lines(self, count: int) -> SqliteLines:
+        """
+        Dieselbe Abfrage ueber eine eigene Verbindung, z.B. fuer den
+        Such-Thread; sqlite3 erlaubt eine Verbindung nur in dem Thread, der
+        sie geoeffnet hat, daher im Such-Thread aufrufen. Das Ergebnis
+        aendert sich nicht, count ist immer len(self).
+        """
+        return SqliteLines(connect(self._db_path), *self._query)
+
+    def close(self) -> None:
+        self._conn.close()
+# Ende der Klasse SqliteNavigator -----------------------------
+
+
+# Aufruf von der Kommandozeile
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="ALL.TXT in SQLite einlesen und abfragen.")
+    parser.add_argument("--db", default=DB_FILE)
+    parser.add_argument("--ingest", nargs="+", metavar="DATEI", help="Dateien, Globs oder Archive einlesen")
+    parser.add_argument("--callsign")
+    parser.add_argument("--band", help="z.B. 40m")
+    parser.add_argument("--start", help="YYMMDD oder YYMMDD_HHMMSS (inklusive)")
+    parser.add_argument("--end", help="YYMMDD oder YYMMDD_HHMMSS (exklusive)")
+    parser.add_argument("--own-callsign", default="HB9EVT")
+    parser.add_argument("--view", action="store_true", help="Ergebnis im LinesViewer anzeigen")
+    args = parser.parse_args()
+
+    if args.ingest:
+        print("Neu eingelesene Zeilen:", ingest(args.ingest, args.db))
+
+    navigator = SqliteNavigator(
+        args.db, args.own_callsign, args.callsign, args.band, args.start, args.end
+    )
+    print("Gefundene Zeilen:", len(navigator))
+    for line in navigator.window(0, 10):
+        print(line, end="")
+
+    if args.view:
+        from sub_lines_viewer import LinesViewer
+        LinesViewer(navigator, args.callsign or args.own_callsign).run()
+    navigator.close()
@@ -0,0 +1,181 @@
+"""
+LICENSE
+==========
+This file is part of the project <Check_yr_WSJT_X_log_with_ALL_TXT>
+Licensed under the MIT License - see the LICENSE file for details.
+
+Developed by Pepe HB9EVT
+with support from my lovely auntie A.I. Perplexity, 2025
+
+I would appreciate a short email if you use this software:
+github2025  -at-  pepemail.ch
+"""
+
+"""
+stats.py
+========
+Zaehler und Zeitmessungen fuer die Hauptpfade (Lesen, Filtern, Schreiben
+der Output-Datei, Anzeige im LinesViewer).
+
+Gemessen wird pro Phase bzw. pro Aufruf, nicht pro Zeile; die Zaehler
+werden am Ende einer Schleife in einem Schritt addiert. Teure
+Zusatzzaehler (z.B. alle Zeilen der Datei bei engine="mmap") werden nur
+mit STATS.enabled = True erfasst.
+
+Optional: cProfile- und tracemalloc-Mitschnitt eines ganzen Laufs.
+"""
+
+
+# IMPORTS
+import io
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Dict, Iterator, List, Optional
+
+
+# KONSTANTEN
+PROFILE_TOP = 25            # Anzahl Funktionen in der cProfile-Zusammenfassung
+TRACEMALLOC_TOP = 15        # Anzahl Quelltextzeilen in der tracemalloc-Zusammenfassung
+
+
+# KLASSE Stats
+class Stats:
+    """Sammelt Zaehler (Ganzzahlen) und Zeiten (Sekunden und Anzahl Aufrufe)."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.counters: Dict[str, int] = {}
+        self.times: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+
+    def reset(self) -> None:
+        self.counters.clear()
+        self.times.clear()
+        self.calls.clear()
+
+    def add(self, name: str, value: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def add_time(self, name: str, seconds: float) -> None:
+        self.times[name] = self.times.get(name, 0.0) + seconds
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - t0)
+
+    def to_dict(self) -> dict:
+        return {
+            "counters": dict(sorted(self.counters.items())),
+            "times": {
+                name: {"seconds": self.times[name], "calls": self.calls[name]}
+                for name in sorted(self.times)
+            },
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    def summary(self) -> str:
+        lines = ["Zaehler:"]
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"  {name:<28} {value:>14,}")
+        lines.append("Zeiten:")
+        for name in sorted(self.times):
+            seconds = self.times[name]
+            calls = self.calls[name]
+            lines.append(
+                f"  {name:<28} {seconds * 1000:>11.1f} ms  {calls:>7} Aufrufe"
+                f"  {seconds * 1000 / calls:>9.3f} ms/Aufruf"
+            )
+        return "\n".join(lines)
+# Ende der Klasse Stats -----------------------------
+
+
+# Gemeinsame Instanz fuer alle Module
+STATS = Stats()
+
+
+def timed(name: str) -> Callable:
+    """Dekorator: misst jeden Aufruf der Funktion unter name."""
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                STATS.add_time(name, time.perf_counter() - t0)
+        return wrapper
+    return decorator
+
+
+# KLASSE RunCapture
+class RunCapture:
+    """
+    Optionaler Mitschnitt eines ganzen Laufs:
+    -- profile_path: cProfile-Daten (auswertbar mit pstats oder snakeviz),
+    -- memory: tracemalloc mit Spitzenwert und den groessten Allokationen.
+    """
+
+    def __init__(self, profile_path: Optional[str] = None, memory: bool = False) -> None:
+        self.profile_path = profile_path
+        self.memory = memory
+        self._profiler = None      # cProfile.Profile, erst bei Bedarf importiert
+        self._top_allocations: List[tracemalloc.Statistic] = []
+
+    def __enter__(self) -> "RunCapture":
+        if self.memory:
+            tracemalloc.start()
+        if self.profile_path:
+            import cProfile
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._profiler is not None:
+            self._profiler.disable()
+            self._profiler.dump_stats(self.profile_path)
+        if self.memory:
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            STATS.add("tracemalloc_peak_bytes", peak)
+            STATS.add("tracemalloc_current_bytes", current)
+            self._top_allocations = snapshot.statistics("lineno")[:TRACEMALLOC_TOP]
+
+    def summary(self) -> str:
+        lines = []
+        if self.profile_path:
+            import pstats
+            lines.append(f"cProfile gespeichert in {self.profile_path}")
+            stream = io.StringIO()
+            stats = pstats.Stats(self.profile_path, stream=stream)
+            stats.sort_stats("cumulative")
+            stats.print_stats(PROFILE_TOP)
+            lines.append(stream.getvalue())
+        if self.memory:
+            lines.append("Groesste Allokationen (tracemalloc):")
+            for stat in self._top_allocations:
+                lines.append(f"  {stat}")
+        return "\n".join(lines)
+# Ende der Klasse RunCapture -----------------------------
+
+
+# Beispielnutzung
+if __name__ == "__main__":
+    from sub_compress_data import filter_lines_with_callsign
+
+    STATS.enabled = True
+    with RunCapture(memory=True) as capture:
+        filter_lines_with_callsign("HB9EVT", "Excerpt_from_ALL-TXT.txt", "filtered_lines.txt")
+    print(STATS.summary())
+    print(capture.summary())
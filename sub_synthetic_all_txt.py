@@ -0,0 +1,241 @@
+"""
+LICENSE
+==========
+This file is part of the project <Check_yr_WSJT_X_log_with_ALL_TXT>
+Licensed under the MIT License - see the LICENSE file for details.
+
+Developed by Pepe HB9EVT
+with support from my lovely auntie A.I. Perplexity, 2025
+
+I would appreciate a short email if you use this software:
+github2025  -at-  pepemail.ch
+"""
+
+"""
+synthetic_all_txt.py
+====================
+Erzeugt kuenstliche, aber realistische ALL.TXT-Dateien (10k bis 100M
+Zeilen) fuer Tests und Benchmarks:
+
+-- Zeitschlitze von 15 s (FT8) bzw. 7.5 s (FT4) mit mehreren Dekodierungen,
+-- Baender und Betriebsarten wechseln in Sitzungen von einigen Stunden,
+-- fremder Verkehr (CQ, Locator, Rapport, R-Rapport, RR73, 73),
+-- eigene QSOs mit CQ / Locator / Rapport / R-Rapport / RR73 / 73,
+   Haeufigkeit ueber qso_rate einstellbar,
+-- vereinzelt ungueltige UTF-8-Bytes und Zeilenenden "\r\n".
+
+
+Aufruf:
+=======
+
+python sub_synthetic_all_txt.py synthetic_ALL.TXT --lines 1000000
+"""
+
+
+# IMPORTS
+import argparse
+import calendar
+import random
+import time
+from pathlib import Path
+from typing import List, Optional
+
+
+# KONSTANTEN
+OWN_CALLSIGN = "HB9EVT"
+OWN_GRID = "JN47"
+START_TIME = "2024-01-01 00:00:00"      # Beginn der erzeugten Zeitreihe (UTC)
+
+# Dial-Frequenzen in MHz und relative Haeufigkeit
+FT8_BANDS = [
+    (1.840, 2), (3.573, 6), (7.074, 12), (10.136, 6), (14.074, 14),
+    (18.100, 5), (21.074, 8), (24.915, 3), (28.074, 6), (50.313, 3),
+]
+FT4_BANDS = [(3.575, 1), (7.0475, 2), (14.080, 3), (21.140, 2), (28.180, 1)]
+FT4_SHARE = 0.15                # Anteil der Sitzungen in FT4
+
+SESSION_SLOTS = (120, 1200)     # Dauer einer Band-Sitzung in Zeitschlitzen
+DECODES_PER_SLOT = (3, 25)      # Dekodierungen pro Zeitschlitz
+QSO_RATE = 0.02                 # Wahrscheinlichkeit pro Schlitz, ein eigenes QSO zu beginnen
+GARBLE_RATE = 0.0005            # Anteil Zeilen mit ungueltigen Bytes
+CRLF_RATE = 0.0005              # Anteil Zeilen mit "\r\n"
+CALL_POOL = 20000               # Anzahl verschiedener Fremdrufzeichen
+WRITE_BATCH = 20000             # Zeilen pro Schreibvorgang
+
+_PREFIXES = [
+    "DL", "DJ", "DK", "DM", "OE", "HB9", "F", "F4", "G", "M0", "I", "IK", "EA",
+    "PA", "ON", "OK", "OM", "SP", "SM", "OH", "LA", "OZ", "YO", "LZ", "UA",
+    "K", "W", "N", "KD", "VE", "JA", "JH", "VK", "ZL", "PY", "LU", "ZS", "4X",
+]
+_LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def _random_callsign(rng: random.Random) -> str:
+    suffix_len = rng.choice((1, 2, 2, 3, 3, 3))
+    return (
+        rng.choice(_PREFIXES)
+        + str(rng.randint(0, 9))
+        + "".join(rng.choice(_LETTERS) for _ in range(suffix_len))
+    )
+
+
+def _random_grid(rng: random.Random) -> str:
+    return rng.choice("ABCDEFGHIJKLMNOPQR") + rng.choice("ABCDEFGHIJKLMNOPQR") + f"{rng.randint(0, 99):02d}"
+
+
+def _report(rng: random.Random) -> str:
+    return f"{rng.randint(-24, 10):+03d}"
+
+
+def _format_line(stamp: str, freq: float, direction: str, mode: str, snr: int, dt: float, df: int, msg: str) -> str:
+    # Spaltenbreiten wie WSJT-X
+    return f"{stamp}{freq:10.3f} {direction} {mode} {snr:6d} {dt:4.1f} {df:4d} {msg}"
+
+
+# KLASSE _OwnQso
+class _OwnQso:
+    """Ablauf eines eigenen QSOs ueber mehrere Zeitschlitze."""
+
+    STEPS = ("cq", "grid", "report", "r_report", "rr73", "73")
+
+    def __init__(self, partner: str, partner_grid: str, rng: random.Random) -> None:
+        self.partner = partner
+        self.partner_grid = partner_grid
+        self.step = 0
+        self.df_own = rng.randint(300, 2800)
+        self.df_partner = rng.randint(300, 2800)
+        self.snr = rng.randint(-22, 5)
+
+    def next_message(self, rng: random.Random) -> Optional[tuple]:
+        """(Richtung, DF, Nachricht) des naechsten Schritts oder None am Ende."""
+        if self.step >= len(self.STEPS):
+            return None
+        step = self.STEPS[self.step]
+        # Gelegentlich wird ein Schritt wiederholt oder das QSO bricht ab
+        if rng.random() < 0.1 and self.step > 0:
+            step = self.STEPS[self.step - 1]
+        else:
+            self.step += 1
+        if rng.random() < 0.03:
+            self.step = len(self.STEPS)
+
+        own, other = OWN_CALLSIGN, self.partner
+        if step == "cq":
+            return "Tx", self.df_own, f"CQ {own} {OWN_GRID}"
+        if step == "grid":
+            return "Rx", self.df_partner, f"{own} {other} {self.partner_grid}"
+        if step == "report":
+            return "Tx", self.df_own, f"{other} {own} {self.snr:+03d}"
+        if step == "r_report":
+            return "Rx", self.df_partner, f"{own} {other} R{_report(rng)}"
+        if step == "rr73":
+            return "Tx", self.df_own, f"{other} {own} RR73"
+        return "Rx", self.df_partner, f"{own} {other} 73"
+# Ende der Klasse _OwnQso -----------------------------
+
+
+# Funktion zum Erzeugen einer ALL.TXT-Datei
+def generate_all_txt(
+    output_path: str | Path,
+    lines: int,
+    seed: int = 1,
+    qso_rate: float = QSO_RATE,
+    garble_rate: float = GARBLE_RATE,
+    crlf_rate: float = CRLF_RATE,
+) -> int:
+    """
+    Schreibt genau `lines` Zeilen nach output_path und liefert die
+    Anzahl geschriebener Bytes. Gleicher seed ergibt dieselbe Datei.
+    """
+    rng = random.Random(seed)
+    pool = [_random_callsign(rng) for _ in range(CALL_POOL)]
+    grids = {cs: _random_grid(rng) for cs in pool}
+    ft8_freqs, ft8_weights = zip(*FT8_BANDS)
+    ft4_freqs, ft4_weights = zip(*FT4_BANDS)
+
+    slot_time = float(calendar.timegm(time.strptime(START_TIME, "%Y-%m-%d %H:%M:%S")))
+    written = 0
+    bytes_written = 0
+    batch: List[bytes] = []
+
+    own_qso: Optional[_OwnQso] = None
+
+    with Path(output_path).open("wb") as out:
+        while written < lines:
+            # Neue Band-Sitzung
+            if rng.random() < FT4_SHARE:
+                mode, slot_len = "FT4", 7.5
+                freq = rng.choices(ft4_freqs, ft4_weights)[0]
+            else:
+                mode, slot_len = "FT8", 15.0
+                freq = rng.choices(ft8_freqs, ft8_weights)[0]
+            active = rng.sample(pool, 200)
+
+            for _ in range(rng.randint(*SESSION_SLOTS)):
+                if written >= lines:
+                    break
+                stamp = time.strftime("%y%m%d_%H%M%S", time.gmtime(slot_time))
+                slot_time += slot_len
+
+                if own_qso is None and rng.random() < qso_rate:
+                    partner = rng.choice(active)
+                    own_qso = _OwnQso(partner, grids[partner], rng)
+                if own_qso is not None:
+                    step = own_qso.next_message(rng)
+                    if step is None:
+                        own_qso = None
+                    else:
+                        direction, df, msg = step
+                        snr = 0 if direction == "Tx" else own_qso.snr
+                        dt = 0.0 if direction == "Tx" else round(rng.uniform(-0.5, 1.5), 1)
+                        batch.append(_format_line(stamp, freq, direction, mode, snr, dt, df, msg).encode())
+
+                for _ in range(rng.randint(*DECODES_PER_SLOT)):
+                    a, b = rng.sample(active, 2)
+                    r = rng.random()
+                    if r < 0.25:
+                        msg = f"CQ {a} {grids[a]}"
+                    elif r < 0.45:
+                        msg = f"{a} {b} {grids[b]}"
+                    elif r < 0.6:
+                        msg = f"{a} {b} {_report(rng)}"
+                    elif r < 0.75:
+                        msg = f"{a} {b} R{_report(rng)}"
+                    elif r < 0.9:
+                        msg = f"{a} {b} RR73"
+                    else:
+                        msg = f"{a} {b} 73"
+                    batch.append(_format_line(
+                        stamp, freq, "Rx", mode, rng.randint(-24, 15),
+                        round(rng.uniform(-0.5, 1.5), 1), rng.randint(200, 2900), msg,
+                    ).encode())
+
+                if len(batch) >= WRITE_BATCH or written + len(batch) >= lines:
+                    batch = batch[:lines - written]
+                    for i in range(len(batch)):
+                        if rng.random() < garble_rate:
+                            batch[i] += b" \xff\xfe" + bytes([rng.randint(0x80, 0xff)])
+                        batch[i] += b"\r\n" if rng.random() < crlf_rate else b"\n"
+                    data = b"".join(batch)
+                    out.write(data)
+                    bytes_written += len(data)
+                    written += len(batch)
+                    batch = []
+
+    return bytes_written
+# ENDE Funktion generate_all_txt ------------
+
+
+# Aufruf von der Kommandozeile
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Erzeugt eine synthetische ALL.TXT-Datei.")
+    parser.add_argument("output", help="Zieldatei")
+    parser.add_argument("--lines", type=int, default=100_000, help="Anzahl Zeilen (Standard 100000)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--qso-rate", type=float, default=QSO_RATE)
+    parser.add_argument("--garble-rate", type=float, default=GARBLE_RATE)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    size = generate_all_txt(args.output, args.lines, args.seed, args.qso_rate, args.garble_rate)
+    print(f"{args.lines} Zeilen, {size / 1e6:.1f} MB in {time.perf_counter() - t0:.1f} s")
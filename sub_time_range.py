@@ -0,0 +1,218 @@
+"""
+LICENSE
+==========
+This file is part of the project <Check_yr_WSJT_X_log_with_ALL_TXT>
+Licensed under the MIT License - see the LICENSE file for details.
+
+Developed by Pepe HB9EVT
+with support from my lovely auntie A.I. Perplexity, 2025
+
+I would appreciate a short email if you use this software:
+github2025  -at-  pepemail.ch
+"""
+
+"""
+time_range.py
+=============
+Zeitfenster direkt aus ALL.TXT, ohne die ganze Datei zu lesen.
+
+Jede Zeile beginnt mit einem sortierbaren Zeitstempel YYMMDD_HHMMSS.
+find_time_slice sucht per Binaersuche ueber die Byte-Offsets den Anfang
+und das Ende des Fensters; gelesen wird dann nur dieser Abschnitt.
+
+Unordnung in der Datei:
+-- kleine Rueckspruenge (Uhrkorrektur) deckt ein Rand von MARGIN_SECONDS
+   vor und nach dem Fenster ab; jede Zeile wird danach einzeln anhand
+   ihres Zeitstempels geprueft (TimeRangeFilter),
+-- groessere Rueckspruenge (z.B. aneinandergehaengte Dateien) erkennen
+   Stichproben ueber die ganze Datei und die Sondierungen der
+   Binaersuche; dann wird die ganze Datei gelesen (gleiches Ergebnis,
+   nur langsamer). Ein ungeordnetes Stueck, das kuerzer als der Abstand
+   der Stichproben ist und weder am Ende noch in der Naehe einer
+   Sondierung liegt, kann dabei unbemerkt bleiben,
+-- findet eine Sondierung in PROBE_LINES Zeilen keinen gueltigen
+   Zeitstempel (z.B. ein beschaedigter Abschnitt mitten in der Datei),
+   wird ebenfalls die ganze Datei gelesen.
+
+Zeilen ohne gueltigen Zeitstempel lassen sich keinem Zeitpunkt zuordnen
+und werden im Zeitfenster-Modus nicht ausgegeben.
+"""
+
+
+# IMPORTS
+import datetime
+import re
+from typing import List, Optional, Tuple
+
+from sub_line_records import TIMESTAMP_LEN, format_timestamp, parse_timestamp
+
+
+# KONSTANTEN
+MARGIN_SECONDS = 3600       # Zulaessiger Rueckschritt der Zeitstempel
+SAMPLE_COUNT = 64           # Stichproben fuer die Pruefung der Reihenfolge
+PROBE_LINES = 64            # Zeilen, die eine Sondierung nach einem Zeitstempel absucht
+OPEN_START = 0              # Grenzen fuer None (offenes Ende)
+OPEN_END = 2 ** 62
+
+_STAMP = re.compile(rb"\d{6}_\d{6}")
+
+
+def parse_time_bound(value) -> int:
+    """
+    Zeitgrenze in Sekunden seit 1970 (UTC). Erlaubt sind int, datetime
+    (ohne Zeitzone = UTC) und Text "YYMMDD", "YYMMDD_HH", "YYMMDD_HHMM"
+    oder "YYMMDD_HHMMSS".
+    """
+    if isinstance(value, int):
+        return value
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=datetime.timezone.utc)
+        return int(value.timestamp())
+    text = str(value)
+    if len(text) == 6:
+        text += "_"
+    timestamp = parse_timestamp(text.ljust(TIMESTAMP_LEN, "0"))
+    if timestamp is None or len(text) > TIMESTAMP_LEN:
+        raise ValueError(f"Ungueltige Zeitangabe {value!r}, erwartet YYMMDD[_HH[MM[SS]]]")
+    return timestamp
+
+
+def time_bounds(time_range) -> Tuple[int, int]:
+    """(start, end) in Sekunden; None steht fuer eine offene Grenze."""
+    start, end = time_range
+    return (
+        OPEN_START if start is None else parse_time_bound(start),
+        OPEN_END if end is None else parse_time_bound(end),
+    )
+
+
+def _line_start(data, pos: int) -> int:
+    """Anfang der ersten Zeile, die bei pos oder danach beginnt."""
+    if pos <= 0:
+        return 0
+    newline = data.find(b"\n", pos - 1)
+    return len(data) if newline < 0 else newline + 1
+
+
+def _stamp_from(data, pos: int) -> Tuple[Optional[bytes], bool]:
+    """
+    Erster gueltiger Zeitstempel ab dem Zeilenanfang pos (hoechstens
+    PROBE_LINES Zeilen) und ob dabei das Dateiende erreicht wurde.
+    """
+    size = len(data)
+    for _ in range(PROBE_LINES):
+        if pos >= size:
+            return None, True
+        stamp = data[pos:pos + TIMESTAMP_LEN]
+        if _STAMP.fullmatch(stamp):
+            return stamp, False
+        newline = data.find(b"\n", pos)
+        if newline < 0:
+            return None, True
+        pos = newline + 1
+    return None, False
+
+
+# KLASSE _Prober
+class _Prober:
+    """Binaersuche ueber Byte-Offsets; merkt sich alle Sondierungen."""
+
+    def __init__(self, data) -> None:
+        self.data = data
+        self.probes: List[Tuple[int, int]] = []      # (Offset, Zeitstempel in s)
+        self.failed: List[int] = []                  # Offsets ohne Zeitstempel vor dem Dateiende
+
+    def stamp_at(self, pos: int) -> Optional[int]:
+        """Zeitstempel ab pos; None am Dateiende oder wenn keiner gefunden wurde."""
+        start = _line_start(self.data, pos)
+        stamp, at_end = _stamp_from(self.data, start)
+        timestamp = None if stamp is None else parse_timestamp(stamp.decode("ascii"))
+        if timestamp is not None:
+            self.probes.append((start, timestamp))
+        elif not at_end:
+            self.failed.append(start)
+        return timestamp
+
+    def lower_bound(self, target: int) -> int:
+        """
+        Anfang der ersten Zeile mit Zeitstempel >= target (bei sortierter
+        Datei). Nur am Dateiende gilt eine Sondierung ohne Zeitstempel als
+        >= target; sonst steht sie in failed und das Ergebnis ist unbrauchbar.
+        """
+        lo, hi = 0, len(self.data)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            timestamp = self.stamp_at(mid)
+            if timestamp is None or timestamp >= target:
+                hi = mid
+            else:
+                lo = mid + 1
+        return _line_start(self.data, lo)
+
+    def is_ordered(self) -> bool:
+        """Keine Sondierung liegt mehr als MARGIN_SECONDS vor einer frueheren Stelle."""
+        latest = None
+        for _, timestamp in sorted(self.probes):
+            if latest is not None and timestamp < latest - MARGIN_SECONDS:
+                return False
+            latest = timestamp if latest is None else max(latest, timestamp)
+        return True
+# Ende der Klasse _Prober -----------------------------
+
+
+def find_time_slice(data, start: int, end: int) -> Optional[Tuple[int, int]]:
+    """
+    (Anfang, Ende) des Byte-Bereichs, der alle Zeilen mit start <= Zeit < end
+    enthaelt, inklusive Rand; None, wenn die Datei dafuer zu ungeordnet ist
+    oder eine Sondierung keinen Zeitstempel fand.
+    """
+    size = len(data)
+    if size == 0:
+        return 0, 0
+    prober = _Prober(data)
+    for i in range(SAMPLE_COUNT):
+        prober.stamp_at(size * i // SAMPLE_COUNT)
+    # Letzte Zeile: angehaengte aeltere Dateien stehen meist am Ende
+    prober.stamp_at(data.rfind(b"\n", 0, size - 1) + 1)
+
+    lo = prober.lower_bound(start - MARGIN_SECONDS)
+    hi = prober.lower_bound(end + MARGIN_SECONDS)
+    if prober.failed or not prober.is_ordered():
+        return None
+    return lo, max(lo, hi)
+
+
+# KLASSE TimeRangeFilter
+class TimeRangeFilter:
+    """
+    Steht vor der CQ-Paarung (gleiche feed-Methode) und laesst nur Zeilen
+    mit start <= Zeitstempel < end durch.
+    """
+
+    def __init__(self, pairing, start: int, end: int) -> None:
+        self.pairing = pairing
+        self.start = start
+        self.end = end
+
+    def feed(self, line: str, out) -> None:
+        timestamp = parse_timestamp(line[:TIMESTAMP_LEN])
+        if timestamp is not None and self.start <= timestamp < self.end:
+            self.pairing.feed(line, out)
+
+    def describe(self) -> str:
+        return f"{format_timestamp(self.start)} .. {format_timestamp(self.end)}"
+# Ende der Klasse TimeRangeFilter -----------------------------
+
+
+# Beispielaufruf
+if __name__ == "__main__":
+    from sub_compress_data import filter_lines_with_callsign
+
+    navigator = filter_lines_with_callsign(
+        "HB9EVT",
+        "ALL.TXT",
+        "filtered_lines.txt",
+        time_range=("250301", "250401"),
+    )
+    print("Zeilen im Maerz 2025:", len(navigator))
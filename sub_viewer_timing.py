@@ -0,0 +1,160 @@
+"""
+LICENSE
+==========
+This file is part of the project <Check_yr_WSJT_X_log_with_ALL_TXT>
+Licensed under the MIT License - see the LICENSE file for details.
+
+Developed by Pepe HB9EVT
+with support from my lovely auntie A.I. Perplexity, 2025
+
+I would appreciate a short email if you use this software:
+github2025  -at-  pepemail.ch
+"""
+
+"""
+viewer_timing.py
+================
+Misst die Zeit fuer das Neuzeichnen des LinesViewer je Aktion
+(Shift +1/-1 inkrementell, Shift mit vollstaendigem Neuaufbau,
+RR73-Spruenge, erste/letzte 20 Zeilen). Gemessen wird jeweils die
+Aktion plus update_idletasks(), also bis Tk die Aenderung gezeichnet hat.
+
+Anschliessend wird jede Aktion ohne und mit Span-Cache (sub_line_spans)
+gemessen, nach einem Aufwaermdurchlauf abwechselnd in mehreren Runden;
+angegeben sind die Mediane und die Trefferquote.
+
+Aufruf:
+=======
+
+python sub_viewer_timing.py [filtered_lines.txt] [own_callsign]
+"""
+
+
+# IMPORTS
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+from sub_compress_data import LineNavigator
+from sub_line_spans import LineSpanCache
+from sub_lines_viewer import LinesViewer
+
+
+# KONSTANTEN
+REPEAT = 200            # Wiederholungen pro Aktion
+ROUNDS = 4              # Runden im Vergleich ohne/mit Span-Cache
+DUMMY_LINES = 100_000   # Zeilen, falls keine Datei angegeben wird
+
+
+def _dummy_lines(count: int, own_callsign: str) -> List[str]:
+    lines = []
+    for i in range(count):
+        payload = "RR73" if i % 13 == 0 else f"-{i % 20:02d}"
+        lines.append(
+            f"251208_{(i // 60) % 24:02d}{i % 60:02d}00     3.573 Rx FT8    -12  0.4 1030 "
+            f"{own_callsign} DL{i % 500}ABC {payload}\n"
+        )
+    return lines
+
+
+def time_action(viewer: LinesViewer, action: Callable[[], None], repeat: int = REPEAT) -> Dict[str, float]:
+    """Fuehrt action repeat-mal aus; Rueckgabe: Kennzahlen in Millisekunden."""
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        action()
+        viewer.root.update_idletasks()
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    samples.sort()
+    return {
+        "min": samples[0],
+        "median": statistics.median(samples),
+        "p95": samples[int(len(samples) * 0.95) - 1],
+        "max": samples[-1],
+    }
+
+
+def run_timing(viewer: LinesViewer, repeat: int = REPEAT) -> Dict[str, Dict[str, float]]:
+    """Misst alle Aktionen nacheinander; der Viewer startet jeweils in der Mitte."""
+    middle = max(0, viewer.get_total_lines() // 2)
+
+    def full_shift_plus() -> None:
+        # Bisheriger Weg: Block komplett neu aufbauen
+        viewer.show_lines(viewer.current_start_index + 1)
+
+    def full_shift_minus() -> None:
+        viewer.show_lines(viewer.current_start_index - 1)
+
+    actions = {
+        "shift +1 (inkrementell)": viewer.shift_plus_one,
+        "shift -1 (inkrementell)": viewer.shift_minus_one,
+        "shift +1 (neu aufbauen)": full_shift_plus,
+        "shift -1 (neu aufbauen)": full_shift_minus,
+        "next RR73": viewer.jump_next_rr73,
+        "prev RR73": viewer.jump_prev_rr73,
+        "first 20": viewer.show_first_20,
+        "last 20": viewer.show_last_20,
+    }
+
+    results = {}
+    for name, action in actions.items():
+        viewer.show_lines(middle)
+        # Erst einen RR73-Sprung, damit auch Markierungen gezeichnet werden
+        viewer.jump_next_rr73()
+        results[name] = time_action(viewer, action, repeat)
+    return results
+
+
+def compare_span_cache(
+    viewer: LinesViewer, repeat: int = REPEAT, rounds: int = ROUNDS
+) -> Dict[str, Dict[str, float]]:
+    """
+    Median je Aktion ohne Span-Cache (max_entries = 0) und mit Cache;
+    die Trefferquote steht danach in viewer.span_cache.
+
+    Ein Durchlauf vorab waermt Viewer, Navigator und Tk auf. Danach wird
+    in rounds Runden abwechselnd ohne und mit Cache gemessen (die
+    Reihenfolge wechselt jede Runde), damit sich Aufwaermen und
+    Schwankungen nicht nur auf eine Variante auswirken.
+    """
+    run_timing(viewer, max(1, repeat // rounds))
+
+    caches = {"ohne": LineSpanCache(max_entries=0), "mit": LineSpanCache()}
+    medians: Dict[str, Dict[str, List[float]]] = {variant: {} for variant in caches}
+    for round_no in range(rounds):
+        order = list(caches) if round_no % 2 == 0 else list(reversed(caches))
+        for variant in order:
+            viewer.span_cache = caches[variant]
+            for name, stats in run_timing(viewer, max(1, repeat // rounds)).items():
+                medians[variant].setdefault(name, []).append(stats["median"])
+    viewer.span_cache = caches["mit"]
+    return {
+        name: {variant: statistics.median(medians[variant][name]) for variant in caches}
+        for name in medians["ohne"]
+    }
+
+
+# Beispielaufruf
+if __name__ == "__main__":
+    own_callsign = sys.argv[2] if len(sys.argv) > 2 else "HB9EVT"
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], "r", encoding="utf-8", errors="replace") as f:
+            lines = f.readlines()
+    else:
+        lines = _dummy_lines(DUMMY_LINES, own_callsign)
+
+    viewer = LinesViewer(LineNavigator(lines, own_callsign=own_callsign), own_callsign)
+    print(f"{'Aktion':<26} {'min':>8} {'median':>8} {'p95':>8} {'max':>8}  [ms]")
+    for name, stats in run_timing(viewer).items():
+        print(
+            f"{name:<26} {stats['min']:8.3f} {stats['median']:8.3f} "
+            f"{stats['p95']:8.3f} {stats['max']:8.3f}"
+        )
+
+    print()
+    print(f"{'Aktion (Median)':<26} {'ohne':>8} {'mit':>8}  [ms] Span-Cache")
+    for name, stats in compare_span_cache(viewer).items():
+        print(f"{name:<26} {stats['ohne']:8.3f} {stats['mit']:8.3f}")
+    print("Span-Cache:", viewer.span_cache.describe())
+    viewer.root.destroy()